@@ -33,3 +33,13 @@ Status = Literal[
     "A",  # Available players (FA + W)
     "ALL",  # All players
 ]
+
+Mode = Literal[
+    "draft",  # Players taken by teams, for the draft
+    "season",  # Available players, for the season
+]
+
+WaiverObjective = Literal[
+    "value",  # Weighted category totals
+    "win",  # Probability of winning the matchup
+]
@@ -6,19 +6,43 @@ $ streamlit run path/to/web.py [YEAR]
 
 import argparse
 import pickle
-from enum import StrEnum
 from pathlib import Path
 from typing import (
     Any,
-    Literal,
+    Callable,
+    Optional,
     get_args,
 )
 
-import pandas as pd
 import streamlit as st
 
-from faha.league import League
+from faha._types import (
+    Mode,
+    Status,
+    Weights,
+)
+from faha.board import DraftBoard
+from faha.daily import (
+    WINDOWS,
+    DailyStatStore,
+    daily_dir,
+)
+from faha.league import League, shared_player_cache
 from faha.oauth.client import get_client
+from faha.search import best_match
+from faha.tables import (
+    Data,
+    Positions,
+    build_player_frame,
+    split_by_position,
+    top_by_position,
+)
+from faha.tracker import (
+    DEFAULT_POLL_INTERVAL,
+    DraftPoller,
+    DraftTracker,
+    apply_picks,
+)
 from faha.value import (
     calculate_player_values,
     goalie_player_stat_values,
@@ -27,21 +51,8 @@ from faha.value import (
 from faha.weights import STAT_NAMES, stat_weights_from_disk
 from faha.yahoo import Yahoo
 
-
-class Positions(StrEnum):
-    """Enumeration of player positions."""
-
-    CENTER = "C"
-    WINGER = "W"
-    DEFENSEMAN = "D"
-    GOALIE = "G"
-
-
-Mode = Literal[
-    "draft",
-    "season",
-]
-Data = dict[Positions, pd.DataFrame]
+TABLE_LENGTH = 20
+SEARCH_LENGTH = 5
 
 
 def configure_page() -> None:
@@ -73,44 +84,75 @@ def save_data(data: Data, data_file: Path) -> None:
         pickle.dump(data, file)
 
 
-def get_data_from_yahoo(year: int, mode: Mode) -> Data:
-    """Create data from a year."""
+def get_data_from_yahoo(
+    year: int,
+    mode: Mode,
+    weights: Weights,
+    on_page: Optional[Callable[[dict, int], None]] = None,
+) -> Data:
+    """Create data from a year.
+
+    The players are valued page by page as they arrive from Yahoo, and `on_page`
+    is called with the players received so far and the number of pages.
+    """
     oauth = get_client()
     yahoo_agent = Yahoo(oauth)
-    lg = League(year, yahoo_agent)
+    lg = League(year, yahoo_agent, player_cache=shared_player_cache())
+    status: Status = "T" if mode == "draft" else "A"
+    taken_val: dict = {}
+    for num_pages, page in enumerate(lg.iter_players(status, weights=weights), 1):
+        taken_val |= page
+        if on_page is not None:
+            on_page(taken_val, num_pages)
+    return split_by_position(build_player_frame(taken_val))
+
+
+def get_data_from_window(window: int, weights: Weights) -> Data:
+    """Create data from the stats over the last days recorded on disk."""
+    players = DailyStatStore(daily_dir()).window_players(window)
+    valued = calculate_player_values(players, weights)
+    return split_by_position(build_player_frame(valued))
+
+
+def load_data(
+    year: int, mode: Mode, weights: Weights, window: Optional[int] = None
+) -> Data:
+    """Load the data, showing the top players received while fetching from Yahoo.
+
+    With a window, the players are valued on their stats over that many recent
+    days from the daily stats store instead, without any Yahoo requests.
+    """
+    if window is not None:
+        return get_data_from_window(window, weights)
+    data_file = Path(f"src/faha/data/{year}.pkl")
+    if mode == "draft" and data_file.exists():
+        return get_saved_data(data_file)
+    placeholder = st.empty()
+
+    def show_progress(players: dict, num_pages: int) -> None:
+        with placeholder.container():
+            st.caption(
+                f"Loading players from Yahoo: {len(players)} players "
+                f"from {num_pages} pages"
+            )
+            print_position_tables(top_by_position(players, TABLE_LENGTH), weights)
+
+    data = get_data_from_yahoo(year, mode, weights, show_progress)
+    placeholder.empty()
     if mode == "draft":
-        taken = lg.taken_players()
-    else:
-        taken = lg.available_players()
-    weights = stat_weights_from_disk(year)
-    taken_val = calculate_player_values(taken, weights)
-    data_in_frame = pd.DataFrame(taken_val).transpose()
-    return {
-        pos: data_in_frame[is_position(pos.value, data_in_frame)].sort_values(
-            by="Value", ascending=False
-        )
-        for pos in Positions
-    }
+        save_data(data, data_file)
+    return data
 
 
-def is_position(position: str, dataframe: pd.DataFrame) -> list[bool]:
-    """List booleans matching a particular position."""
-    if position == "W":
-        return [
-            "LW" in positions or "RW" in positions
-            for positions in dataframe["Positions"]
-        ]
-    return [position in positions for positions in dataframe["Positions"]]
+def state_is_initialized() -> bool:
+    """Return whether the streamlit state holds the draft board."""
+    return "board" in st.session_state
 
 
 def initialize_state(data: Data) -> None:
     """Initialize the streamlit state."""
-    if Positions.CENTER not in st.session_state:
-        for position in Positions:
-            st.session_state[position] = data[position]
-
-    if "deleted_players" not in st.session_state:
-        st.session_state.deleted_players = []
+    if not state_is_initialized():
+        st.session_state.board = DraftBoard.from_data(data)
 
     if "player_to_delete" not in st.session_state:
         st.session_state.player_to_delete = ""
@@ -122,58 +164,48 @@ def initialize_state(data: Data) -> None:
         st.session_state.keepers_are_deleted = False
 
 
-def delete_player_in_all_tables(player: pd.Series) -> None:
+def delete_player_in_all_tables(player_id: str) -> None:
     """Delete a player in all relevant tables."""
-    st.session_state.deleted_players.append(player)
-    for position in Positions:
-        if _player_plays_position(position.value, player["Positions"]):
-            _delete_player_in_table(position, player["Name"])
+    player = st.session_state.board.delete(player_id)
     st.toast(f"Deleted {player['Name']}", icon=":material/check:")
 
 
-def _player_plays_position(position: str, positions: list[str]) -> bool:
-    if position == Positions.WINGER:
-        return "LW" in positions or "RW" in positions
-    return position in positions
-
-
-def _delete_player_in_table(position: Positions, name: str) -> None:
-    st.session_state[position] = st.session_state[position][
-        st.session_state[position]["Name"] != name
-    ]
+def find_player_by_entry(name: str) -> Optional[str]:
+    """Return the ID of the remaining player that an entered name resolves to.
+
+    Names may be misspelt, missing accents or only the start of a name. When
+    several players match as well, the closest names are suggested instead.
+    """
+    board = st.session_state.board
+    matches = board.search(name, SEARCH_LENGTH)
+    match = best_match(matches)
+    if match is not None:
+        return match.player_id
+    if matches:
+        names = ", ".join(board.players[match.player_id]["Name"] for match in matches)
+        st.toast(f"Did you mean: {names}?", icon=":material/help:")
+    else:
+        _not_found_message(name)
+    return None
 
 
 def value_player_by_entry(name: str) -> None:
     """Print the value of a player."""
-    name = name.strip()
-    if name not in _all_names():
-        _not_found_message(name)
+    player_id = find_player_by_entry(name)
+    if player_id is None:
         return
-    for position in Positions:
-        names = st.session_state[position]["Name"]
-        if name in names.tolist():
-            player = st.session_state[position].loc[name]
-            player_value = player["Value"]
-            st.toast(f"{player['Name']}: {player_value:2.2f}", icon=":material/check:")
-            st.session_state.player_to_value = ""
-            return
+    player = st.session_state.board.players[player_id]
+    player_value = player["Value"]
+    st.toast(f"{player['Name']}: {player_value:2.2f}", icon=":material/check:")
+    st.session_state.player_to_value = ""
 
 
 def delete_player_by_entry(name: str) -> None:
     """Delete a player by entering a name."""
-    name = name.strip()
-    if name not in _all_names():
-        _not_found_message(name)
+    player_id = find_player_by_entry(name)
+    if player_id is None:
         return
-    name_in_table = False
-    iter_positions = iter(Positions)
-    while not name_in_table:
-        position = next(iter_positions)
-        names = st.session_state[position]["Name"]
-        name_in_table = name in names.tolist()
-        if name_in_table:
-            player = st.session_state[position].loc[name]
-            delete_player_in_all_tables(player)
+    delete_player_in_all_tables(player_id)
     st.session_state.player_to_delete = ""
 
 
@@ -181,30 +213,10 @@ def _not_found_message(name: str) -> None:
     st.toast(f"No player found with the name: {name}", icon=":material/cancel:")
 
 
-def _all_names() -> set:
-    names: set = set()
-    for position in Positions:
-        names = names.union(set(st.session_state[position]["Name"].tolist()))
-    return names
-
-
 def undo_delete() -> None:
     """Undo the deletion of a player."""
-    if not st.session_state.deleted_players:
-        return
-    last_deleted = st.session_state.deleted_players.pop()
-    undid_deletion = False
-    for position in Positions:
-        if _player_plays_position(position.value, last_deleted["Positions"]):
-            st.session_state[position] = pd.concat(
-                [st.session_state[position], pd.DataFrame([last_deleted])],
-                ignore_index=True,
-            )
-            st.session_state[position] = st.session_state[position].sort_values(
-                by="Value", ascending=False
-            )
-            undid_deletion = True
-    if undid_deletion:
+    last_deleted = st.session_state.board.undo()
+    if last_deleted is not None:
         st.toast(f"Undid deletion of {last_deleted['Name']}", icon=":material/check:")
 
 
@@ -220,28 +232,63 @@ def update_delete_inputs() -> None:
     st.session_state.delete_input = ""
 
 
-def print_position_tables() -> None:
+def print_position_tables(
+    tables: dict[Positions, list[dict]], weights: Weights
+) -> None:
     """Print the player position tables."""
     cols = st.columns([1, 1, 1, 1], gap="medium")
     for index, position in enumerate(Positions):
         print_table(
             cols[index],
-            st.session_state[position],
+            tables[position],
             f"## {position.name.capitalize()}",  # type: ignore
+            weights,
+        )
+
+
+def current_tables() -> dict[Positions, list[dict]]:
+    """Return the top players at each position remaining on the board."""
+    return {
+        position: st.session_state.board.top(TABLE_LENGTH, position)
+        for position in Positions
+    }
+
+
+def replacement_settings(year: int) -> tuple[dict[str, int], int]:
+    """Return the league roster slots and number of managers."""
+    if "replacement_settings" not in st.session_state:
+        league = League(year, Yahoo(get_client()))
+        st.session_state.replacement_settings = (
+            league.roster_slots,
+            league.num_managers,
         )
+    return st.session_state.replacement_settings
+
 
+def replacement_tables(year: int) -> dict[Positions, list[dict]]:
+    """Return the top remaining players at each position by value over replacement.
 
-def print_table(cols, data, title: str) -> None:
-    """Print a position table."""
+    Replacement levels follow the players deleted from the board.
+    """
+    board = st.session_state.board
+    if board.valuation is None:
+        board.track_replacement(*replacement_settings(year))
+    return {
+        position: board.top_over_replacement(TABLE_LENGTH, position)
+        for position in Positions
+    }
+
+
+def print_table(cols, players: list[dict], title: str, weights: Weights) -> None:
+    """Print a position table, showing the best stat values under the weights."""
     cols.write(title)
     with cols:
-        for _, row in data.head(20).iterrows():
+        for row in players:
             games_played = (
                 row["Season Stats"]["Games Started"]
                 if row["Positions"] == ["G"]
                 else row["Season Stats"]["Games Played"]
             )
-            weights = stat_weights_from_disk(2023)
             if row["Positions"] == ["G"]:
                 stats = goalie_player_stat_values(
                     row["Season Stats"], weights, sort=True
@@ -256,7 +303,7 @@ def print_table(cols, data, title: str) -> None:
                 ]
             )
             st.text(
-                f"{row['Value']:2.2f}  {row["Name"]} [{row["NHL Team"]}]\n"
+                f"{row['Value']:2.2f}  {row['Name']} [{row['NHL Team']}]\n"
                 f"{', '.join(row['Positions']):<8} GP: {games_played}\n"
                 f"{stat_string}"
             )
@@ -305,7 +352,7 @@ def create_undo_button(undo_delete_button_column) -> None:
         st.button(
             "Undo Delete",
             on_click=undo_delete,
-            disabled=len(st.session_state.deleted_players) == 0,
+            disabled=not st.session_state.board.deleted,
         )
 
 
@@ -317,10 +364,38 @@ def delete_keepers(year: int):
         st.session_state.keepers_are_deleted = True
 
 
-def _mode_type_validator(value: Any) -> bool:
+def draft_sync_section(year: int) -> None:
+    """Create the toggle that syncs draft picks from Yahoo."""
+    if st.toggle("Sync picks from Yahoo", key="sync_picks"):
+        if "poller" not in st.session_state:
+            league = League(year, Yahoo(get_client()))
+            st.session_state.poller = DraftPoller(DraftTracker(league))
+            st.session_state.poller.start()
+        sync_draft_picks()
+    elif "poller" in st.session_state:
+        st.session_state.poller.stop()
+        del st.session_state.poller
+
+
+@st.fragment(run_every=DEFAULT_POLL_INTERVAL / 2)
+def sync_draft_picks() -> None:
+    """Apply the picks received from Yahoo since the last refresh."""
+    poller = st.session_state.get("poller")
+    if poller is None:
+        return
+    if poller.error is not None:
+        st.caption(f"Draft sync failed, retrying: {poller.error}")
+    deleted = apply_picks(st.session_state.board, poller.drain())
+    if deleted:
+        names = ", ".join(player["Name"] for player in deleted)
+        st.toast(f"Drafted {names}", icon=":material/sync:")
+        st.rerun()
+
+
+def _mode_type_validator(value: Any) -> Mode:
     if value in get_args(Mode):
-        return True
-    return False
+        return value
+    raise argparse.ArgumentTypeError(f"Unknown mode: {value}")
 
 
 def main() -> None:
@@ -328,25 +403,23 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Create draft helper web UI")
     parser.add_argument("year", type=int)
     parser.add_argument("-m", "--mode", type=_mode_type_validator, default="season")
+    parser.add_argument("-w", "--window", type=int, choices=WINDOWS, default=None)
     args = parser.parse_args()
     year = args.year
     mode = args.mode
-    if mode == "draft":
-        data_file = Path(f"src/faha/data/{year}.pkl")
-        if data_file.exists():
-            data = get_saved_data(data_file)
-        else:
-            data = get_data_from_yahoo(year, mode)
-            save_data(data, data_file)
-    else:
-        data = get_data_from_yahoo(year, mode)
+    weights = stat_weights_from_disk(year)
     configure_page()
     configure_header()
-    initialize_state(data)
+    if not state_is_initialized():
+        initialize_state(load_data(year, mode, weights, args.window))
     if mode == "draft":
         delete_keepers(year)
+        draft_sync_section(year)
     text_inputs_section()
-    print_position_tables()
+    if st.toggle("Value over replacement", key="use_replacement"):
+        print_position_tables(replacement_tables(year), weights)
+    else:
+        print_position_tables(current_tables(), weights)
 
 
 if __name__ == "__main__":
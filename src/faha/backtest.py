@@ -0,0 +1,330 @@
+"""Backtests of stat weight schemes against the stats that followed.
+
+Execute with:
+$ backtest_weights --top-teams 1 2 3 4 --plus-minus 0 0.2 0.33 0.5 --workers 8
+$ backtest_weights --weeks 4 --top-teams 1 2 3 4
+"""
+
+import argparse
+import datetime
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from faha.daily import DailyStatStore, daily_dir
+from faha.history import HistoryStore, history_file
+from faha.players import GoaliePlayer, OffensePlayer
+from faha.pool import (
+    CATEGORIES,
+    SAVE_PERCENTAGE,
+    StatPool,
+)
+from faha.projection import aligned_rows, counting_totals
+from faha.sensitivity import WeightGrid, rank_rows
+
+DEFAULT_NUM_TEAMS = 12
+SKATERS_PER_TEAM = 12
+GOALIES_PER_TEAM = 2
+DEFAULT_MIN_GAMES = 10
+DEFAULT_CHUNK_SIZE = 64
+
+# folds of the worker processes, sent once when each worker starts
+_FOLDS: list["Fold"] = []
+
+
+@dataclass
+class Fold:
+    """Players valued on one period and judged on the period after it.
+
+    Attributes:
+        label: Name of the fold, such as `2022-2023`
+        player_ids: IDs of the players with enough games in both periods
+        design: Design matrix of the players over the first period
+        realized: Value of the players over the second period
+        team_stats: Team stats of the first period, the weights are calculated from
+    """
+
+    label: str
+    player_ids: list[str]
+    design: np.ndarray
+    realized: np.ndarray
+    team_stats: dict
+
+
+@dataclass
+class Backtest:
+    """Rank correlation of the values of every scheme with realized values.
+
+    Attributes:
+        variants: Choices of each scheme, as in `WeightGrid.variants`
+        folds: Labels of the folds
+        spearman: Rank correlation of each scheme's values (rows) with the
+            realized values of each fold (columns)
+    """
+
+    variants: list[dict[str, float]]
+    folds: list[str]
+    spearman: np.ndarray
+
+    @property
+    def mean_spearman(self) -> np.ndarray:
+        """Return the rank correlation of each scheme averaged over the folds."""
+        return self.spearman.mean(axis=1)
+
+    def best(self, count: int = 10) -> list[int]:
+        """Return the rows of the schemes with the highest mean correlation."""
+        return list(np.argsort(-self.mean_spearman, kind="stable")[:count])
+
+
+def pool_team_stats(
+    pool: StatPool,
+    num_teams: int = DEFAULT_NUM_TEAMS,
+    skaters_per_team: int = SKATERS_PER_TEAM,
+    goalies_per_team: int = GOALIES_PER_TEAM,
+) -> dict:
+    """Return the stats of teams made up of the most used players of a pool.
+
+    Team stats are not stored for past seasons, so the skaters and goalies with
+    the most games are dealt in turn to `num_teams` teams, standing in for the
+    rostered players of a league. The result is shaped like
+    `all_manager_team_stats`, with save percentage weighted by games started.
+    """
+    counts = counting_totals(pool)
+    stats = np.zeros((num_teams, len(CATEGORIES)))
+    goalie_games: np.ndarray = np.zeros(num_teams)
+    for is_goalie, per_team in ((False, skaters_per_team), (True, goalies_per_team)):
+        rows = np.flatnonzero(pool.is_goalie == is_goalie)
+        rows = rows[np.argsort(-pool.games[rows], kind="stable")][
+            : num_teams * per_team
+        ]
+        teams = np.arange(len(rows)) % num_teams
+        np.add.at(stats, teams, counts[rows])
+        if is_goalie:
+            goalie_games = np.bincount(
+                teams, weights=pool.games[rows], minlength=num_teams
+            )
+    stats[:, SAVE_PERCENTAGE] = np.divide(
+        stats[:, SAVE_PERCENTAGE],
+        goalie_games,
+        out=np.zeros(num_teams),
+        where=goalie_games > 0,
+    )
+    return {
+        category: stats[:, column].tolist()
+        for column, category in enumerate(CATEGORIES)
+    }
+
+
+def scheme_weights(grid: WeightGrid, team_stats: dict) -> np.ndarray:
+    """Return the weight matrix of a grid, without weight on unrecorded categories.
+
+    Over a few weeks no team may have a shutout, which would otherwise give the
+    category an infinite weight.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weights = grid.weight_matrix(team_stats)
+    return np.where(np.isfinite(weights), weights, 0.0)
+
+
+def period_fold(
+    label: str,
+    first: StatPool,
+    second: StatPool,
+    min_games: float = DEFAULT_MIN_GAMES,
+    num_teams: int = DEFAULT_NUM_TEAMS,
+) -> Fold:
+    """Return the fold valuing players on one period and judging them on another.
+
+    Realized values use the default weights of `calculate_stat_weights` on the
+    team stats of the second period, so every scheme is judged against the
+    same values.
+    """
+    rows, second_rows = aligned_rows(first, second)
+    played = (first.games[rows] >= min_games) & (second.games[second_rows] >= min_games)
+    rows, second_rows = rows[played], second_rows[played]
+    reference = scheme_weights(WeightGrid(), pool_team_stats(second, num_teams))[0]
+    return Fold(
+        label=label,
+        player_ids=[first.player_ids[row] for row in rows],
+        design=first.design_matrix()[rows],
+        realized=second.design_matrix()[second_rows] @ reference,
+        team_stats=pool_team_stats(first, num_teams),
+    )
+
+
+def season_folds(
+    seasons: dict[int, dict[str, OffensePlayer | GoaliePlayer]],
+    min_games: float = DEFAULT_MIN_GAMES,
+    num_teams: int = DEFAULT_NUM_TEAMS,
+) -> list[Fold]:
+    """Return a fold for every season followed by a stored season.
+
+    The pool of each season is built once, whether it is valued or judged.
+    """
+    pools = {
+        season: StatPool.from_players(players.values())
+        for season, players in seasons.items()
+    }
+    return [
+        period_fold(
+            f"{season}-{season + 1}",
+            pool,
+            pools[season + 1],
+            min_games,
+            num_teams,
+        )
+        for season, pool in pools.items()
+        if season + 1 in pools
+    ]
+
+
+def weekly_fold(
+    store: DailyStatStore,
+    weeks: int,
+    min_games: float = DEFAULT_MIN_GAMES,
+    num_teams: int = DEFAULT_NUM_TEAMS,
+) -> Fold:
+    """Return the fold valuing players on the first weeks of the recorded days.
+
+    The players are judged on the rest of the recorded days.
+    """
+    days = store.days()
+    if not days:
+        raise ValueError(f"No daily stats recorded in {store.directory}")
+    split = days[0] + datetime.timedelta(weeks=weeks)
+    if split > days[-1]:
+        raise ValueError(f"Fewer than {weeks} weeks of daily stats recorded")
+    return period_fold(
+        f"weeks 1-{weeks}",
+        store.period_pool(days[0], split - datetime.timedelta(days=1)),
+        store.period_pool(split, days[-1]),
+        min_games,
+        num_teams,
+    )
+
+
+def backtest(
+    folds: list[Fold],
+    grid: WeightGrid,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Backtest:
+    """Return how well the values of every scheme of a grid rank realized values.
+
+    The schemes of each fold are valued at once as a matrix product, in chunks
+    of `chunk_size` schemes spread over a process pool. The stat matrices of the
+    folds are built once and sent to each worker when it starts, rather than
+    with every chunk.
+
+    Args:
+        folds: Periods to value the players on and judge them on
+        grid: Choices of the weight schemes
+        workers: Number of processes, or the number of CPUs if None
+        chunk_size: Number of schemes scored together
+    """
+    if not folds:
+        raise ValueError("No folds to backtest")
+    variants = grid.variants()
+    fold_weights = [scheme_weights(grid, fold.team_stats) for fold in folds]
+    tasks = [
+        (index, start, weights[start:][:chunk_size])
+        for index, weights in enumerate(fold_weights)
+        for start in range(0, len(variants), chunk_size)
+    ]
+    workers = min(workers or os.cpu_count() or 1, len(tasks)) or 1
+    if workers == 1:
+        scores = [_score(folds[index], weights) for index, _, weights in tasks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_load_folds, initargs=(folds,)
+        ) as executor:
+            scores = list(
+                executor.map(
+                    _score_chunk,
+                    [index for index, _, _ in tasks],
+                    [weights for _, _, weights in tasks],
+                )
+            )
+    spearman = np.zeros((len(variants), len(folds)))
+    for (index, start, _), chunk in zip(tasks, scores):
+        spearman[start : start + len(chunk), index] = chunk  # noqa: E203
+    return Backtest(variants, [fold.label for fold in folds], spearman)
+
+
+def _load_folds(folds: list[Fold]) -> None:
+    _FOLDS[:] = folds
+
+
+def _score_chunk(index: int, weights: np.ndarray) -> np.ndarray:
+    return _score(_FOLDS[index], weights)
+
+
+def _score(fold: Fold, weights: np.ndarray) -> np.ndarray:
+    """Return the rank correlation of each weight row's values with realized."""
+    num_players = len(fold.realized)
+    ranks = rank_rows(weights @ fold.design.T)
+    realized_ranks = rank_rows(fold.realized[np.newaxis])
+    squared_differences = ((ranks - realized_ranks) ** 2).sum(axis=1)
+    return 1 - 6 * squared_differences / max(num_players * (num_players**2 - 1), 1)
+
+
+def main() -> None:
+    """Backtest a grid of weight schemes and write the best schemes."""
+    defaults = WeightGrid()
+    parser = argparse.ArgumentParser(description="Backtest stat weight schemes")
+    parser.add_argument("--top-teams", type=int, nargs="+", default=defaults.top_teams)
+    parser.add_argument(
+        "--plus-minus", type=float, nargs="+", default=defaults.plus_minus_weight
+    )
+    parser.add_argument(
+        "--shutout-divisor", type=float, nargs="+", default=defaults.shutout_divisor
+    )
+    parser.add_argument(
+        "--save-percentage-scale",
+        type=float,
+        nargs="+",
+        default=defaults.save_percentage_scale,
+    )
+    parser.add_argument(
+        "--weeks", type=int, default=None, help="judge the first weeks of daily stats"
+    )
+    parser.add_argument("--history", type=Path, default=None)
+    parser.add_argument("--directory", type=Path, default=None)
+    parser.add_argument("--teams", type=int, default=DEFAULT_NUM_TEAMS)
+    parser.add_argument("--min-games", type=float, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+    grid = WeightGrid(
+        top_teams=args.top_teams,
+        plus_minus_weight=args.plus_minus,
+        shutout_divisor=args.shutout_divisor,
+        save_percentage_scale=args.save_percentage_scale,
+    )
+    if args.weeks is not None:
+        # about three games a week, so ask for a game a week in each period
+        min_games = args.weeks if args.min_games is None else args.min_games
+        store = DailyStatStore(args.directory or daily_dir())
+        folds = [weekly_fold(store, args.weeks, min_games, args.teams)]
+    else:
+        min_games = DEFAULT_MIN_GAMES if args.min_games is None else args.min_games
+        seasons = HistoryStore(args.history or history_file()).seasons()
+        folds = season_folds(seasons, min_games, args.teams)
+    result = backtest(folds, grid, workers=args.workers)
+    sys.stdout.write(
+        f"{len(result.variants)} schemes over folds {', '.join(result.folds)}\n"
+    )
+    for row in result.best(args.top):
+        choices = ", ".join(
+            f"{name}={value:g}" for name, value in result.variants[row].items()
+        )
+        sys.stdout.write(f"  {result.mean_spearman[row]:6.3f}  {choices}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""Load tests of the Yahoo client against the mock Yahoo server.
+
+Execute with:
+$ run_load_test --workload pull --operations 50 --concurrency 8 --rate-limit 20
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import (
+    asdict,
+    dataclass,
+    field,
+)
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Literal,
+    get_args,
+)
+
+from faha._types import Weights
+from faha.benchmark.fixtures import OfflineLeague, offline_league
+from faha.benchmark.mock_server import (
+    MockSettings,
+    MockYahooServer,
+    add_settings_arguments,
+    serve,
+    settings_from_arguments,
+)
+from faha.tables import build_player_frame, split_by_position
+from faha.utils import json_io
+from faha.utils.lazy import lazy_import
+from faha.value import calculate_player_values
+from faha.weights import all_manager_team_stats, calculate_stat_weights
+from faha.yahoo import Yahoo
+
+if TYPE_CHECKING:
+    import requests
+else:
+    requests = lazy_import("requests")
+
+Workload = Literal[
+    "pull",  # all players, team stats and rosters of a league
+    "session",  # the app's start-up: taken players into position tables
+]
+
+
+class LocalSession:
+    """Stand-in for the OAuth client exposing an unauthenticated session."""
+
+    def __init__(self) -> None:
+        """Initialize class."""
+        self.session = requests.Session()
+
+
+@dataclass
+class Measurements:
+    """Thread safe collection of latencies and failures."""
+
+    request_latencies: list[float] = field(default_factory=list)
+    operation_latencies: list[float] = field(default_factory=list)
+    failures: dict[str, int] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add_request(self, latency: float) -> None:
+        """Add the latency of a successful request."""
+        with self.lock:
+            self.request_latencies.append(latency)
+
+    def add_operation(self, latency: float) -> None:
+        """Add the latency of a successful operation."""
+        with self.lock:
+            self.operation_latencies.append(latency)
+
+    def add_failure(self, error: Exception) -> None:
+        """Count a failed request by its error."""
+        kind = f"{type(error).__name__}: {str(error)[:60]}"
+        with self.lock:
+            self.failures[kind] = self.failures.get(kind, 0) + 1
+
+
+class TimedYahoo(Yahoo):
+    """Yahoo agent that measures the latency and failures of its requests."""
+
+    def __init__(self, oauth, endpoint: str, measurements: Measurements) -> None:
+        """Initialize class."""
+        super().__init__(oauth, endpoint)
+        self.measurements = measurements
+
+    def request(self, uri: str) -> dict:
+        """Make a request and measure it."""
+        start = time.perf_counter()
+        try:
+            response = super().request(uri)
+        except (RuntimeError, requests.RequestException) as error:
+            self.measurements.add_failure(error)
+            raise
+        self.measurements.add_request(time.perf_counter() - start)
+        return response
+
+
+def league_pull(league: OfflineLeague, weights: Weights) -> None:
+    """Pull the players, team stats and rosters of a league."""
+    del weights
+    league.taken_players()
+    league.available_players()
+    league.team_stats(league.all_manager_ids)
+    league.team_roster(league.all_manager_ids)
+
+
+def app_session(league: OfflineLeague, weights: Weights) -> None:
+    """Build the app's position tables from the taken players."""
+    valued = calculate_player_values(league.taken_players(), weights)
+    split_by_position(build_player_frame(valued))
+
+
+WORKLOADS: dict[str, Callable[[OfflineLeague, Weights], None]] = {
+    "pull": league_pull,
+    "session": app_session,
+}
+
+
+def run(
+    server: MockYahooServer,
+    workload: Workload = "pull",
+    operations: int = 20,
+    concurrency: int = 4,
+) -> dict:
+    """Run concurrent operations against a mock server and summarize them."""
+    setup_agent = Yahoo(LocalSession(), server.endpoint)
+    setup_league = offline_league(setup_agent, server.league.league_id)
+    weights = calculate_stat_weights(all_manager_team_stats(setup_league))
+    measurements = Measurements()
+    operation = WORKLOADS[workload]
+
+    def run_operation(_: int) -> None:
+        yahoo_agent = TimedYahoo(LocalSession(), server.endpoint, measurements)
+        league = OfflineLeague(
+            setup_league.season,
+            yahoo_agent,
+            info=setup_league.info,
+            settings=setup_league.settings,
+            offline_league_id=setup_league.league_id,
+        )
+        start = time.perf_counter()
+        try:
+            operation(league, weights)
+        except (RuntimeError, requests.RequestException):
+            return
+        measurements.add_operation(time.perf_counter() - start)
+
+    counts_before = dict(server.counts)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(run_operation, range(operations)))
+    duration = time.perf_counter() - start
+    num_requests = len(measurements.request_latencies) + sum(
+        measurements.failures.values()
+    )
+    return {
+        "workload": workload,
+        "operations": operations,
+        "concurrency": concurrency,
+        "settings": asdict(server.settings),
+        "duration": duration,
+        "succeeded": len(measurements.operation_latencies),
+        "failed": operations - len(measurements.operation_latencies),
+        "operations_per_second": len(measurements.operation_latencies) / duration,
+        "requests_per_second": num_requests / duration,
+        "operation_latency": summarize(measurements.operation_latencies),
+        "request_latency": summarize(measurements.request_latencies),
+        "request_failures": measurements.failures,
+        "server_counts": {
+            name: count - counts_before[name] for name, count in server.counts.items()
+        },
+    }
+
+
+def summarize(latencies: list[float]) -> dict[str, float]:
+    """Summarize latencies with their percentiles in seconds."""
+    if not latencies:
+        return {}
+    if len(latencies) == 1:
+        percentiles = latencies * 99
+    else:
+        percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "mean": statistics.mean(latencies),
+        "p50": percentiles[49],
+        "p90": percentiles[89],
+        "p99": percentiles[98],
+        "max": max(latencies),
+    }
+
+
+def _format_report(report: dict) -> str:
+    lines = [
+        f"{report['workload']}: {report['succeeded']}/{report['operations']} "
+        f"succeeded in {report['duration']:.2f} s "
+        f"({report['operations_per_second']:.2f} op/s, "
+        f"{report['requests_per_second']:.1f} req/s)"
+    ]
+    for name in ("operation_latency", "request_latency"):
+        latency = report[name]
+        if latency:
+            lines.append(
+                f"  {name}: p50 {latency['p50']:.3f} s, p90 {latency['p90']:.3f} s,"
+                f" p99 {latency['p99']:.3f} s, max {latency['max']:.3f} s"
+            )
+    lines += [
+        f"  {count} x {failure}"
+        for failure, count in report["request_failures"].items()
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _workload_type_validator(value: str) -> str:
+    if value not in get_args(Workload):
+        raise argparse.ArgumentTypeError(f"Unknown workload: {value}")
+    return value
+
+
+def main() -> None:
+    """Run a load test from the command line."""
+    parser = argparse.ArgumentParser(description="Load test the Yahoo client")
+    parser.add_argument("--workload", type=_workload_type_validator, default="pull")
+    parser.add_argument("--operations", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--output", type=Path, help="file to write the report to")
+    add_settings_arguments(parser)
+    args = parser.parse_args()
+    settings: MockSettings = settings_from_arguments(args)
+    with serve(settings) as server:
+        report = run(server, args.workload, args.operations, args.concurrency)
+    if args.output is not None:
+        json_io.write(args.output, report)
+    sys.stdout.write(_format_report(report))
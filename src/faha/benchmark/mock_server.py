@@ -0,0 +1,189 @@
+"""Local HTTP server imitating the Yahoo Fantasy API.
+
+Execute with:
+$ run_mock_yahoo --pool-size 2000 --latency 0.2 --rate-limit 5
+"""
+
+import argparse
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ContextManager
+from urllib.parse import unquote, urlsplit
+
+from faha.benchmark.fixtures import SyntheticLeague
+from faha.utils import serving
+
+API_PREFIX = "/fantasy/v2/"
+THROTTLED_STATUS = 999  # Yahoo's status code for throttled requests
+
+
+@dataclass
+class MockSettings:
+    """Behaviour of the mock Yahoo server.
+
+    Attributes:
+        pool_size: Number of players in the synthetic league
+        num_teams: Number of teams in the synthetic league
+        latency: Base latency of every response in seconds
+        jitter: Maximum extra random latency in seconds
+        error_rate: Fraction of requests answered with a server error
+        rate_limit: Sustained requests per second, or 0 for no limit
+        burst: Number of requests allowed in a burst above the rate limit
+        seed: Seed of the synthetic league and the random behaviour
+    """
+
+    pool_size: int = 1000
+    num_teams: int = 12
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    rate_limit: float = 0.0
+    burst: int = 10
+    seed: int = 0
+
+
+@dataclass
+class TokenBucket:
+    """Thread safe token bucket rate limiter."""
+
+    rate: float
+    capacity: int
+    tokens: float = field(init=False)
+    updated: float = field(init=False, default_factory=time.monotonic)
+    lock: threading.Lock = field(init=False, default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        """Start with a full bucket."""
+        self.tokens = self.capacity
+
+    def acquire(self) -> bool:
+        """Take a token if one is available."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class MockYahooServer(ThreadingHTTPServer):
+    """HTTP server answering Yahoo Fantasy API requests from a synthetic league."""
+
+    daemon_threads = True
+
+    def __init__(self, settings: MockSettings, port: int = 0) -> None:
+        """Initialize class."""
+        super().__init__(("127.0.0.1", port), MockYahooHandler)
+        self.settings = settings
+        self.league = SyntheticLeague(
+            settings.pool_size, num_teams=settings.num_teams, seed=settings.seed
+        )
+        self.bucket = (
+            TokenBucket(settings.rate_limit, settings.burst)
+            if settings.rate_limit > 0
+            else None
+        )
+        self.random = random.Random(settings.seed)
+        self.counts = {"requests": 0, "throttled": 0, "errors": 0, "not_found": 0}
+        self.counts_lock = threading.Lock()
+
+    @property
+    def endpoint(self) -> str:
+        """Return the API endpoint to pass to the Yahoo agent."""
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}{API_PREFIX.rstrip('/')}"
+
+    def count(self, name: str) -> None:
+        """Increment a request counter."""
+        with self.counts_lock:
+            self.counts[name] += 1
+
+
+class MockYahooHandler(BaseHTTPRequestHandler):
+    """Request handler of the mock Yahoo server."""
+
+    server: MockYahooServer
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Answer a GET request."""
+        server = self.server
+        settings = server.settings
+        server.count("requests")
+        if server.bucket is not None and not server.bucket.acquire():
+            server.count("throttled")
+            self._send(THROTTLED_STATUS, b"Request denied")
+            return
+        time.sleep(settings.latency + server.random.uniform(0, settings.jitter))
+        if server.random.random() < settings.error_rate:
+            server.count("errors")
+            self._send(500, b"Internal server error")
+            return
+        path = unquote(urlsplit(self.path).path)
+        if not path.startswith(API_PREFIX):
+            server.count("not_found")
+            self._send(404, b"Not found")
+            return
+        try:
+            body = server.league(path[len(API_PREFIX) :])  # noqa: E203
+        except ValueError as error:
+            server.count("not_found")
+            self._send(404, str(error).encode("utf-8"))
+            return
+        self._send(200, body.encode("utf-8"), "application/json")
+
+    def _send(self, status: int, body: bytes, content_type: str = "text/plain") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:  # pylint: disable=W0622
+        """Silence the per-request log."""
+
+
+def serve(settings: MockSettings, port: int = 0) -> ContextManager[MockYahooServer]:
+    """Run a mock Yahoo server in a background thread."""
+    return serving.in_thread(MockYahooServer(settings, port))
+
+
+def add_settings_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the mock server settings to an argument parser."""
+    parser.add_argument("--pool-size", type=int, default=1000)
+    parser.add_argument("--num-teams", type=int, default=12)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0)
+    parser.add_argument("--burst", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def settings_from_arguments(args: argparse.Namespace) -> MockSettings:
+    """Return the mock server settings from parsed arguments."""
+    return MockSettings(
+        pool_size=args.pool_size,
+        num_teams=args.num_teams,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    """Run the mock Yahoo server in the foreground."""
+    parser = argparse.ArgumentParser(description="Run a mock Yahoo Fantasy API")
+    parser.add_argument("--port", type=int, default=8765)
+    add_settings_arguments(parser)
+    args = parser.parse_args()
+    serving.until_interrupted(MockYahooServer(settings_from_arguments(args), args.port))
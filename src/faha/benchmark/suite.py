@@ -0,0 +1,233 @@
+"""Offline benchmarks of the league pipeline.
+
+Execute with:
+$ run_benchmarks --sizes 100 1000 --output bench.json
+$ run_benchmarks --output new.json --compare bench.json
+$ run_benchmarks --record 2024 --fixtures path/to/fixtures
+"""
+
+import argparse
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Optional,
+)
+
+import numpy as np
+
+from faha.benchmark.fixtures import (
+    OfflineLeague,
+    RecordingYahoo,
+    offline_league,
+    recorded_league,
+    synthetic_league,
+)
+from faha.league import League
+from faha.lineup import LineupOptimizer
+from faha.oauth.client import get_client
+from faha.pool import StatPool, pool_values
+from faha.tables import build_player_frame, split_by_position
+from faha.utils import json_io
+from faha.value import calculate_player_values, sort_players
+from faha.weights import all_manager_team_stats, calculate_stat_weights
+from faha.yahoo import Yahoo
+
+SCHEMA_VERSION = 1
+DEFAULT_SIZES = (100, 1000, 5000, 20000)
+
+
+def time_call(func: Callable[[], Any], repeat: int) -> dict[str, float]:
+    """Time repeated calls of a function in seconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return {
+        "min": min(durations),
+        "median": statistics.median(durations),
+        "mean": statistics.mean(durations),
+    }
+
+
+def benchmark_league(
+    league: OfflineLeague, repeat: int, pool_size: Optional[int] = None
+) -> list[dict]:
+    """Time the full pipeline and each of its stages on a league."""
+    weights = calculate_stat_weights(all_manager_team_stats(league))
+
+    def pipeline() -> None:
+        league.taken_players_cache = {}
+        valued = calculate_player_values(league.taken_players(), weights)
+        split_by_position(build_player_frame(valued))
+
+    def stream_parse() -> None:
+        league.stream_responses = True
+        try:
+            league.all_players()
+        finally:
+            league.stream_responses = False
+
+    players = league.all_players()
+    valued = calculate_player_values(players, weights)
+    frame = build_player_frame(valued)
+    taken = StatPool.from_players(league.taken_players().values())
+    rosters = league.team_roster(league.all_manager_ids)
+    optimizer = LineupOptimizer(
+        taken,
+        pool_values(taken, weights),
+        league.roster_slots,
+        {
+            team: [player_id for player_id in roster if player_id in taken]
+            for team, roster in rosters.items()
+        },
+    )
+    # a week in which each player plays about every other day
+    week_games = (np.random.default_rng(0).random((7, len(taken))) < 0.5).astype(float)
+    stages: dict[str, Callable[[], Any]] = {
+        "pipeline": pipeline,
+        "parse": league.all_players,
+        "stream_parse": stream_parse,
+        "valuation": lambda: calculate_player_values(players, weights),
+        "sort": lambda: sort_players(valued),
+        "frame": lambda: build_player_frame(valued),
+        "split": lambda: split_by_position(frame),
+        "lineups": lambda: optimizer.starts(week_games),
+    }
+    results = []
+    for stage, func in stages.items():
+        requests_before = league.yahoo_agent.num_requests  # type: ignore
+        timing = time_call(func, repeat)
+        num_requests = league.yahoo_agent.num_requests - requests_before  # type: ignore
+        results.append(
+            {
+                "pool_size": pool_size or len(players),
+                "stage": stage,
+                "repeat": repeat,
+                "requests": num_requests // repeat,
+                **timing,
+            }
+        )
+    return results
+
+
+def run(
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    repeat: int = 3,
+    fixtures: Optional[Path] = None,
+) -> dict:
+    """Run the benchmarks on synthetic pools, or on recorded fixtures if given."""
+    if fixtures is not None:
+        results = benchmark_league(recorded_league(fixtures), repeat)
+    else:
+        results = [
+            result
+            for size in sizes
+            for result in benchmark_league(synthetic_league(size), repeat, size)
+        ]
+    return {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def record_league(yahoo_agent: Yahoo, league_id: str, directory: Path) -> None:
+    """Record every response the benchmarks of a league request to a directory.
+
+    The benchmarks are run once on the league, so replaying the directory with
+    `run` finds a response to each of their requests.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    benchmark_league(
+        offline_league(RecordingYahoo(yahoo_agent, directory), league_id), 1
+    )
+    json_io.write(directory / "meta.json", {"league_id": league_id})
+
+
+def compare(baseline: dict, current: dict) -> list[dict]:
+    """Return the ratio of current to baseline minimum times of matching stages."""
+    baseline_times = {
+        (result["pool_size"], result["stage"]): result["min"]
+        for result in baseline["results"]
+    }
+    return [
+        {
+            "pool_size": result["pool_size"],
+            "stage": result["stage"],
+            "baseline": baseline_times[(result["pool_size"], result["stage"])],
+            "current": result["min"],
+            "ratio": result["min"]
+            / baseline_times[(result["pool_size"], result["stage"])],
+        }
+        for result in current["results"]
+        if (result["pool_size"], result["stage"]) in baseline_times
+    ]
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _format_results(results: list[dict]) -> str:
+    lines = [f"{'players':>8} {'stage':<10} {'min (s)':>10} {'requests':>9}"]
+    lines += [
+        f"{res['pool_size']:>8} {res['stage']:<10} {res['min']:>10.4f}"
+        f" {res['requests']:>9}"
+        for res in results
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _format_comparison(comparison: list[dict]) -> str:
+    lines = [f"{'players':>8} {'stage':<10} {'baseline':>10} {'current':>10} ratio"]
+    lines += [
+        f"{row['pool_size']:>8} {row['stage']:<10} {row['baseline']:>10.4f}"
+        f" {row['current']:>10.4f} {row['ratio']:5.2f}"
+        for row in comparison
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark the league pipeline")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--fixtures", type=Path, help="recorded fixture directory")
+    parser.add_argument("--output", type=Path, default=Path("bench_output.json"))
+    parser.add_argument("--compare", type=Path, help="baseline results to compare")
+    parser.add_argument("--record", type=int, help="record fixtures of a season")
+    args = parser.parse_args()
+    if args.record is not None:
+        if args.fixtures is None:
+            parser.error("--record requires --fixtures")
+        yahoo_agent = Yahoo(get_client())
+        record_league(
+            yahoo_agent, League(args.record, yahoo_agent).league_id, args.fixtures
+        )
+        return
+    report = run(tuple(args.sizes), args.repeat, args.fixtures)
+    json_io.write(args.output, report)
+    sys.stdout.write(_format_results(report["results"]))
+    if args.compare is not None:
+        comparison = compare(json_io.read(args.compare), report)
+        sys.stdout.write(_format_comparison(comparison))
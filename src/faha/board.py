@@ -0,0 +1,132 @@
+"""Draft board of valued players."""
+
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from faha.draft import DraftValuation
+from faha.ranking import RankedIndex
+from faha.search import PlayerSearchIndex, SearchMatch
+from faha.tables import (
+    Data,
+    Positions,
+    player_plays_position,
+)
+
+
+@dataclass
+class DraftBoard:
+    """Valued players remaining on a draft board, ranked overall and by position.
+
+    Deleting a player removes them from the rankings and undoing restores the
+    most recent deletion, without re-sorting the pool. Once replacement is
+    tracked, deletions also update values over replacement incrementally.
+    """
+
+    players: dict[str, dict] = field(default_factory=dict)
+    rankings: RankedIndex = field(default_factory=RankedIndex)
+    deleted: list[str] = field(default_factory=list)
+    valuation: Optional[DraftValuation] = None
+    search_index: PlayerSearchIndex = field(
+        default_factory=lambda: PlayerSearchIndex.from_names([])
+    )
+
+    @classmethod
+    def from_players(cls, players: Iterable[dict]) -> "DraftBoard":
+        """Build the board from valued players."""
+        by_id = {player["Player ID"]: player for player in players}
+        return cls(
+            players=by_id,
+            rankings=RankedIndex.from_values(
+                (player_id, player["Value"], player_positions(player))
+                for player_id, player in by_id.items()
+            ),
+            search_index=PlayerSearchIndex.from_names(
+                (player_id, player["Name"]) for player_id, player in by_id.items()
+            ),
+        )
+
+    @classmethod
+    def from_data(cls, data: Data) -> "DraftBoard":
+        """Build the board from position tables."""
+        return cls.from_players(
+            record for table in data.values() for record in table.to_dict("records")
+        )
+
+    def __contains__(self, player_id: object) -> bool:
+        """Return whether a player remains on the board."""
+        return player_id in self.rankings
+
+    def top(self, k: int, position: Optional[Positions] = None) -> list[dict]:
+        """Return the top K remaining players at a position, or overall."""
+        return [self.players[player_id] for player_id in self.rankings.top(k, position)]
+
+    def rank(self, player_id: str, position: Optional[Positions] = None) -> int:
+        """Return the rank of a remaining player at a position, or overall."""
+        return self.rankings.rank(player_id, position)
+
+    def search(self, query: str, limit: int = 5) -> list[SearchMatch]:
+        """Return the remaining players best matching a name or its start."""
+        return self.search_index.search(query, limit, self.__contains__)
+
+    def track_replacement(
+        self, roster_slots: dict[str, int], num_managers: int
+    ) -> None:
+        """Value players over replacement as the board shrinks."""
+        self.valuation = DraftValuation.from_players(
+            self.players.values(), roster_slots, num_managers
+        )
+        for player_id in self.deleted:
+            self.valuation.remove(player_id)
+
+    def top_over_replacement(
+        self, k: int, position: Optional[Positions] = None
+    ) -> list[dict]:
+        """Return the top K remaining players by value over replacement.
+
+        The players are copies with their value over replacement as the value.
+        """
+        if self.valuation is None:
+            raise RuntimeError("Replacement is not tracked on this board")
+        if position is None:
+            top = self.valuation.top(k)
+        else:
+            top = self.valuation.top(
+                k,
+                lambda player_id: player_plays_position(
+                    position.value, self.players[player_id]["Positions"]
+                ),
+            )
+        return [self.players[player_id] | {"Value": value} for player_id, value in top]
+
+    def delete(self, player_id: str) -> dict:
+        """Remove a player from the board."""
+        self.rankings.remove(player_id)
+        if self.valuation is not None:
+            self.valuation.remove(player_id)
+        self.deleted.append(player_id)
+        return self.players[player_id]
+
+    def delete_many(self, player_ids: Iterable[str]) -> list[dict]:
+        """Remove the players remaining on the board, skipping any others."""
+        return [self.delete(player_id) for player_id in player_ids if player_id in self]
+
+    def undo(self) -> Optional[dict]:
+        """Restore the most recently deleted player."""
+        if not self.deleted:
+            return None
+        player = self.players[self.deleted.pop()]
+        self.rankings.add(
+            player["Player ID"], player["Value"], player_positions(player)
+        )
+        if self.valuation is not None:
+            self.valuation.restore(player["Player ID"])
+        return player
+
+
+def player_positions(player: dict) -> list[Positions]:
+    """Return the table positions a player is listed at."""
+    return [
+        position
+        for position in Positions
+        if player_plays_position(position.value, player["Positions"])
+    ]
@@ -0,0 +1,227 @@
+"""Versioned, checksummed snapshot of everything a league needs from Yahoo."""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import (
+    asdict,
+    dataclass,
+    field,
+)
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from faha.oauth.client import get_client
+from faha.utils import json_io
+from faha.utils.lazy import lazy_import
+from faha.yahoo import Yahoo
+
+if TYPE_CHECKING:
+    from faha import league
+else:
+    # the league module loads its bundle from here, so import it on first use
+    league = lazy_import("faha.league")
+
+BUNDLE_VERSION = 1
+DEFAULT_BOOTSTRAP_WORKERS = 8
+
+logger = logging.getLogger(__name__)
+
+_loaded: dict[Path, tuple[int, "LeagueBundle"]] = {}
+
+
+class BundleError(ValueError):
+    """Bundle file that is not JSON, of another version or not matching its checksum."""
+
+
+@dataclass
+class LeagueBundle:
+    """Game info, settings, teams, rosters and player pool of a league.
+
+    Attributes:
+        season: Start year of the season
+        league_id: ID of the league
+        info: Game info, as saved by `get_league_info`
+        settings: League settings, as saved by `get_league_info`
+        teams: Team IDs by team name
+        rosters: Names of the rostered players by team name and player ID
+        players: Players with their season stats by player ID, in Yahoo's order
+        fetched_at: Time the bundle was fetched, in seconds since the epoch
+    """
+
+    season: int
+    league_id: str
+    info: dict
+    settings: dict
+    teams: dict[str, str] = field(default_factory=dict)
+    rosters: dict[str, dict[str, str]] = field(default_factory=dict)
+    players: dict[str, dict] = field(default_factory=dict)
+    fetched_at: float = field(default_factory=time.time)
+
+    def is_fresh(self, max_age: float) -> bool:
+        """Return whether the bundle was fetched at most `max_age` seconds ago."""
+        return time.time() - self.fetched_at <= max_age
+
+    def is_older_than(self, path: Path) -> bool:
+        """Return whether a file was written after the bundle was fetched."""
+        return path.exists() and path.stat().st_mtime > self.fetched_at
+
+    def write(self, path: Path) -> None:
+        """Write the bundle with its version and checksum, replacing any other."""
+        contents = asdict(self)
+        temporary = path.with_suffix(".tmp")
+        json_io.write(
+            temporary,
+            {
+                "version": BUNDLE_VERSION,
+                "checksum": checksum(contents),
+                "bundle": contents,
+            },
+        )
+        os.replace(temporary, path)
+
+    @classmethod
+    def read(cls, path: Path) -> "LeagueBundle":
+        """Read a bundle, checking its version and checksum."""
+        try:
+            content = json_io.read(path)
+        except ValueError as error:
+            raise BundleError(f"{path} is not valid JSON: {error}") from error
+        if content.get("version") != BUNDLE_VERSION:
+            raise BundleError(
+                f"{path} is version {content.get('version')}, not {BUNDLE_VERSION}"
+            )
+        if checksum(content["bundle"]) != content["checksum"]:
+            raise BundleError(f"{path} does not match its checksum")
+        return cls(**content["bundle"])
+
+
+def checksum(contents: dict) -> str:
+    """Return the SHA-256 digest of contents serialized as canonical JSON."""
+    canonical = json.dumps(contents, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def load_bundle(path: Path) -> Optional[LeagueBundle]:
+    """Return the bundle in a file, or None if there is none.
+
+    Bundles are read once per change of the file, so every league of the process
+    shares them.
+    """
+    try:
+        modified = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    if path not in _loaded or _loaded[path][0] != modified:
+        _loaded[path] = (modified, LeagueBundle.read(path))
+    return _loaded[path][1]
+
+
+def bootstrap(
+    yahoo_agent: Yahoo, league_id: str, workers: int = DEFAULT_BOOTSTRAP_WORKERS
+) -> LeagueBundle:
+    """Fetch everything a league needs from Yahoo in one burst of requests.
+
+    The game info and then the settings are fetched first, since every other
+    request needs the game key. The team names, the rosters and the pages of
+    player IDs are then fetched concurrently, the pages `workers` at a time until
+    a page is short, followed by the stats of every page of players.
+    """
+    info = league.extract_league_info(yahoo_agent)
+    season = int(info["season"])
+    bundle = LeagueBundle(season, league_id, info, settings={})
+    source = league.League(season, yahoo_agent, bundle=bundle)
+    bundle.settings = league.extract_league_settings(yahoo_agent, source)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        team_names = executor.submit(lambda: source.team_names)
+        rosters = executor.submit(source.team_roster, source.all_manager_ids)
+        id_pages: list[list[str]] = []
+        while not id_pages or len(id_pages[-1]) == league.PLAYERS_PER_PAGE:
+            starts = [
+                league.PLAYERS_PER_PAGE * (len(id_pages) + index)
+                for index in range(workers)
+            ]
+            for page in executor.map(
+                lambda start: source.player_id_page("ALL", start), starts
+            ):
+                id_pages.append(page)
+                if len(page) < league.PLAYERS_PER_PAGE:
+                    break
+        player_pages = executor.map(source.players, [page for page in id_pages if page])
+        players = {
+            player["Player ID"]: player
+            for page in player_pages
+            for player in page.values()
+        }
+        bundle.teams = team_names.result()
+        bundle.rosters = rosters.result()
+    # the players are kept in the order of the pages
+    bundle.players = {
+        player_id: players[player_id]
+        for page in id_pages
+        for player_id in page
+        if player_id in players
+    }
+    return bundle
+
+
+def bootstrap_league() -> None:
+    """Fetch a league's info, settings, teams, rosters and players into a bundle."""
+    parser = argparse.ArgumentParser(description="Bootstrap a league from Yahoo")
+    parser.add_argument("league_id")
+    parser.add_argument("--workers", type=int, default=DEFAULT_BOOTSTRAP_WORKERS)
+    args = parser.parse_args()
+    bundle = bootstrap(Yahoo(get_client()), args.league_id, args.workers)
+    path = save_bundle(bundle)
+    sys.stdout.write(
+        f"{bundle.season}: bundled {len(bundle.teams)} teams and "
+        f"{len(bundle.players)} players to {path}\n"
+    )
+
+
+def save_bundle(bundle: LeagueBundle) -> Path:
+    """Write a bundle to its season's file, returning the path.
+
+    The bundle's league is also saved as the season's league in the league ID
+    file, so a bundle of another league than the saved one is not ignored.
+    """
+    path = league.bundle_file(bundle.season)
+    bundle.write(path)
+    league.save_league_id(bundle.season, bundle.league_id)
+    return path
+
+
+def saved_bundle(season: int) -> Optional[LeagueBundle]:
+    """Return the bundle of a season, unless it is unreadable or of another league.
+
+    The bundle is of another league when the league ID file holds a different
+    league for the season, such as after `input_league_id`. An unreadable bundle
+    is logged and ignored, so the saved info and settings files are used instead.
+    """
+    try:
+        bundle = load_bundle(league.bundle_file(season))
+    except BundleError as error:
+        logger.warning("Ignoring the league bundle: %s", error)
+        return None
+    file = league.league_ids_file()
+    if bundle is None or not file.exists():
+        return bundle
+    league_id = json_io.read(file).get(str(season), bundle.league_id)
+    return bundle if league_id == bundle.league_id else None
+
+
+def saved_settings(season: int) -> Optional[dict]:
+    """Return the raw league settings from the bundle or settings file, if any.
+
+    The settings file is used instead of the bundle when it was written later.
+    """
+    bundle = saved_bundle(season)
+    file = league.settings_file(season)
+    if bundle is not None and not bundle.is_older_than(file):
+        return bundle.settings
+    return json_io.read(file) if file.exists() else None
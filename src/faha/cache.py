@@ -0,0 +1,131 @@
+"""Season stats of players shared by every league of a game."""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+)
+
+from faha.players import GoaliePlayer, OffensePlayer
+from faha.utils import json_io
+
+DEFAULT_MAX_AGE = 6 * 60 * 60  # seconds
+
+Player = OffensePlayer | GoaliePlayer
+
+
+@dataclass
+class PlayerCache:
+    """Season stats of players by game key and player ID.
+
+    Season stats depend on the game rather than the league, so leagues of the same
+    game can share one cache and only fetch the players it is missing. Players
+    fetched more than `max_age` seconds ago are fetched again. With a directory,
+    the players of each game are also kept in `players_{game_key}.json`, so the
+    cache outlives the process. The file is replaced whole, once per `get_many`
+    or once at the end of a `batch`, and an unreadable file counts as empty.
+    """
+
+    directory: Optional[Path] = None
+    max_age: float = DEFAULT_MAX_AGE
+    _games: dict[str, dict[str, tuple[float, Player]]] = field(
+        init=False, repr=False, default_factory=dict
+    )
+    _lock: threading.Lock = field(
+        init=False, repr=False, default_factory=threading.Lock
+    )
+    _unsaved: set[str] = field(init=False, repr=False, default_factory=set)
+    _batches: int = field(init=False, repr=False, default=0)
+
+    def get_many(
+        self,
+        game_key: str,
+        player_ids: Iterable[str],
+        fetch: Callable[[list[str]], Iterable[Player]],
+    ) -> dict[str, Player]:
+        """Return players by ID, fetching only those missing or out of date."""
+        player_ids = list(player_ids)
+        now = time.time()
+        with self._lock:
+            players = self._game(game_key)
+            missing = [
+                player_id
+                for player_id in player_ids
+                if player_id not in players
+                or now - players[player_id][0] > self.max_age
+            ]
+        if missing:
+            fetched = list(fetch(missing))
+            with self._lock:
+                players = self._game(game_key)
+                for player in fetched:
+                    players[player["Player ID"]] = (now, player)
+                self._unsaved.add(game_key)
+                if not self._batches:
+                    self._save_unsaved()
+        return {
+            player_id: players[player_id][1]
+            for player_id in player_ids
+            if player_id in players
+        }
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Write the players fetched inside the block to disk once, at its end."""
+        with self._lock:
+            self._batches += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batches -= 1
+                if not self._batches:
+                    self._save_unsaved()
+
+    def clear(self, game_key: Optional[str] = None) -> None:
+        """Forget the players of a game, or of every game, in memory and on disk."""
+        with self._lock:
+            game_keys = [game_key] if game_key is not None else list(self._games)
+            for key in game_keys:
+                self._games[key] = {}
+                self._save(key)
+                self._unsaved.discard(key)
+
+    def _game(self, game_key: str) -> dict[str, tuple[float, Player]]:
+        if game_key not in self._games:
+            file = self._file(game_key)
+            self._games[game_key] = {}
+            if file is not None and file.exists():
+                try:
+                    content = json_io.read(file)
+                except (OSError, ValueError):
+                    content = {}
+                self._games[game_key] = {
+                    player_id: (fetched, player)
+                    for player_id, (fetched, player) in content.items()
+                }
+        return self._games[game_key]
+
+    def _save_unsaved(self) -> None:
+        for game_key in self._unsaved:
+            self._save(game_key)
+        self._unsaved.clear()
+
+    def _save(self, game_key: str) -> None:
+        file = self._file(game_key)
+        if file is not None:
+            temporary = file.with_suffix(".tmp")
+            json_io.write(temporary, self._games[game_key])  # type: ignore
+            os.replace(temporary, file)
+
+    def _file(self, game_key: str) -> Optional[Path]:
+        if self.directory is None:
+            return None
+        return self.directory / f"players_{game_key}.json"
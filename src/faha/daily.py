@@ -0,0 +1,307 @@
+"""Daily stat lines of players with rolling window totals.
+
+Execute daily, for example from cron, with:
+$ record_daily_stats 2024 [--date 2024-11-01]
+"""
+
+import argparse
+import datetime
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Callable,
+    Iterable,
+    Optional,
+)
+
+import numpy as np
+
+from faha.league import League, info_dir
+from faha.oauth.client import get_client
+from faha.players import GoaliePlayer, OffensePlayer
+from faha.pool import (
+    CATEGORIES,
+    SAVE_PERCENTAGE,
+    StatPool,
+)
+from faha.projection import counting_totals
+from faha.utils import json_io
+from faha.yahoo import Yahoo
+
+WINDOWS = (7, 14, 30)
+
+
+@dataclass
+class RollingWindows:
+    """Stat totals of players over the days ending at a date.
+
+    Rows of `games` and `counts` follow `player_ids` and the first axis follows
+    `lengths`, and both start at zero when left empty. Save percentage is summed
+    weighted by games started, as in `counting_totals`.
+    """
+
+    lengths: tuple[int, ...] = WINDOWS
+    end: Optional[datetime.date] = None
+    player_ids: list[str] = field(default_factory=list)
+    games: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    counts: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    _rows: dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Index the rows by player ID."""
+        if not self.games.size:
+            self.games = np.zeros((len(self.lengths), len(self.player_ids)))
+        if not self.counts.size:
+            self.counts = np.zeros(
+                (len(self.lengths), len(self.player_ids), len(CATEGORIES))
+            )
+        self._rows = {player_id: row for row, player_id in enumerate(self.player_ids)}
+
+    def rebuild(
+        self,
+        end: datetime.date,
+        day_pool: Callable[[datetime.date], Optional[StatPool]],
+    ) -> None:
+        """Sum the windows ending at a date from the stats of each day.
+
+        `day_pool` returns the stats of a day, or None if none are recorded.
+        """
+        self.player_ids, self._rows = [], {}
+        self.games = np.zeros((len(self.lengths), 0))
+        self.counts = np.zeros((len(self.lengths), 0, len(CATEGORIES)))
+        self.end = end
+        for age in range(max(self.lengths)):
+            windows = [
+                index for index, length in enumerate(self.lengths) if age < length
+            ]
+            self._add(day_pool(end - datetime.timedelta(days=age)), windows, 1.0)
+
+    def advance(
+        self,
+        end: datetime.date,
+        day_pool: Callable[[datetime.date], Optional[StatPool]],
+    ) -> None:
+        """Move the windows forward to end at a date.
+
+        Each new day adds its stats to every window and subtracts the stats of
+        the day that falls out of each window, rather than summing the windows
+        again.
+        """
+        if self.end is None:
+            self.rebuild(end, day_pool)
+            return
+        if end < self.end:
+            raise ValueError(f"Windows end at {self.end}, after {end}")
+        while self.end < end:
+            self.end += datetime.timedelta(days=1)
+            self._add(day_pool(self.end), list(range(len(self.lengths))), 1.0)
+            for index, length in enumerate(self.lengths):
+                expired = self.end - datetime.timedelta(days=length)
+                self._add(day_pool(expired), [index], -1.0)
+
+    def pool(self, length: int, players: dict[str, dict]) -> StatPool:
+        """Return the totals of the players who played in a window.
+
+        `players` holds the details of every player by ID, as in `DailyStatStore`.
+        """
+        index = self.lengths.index(length)
+        rows = np.flatnonzero(self.games[index] > 0)
+        games = self.games[index, rows]
+        totals = self.counts[index, rows].copy()
+        totals[:, SAVE_PERCENTAGE] /= games
+        player_ids = [self.player_ids[row] for row in rows]
+        return StatPool(
+            player_ids=player_ids,
+            names=[players[player_id]["Name"] for player_id in player_ids],
+            positions=[players[player_id]["Positions"] for player_id in player_ids],
+            nhl_teams=[players[player_id]["NHL Team"] for player_id in player_ids],
+            is_goalie=np.array(
+                [players[i]["Position Type"] == "G" for i in player_ids], dtype=bool
+            ),
+            games=games,
+            totals=totals,
+        )
+
+    def _add(self, pool: Optional[StatPool], windows: list[int], sign: float) -> None:
+        if not pool:
+            return
+        rows = self._ensure_rows(pool.player_ids)
+        index = np.ix_(np.array(windows), rows)
+        self.games[index] += sign * pool.games
+        self.counts[index] += sign * counting_totals(pool)
+
+    def _ensure_rows(self, player_ids: list[str]) -> np.ndarray:
+        new_ids = [player_id for player_id in player_ids if player_id not in self._rows]
+        if new_ids:
+            for player_id in new_ids:
+                self._rows[player_id] = len(self.player_ids)
+                self.player_ids.append(player_id)
+            self.games = np.pad(self.games, ((0, 0), (0, len(new_ids))))
+            self.counts = np.pad(self.counts, ((0, 0), (0, len(new_ids)), (0, 0)))
+        return np.array([self._rows[player_id] for player_id in player_ids])
+
+
+@dataclass
+class DailyStatStore:
+    """Daily stat lines of players in a date-partitioned columnar store.
+
+    Each day is a compressed file `YYYY-MM-DD.npz` with the player ID, games and
+    category total columns of the players who played that day. Player details are
+    kept once in `players.json`, and the rolling window totals ending at the
+    latest recorded day in `windows.npz`, so a window is read from a single file.
+    """
+
+    directory: Path
+    lengths: tuple[int, ...] = WINDOWS
+    _players: dict[str, dict] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Load the player details."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        players_file = self.directory / "players.json"
+        self._players = json_io.read(players_file) if players_file.exists() else {}
+
+    def record(
+        self,
+        day: datetime.date,
+        players: Iterable[OffensePlayer | GoaliePlayer],
+    ) -> RollingWindows:
+        """Store the stat lines of a day and move the windows to include it.
+
+        Recording a day before the end of the windows replaces its stats and sums
+        the windows again. Returns the updated windows.
+        """
+        pool = StatPool.from_players(players)
+        np.savez_compressed(
+            self._day_file(day),
+            player_ids=np.array(pool.player_ids, dtype=str),
+            is_goalie=pool.is_goalie,
+            games=pool.games,
+            totals=pool.totals,
+        )
+        for row, player_id in enumerate(pool.player_ids):
+            self._players[player_id] = {
+                "Name": pool.names[row],
+                "NHL Team": pool.nhl_teams[row],
+                "Positions": pool.positions[row],
+                "Position Type": "G" if pool.is_goalie[row] else "P",
+            }
+        json_io.write(self.directory / "players.json", self._players)
+        windows = self.windows()
+        if windows.end is not None and day <= windows.end:
+            windows.rebuild(windows.end, self.day_pool)
+        else:
+            windows.advance(day, self.day_pool)
+        self._save_windows(windows)
+        return windows
+
+    def days(self) -> list[datetime.date]:
+        """Return the recorded days in order."""
+        return sorted(
+            datetime.date.fromisoformat(path.stem)
+            for path in self.directory.glob("*-*-*.npz")
+        )
+
+    def day_pool(self, day: datetime.date) -> Optional[StatPool]:
+        """Return the stat lines of a day, or None if the day is not recorded."""
+        day_file = self._day_file(day)
+        if not day_file.exists():
+            return None
+        with np.load(day_file) as columns:
+            player_ids = [
+                str(player_id) for player_id in np.asarray(columns["player_ids"])
+            ]
+            return StatPool(
+                player_ids=player_ids,
+                names=[self._players[player_id]["Name"] for player_id in player_ids],
+                positions=[
+                    self._players[player_id]["Positions"] for player_id in player_ids
+                ],
+                nhl_teams=[
+                    self._players[player_id]["NHL Team"] for player_id in player_ids
+                ],
+                is_goalie=columns["is_goalie"],
+                games=columns["games"],
+                totals=columns["totals"],
+            )
+
+    def windows(self) -> RollingWindows:
+        """Return the stored rolling windows, summed again if the lengths changed."""
+        windows_file = self.directory / "windows.npz"
+        if not windows_file.exists():
+            return RollingWindows(self.lengths)
+        with np.load(windows_file) as arrays:
+            end = datetime.date.fromisoformat(str(arrays["end"]))
+            windows = RollingWindows(
+                lengths=tuple(int(length) for length in np.asarray(arrays["lengths"])),
+                end=end,
+                player_ids=[
+                    str(player_id) for player_id in np.asarray(arrays["player_ids"])
+                ],
+                games=arrays["games"],
+                counts=arrays["counts"],
+            )
+        if windows.lengths != self.lengths:
+            rebuilt = RollingWindows(self.lengths)
+            rebuilt.rebuild(end, self.day_pool)
+            return rebuilt
+        return windows
+
+    def window_pool(self, length: int) -> StatPool:
+        """Return the stat totals of the players over the last days recorded."""
+        return self.windows().pool(length, self._players)
+
+    def period_pool(self, first: datetime.date, last: datetime.date) -> StatPool:
+        """Return the stat totals of the players over the recorded days in a range."""
+        length = (last - first).days + 1
+        windows = RollingWindows((length,))
+        windows.rebuild(last, self.day_pool)
+        return windows.pool(length, self._players)
+
+    def window_players(self, length: int) -> dict[str, OffensePlayer | GoaliePlayer]:
+        """Return the players by name with their stat totals over a window.
+
+        The players can be valued with `calculate_player_values` as if the totals
+        were their season stats.
+        """
+        return self.window_pool(length).players()
+
+    def _day_file(self, day: datetime.date) -> Path:
+        return self.directory / f"{day.isoformat()}.npz"
+
+    def _save_windows(self, windows: RollingWindows) -> None:
+        np.savez_compressed(
+            self.directory / "windows.npz",
+            lengths=np.array(windows.lengths),
+            end=np.array(str(windows.end)),
+            player_ids=np.array(windows.player_ids, dtype=str),
+            games=windows.games,
+            counts=windows.counts,
+        )
+
+
+def daily_dir() -> Path:
+    """Return the directory of the daily stats store."""
+    return info_dir() / "daily"
+
+
+def main() -> None:
+    """Record the stats of every player who played on a day, yesterday by default."""
+    parser = argparse.ArgumentParser(description="Record daily player stats")
+    parser.add_argument("year", type=int, help="season start year")
+    parser.add_argument("--date", type=datetime.date.fromisoformat, default=None)
+    parser.add_argument("--directory", type=Path, default=None)
+    args = parser.parse_args()
+    day = args.date or datetime.date.today() - datetime.timedelta(days=1)
+    league = League(args.year, Yahoo(get_client()))
+    players: dict = {}
+    for page in league.iter_players("ALL", date=day.isoformat()):
+        players |= page
+    store = DailyStatStore(args.directory or daily_dir())
+    store.record(day, players.values())
+    sys.stdout.write(f"{day}: recorded {len(players)} players\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""Value over replacement of the players remaining in a draft."""
+
+import heapq
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+)
+
+from faha.utils.fenwick import FenwickTree
+from faha.vorp import REPLACEMENT_POSITIONS, starter_counts
+
+
+class _PositionPool:
+    """Players eligible at a position, in a fixed order of decreasing value.
+
+    Whether each player remains, and the values of those remaining, are kept in
+    Fenwick trees so order statistics and sums of the best remaining players are
+    found in O(log n).
+    """
+
+    def __init__(self, ranked: list[tuple[float, str]], starters: int) -> None:
+        self.values = [value for value, _ in ranked]
+        self.player_ids = [player_id for _, player_id in ranked]
+        self.slots = {player_id: slot for slot, player_id in enumerate(self.player_ids)}
+        self.remaining = FenwickTree(len(ranked))
+        self.value_sums = FenwickTree(len(ranked))
+        for slot, value in enumerate(self.values):
+            self.remaining.add(slot, 1)
+            self.value_sums.add(slot, value)
+        self.num_remaining = len(ranked)
+        self.starters = starters
+        self.filled = 0
+
+    def toggle(self, player_id: str, remaining: bool) -> None:
+        """Mark a player as remaining in the pool or taken from it."""
+        slot = self.slots[player_id]
+        sign = 1 if remaining else -1
+        self.remaining.add(slot, sign)
+        self.value_sums.add(slot, sign * self.values[slot])
+        self.num_remaining += sign
+
+    @property
+    def open_starters(self) -> int:
+        """Return the number of starter slots still open at the position."""
+        return max(self.starters - self.filled, 0)
+
+    def slot_at(self, rank: int) -> int:
+        """Return the slot of the remaining player at a one-based rank."""
+        return self.remaining.search(rank)
+
+    def replacement_level(self) -> float:
+        """Return the value of the best remaining player beyond the open slots."""
+        if not self.num_remaining:
+            return 0.0
+        rank = min(self.open_starters + 1, self.num_remaining)
+        return self.values[self.slot_at(rank)]
+
+    def starter_value(self) -> float:
+        """Return the summed value of the best remaining players for the open slots."""
+        rank = min(self.open_starters, self.num_remaining)
+        if not rank:
+            return 0.0
+        return self.value_sums.prefix_sum(self.slot_at(rank) + 1)
+
+
+class DraftValuation:
+    """Value over replacement that follows the players taken in a draft.
+
+    Each position tracks its remaining players and the starter slots still open
+    across the league. Taking a player fills a starter slot at the eligible
+    position with the lowest replacement level, and replacement levels and
+    values update in O(log n) per position without revaluing the pool.
+    """
+
+    def __init__(
+        self,
+        values: dict[str, float],
+        positions: dict[str, list[str]],
+        counts: dict[str, int],
+    ) -> None:
+        """Initialize class."""
+        self.values = values
+        self.positions = {
+            player_id: [
+                position
+                for position in REPLACEMENT_POSITIONS
+                if position in positions[player_id]
+            ]
+            for player_id in values
+        }
+        self._pools = {
+            position: _PositionPool(
+                sorted(
+                    (
+                        (value, player_id)
+                        for player_id, value in values.items()
+                        if position in self.positions[player_id]
+                    ),
+                    key=lambda item: (-item[0], item[1]),
+                ),
+                counts.get(position, 0),
+            )
+            for position in REPLACEMENT_POSITIONS
+        }
+        self._filled_by: dict[str, Optional[str]] = {}
+
+    @classmethod
+    def from_players(
+        cls, players: Iterable[dict], roster_slots: dict[str, int], num_managers: int
+    ) -> "DraftValuation":
+        """Build the valuation from valued players and the league roster."""
+        players = list(players)
+        counts = starter_counts(roster_slots, num_managers)
+        return cls(
+            {player["Player ID"]: player["Value"] for player in players},
+            {player["Player ID"]: player["Positions"] for player in players},
+            dict(zip(REPLACEMENT_POSITIONS, counts.tolist())),
+        )
+
+    def __contains__(self, player_id: object) -> bool:
+        """Return whether a player remains."""
+        return player_id in self.values and player_id not in self._filled_by
+
+    def remove(self, player_id: str) -> Optional[str]:
+        """Take a player, returning the position of the starter slot filled."""
+        if player_id not in self:
+            raise KeyError(f"Player {player_id} has already been taken")
+        open_positions = [
+            position
+            for position in self.positions[player_id]
+            if self._pools[position].open_starters
+        ]
+        filled = min(open_positions, key=self.replacement_level, default=None)
+        for position in self.positions[player_id]:
+            self._pools[position].toggle(player_id, remaining=False)
+        if filled is not None:
+            self._pools[filled].filled += 1
+        self._filled_by[player_id] = filled
+        return filled
+
+    def restore(self, player_id: str) -> None:
+        """Return a taken player to the pool, reopening the slot they filled."""
+        filled = self._filled_by.pop(player_id)
+        if filled is not None:
+            self._pools[filled].filled -= 1
+        for position in self.positions[player_id]:
+            self._pools[position].toggle(player_id, remaining=True)
+
+    def replacement_level(self, position: str) -> float:
+        """Return the value of the best remaining player below the open starters."""
+        return self._pools[position].replacement_level()
+
+    def replacement_levels(self) -> dict[str, float]:
+        """Return the replacement level at every position."""
+        return {
+            position: self.replacement_level(position)
+            for position in REPLACEMENT_POSITIONS
+        }
+
+    def open_starters(self, position: str) -> int:
+        """Return the number of starter slots still open across the league."""
+        return self._pools[position].open_starters
+
+    def starter_value(self, position: str) -> float:
+        """Return the total value of the best remaining players filling open slots."""
+        return self._pools[position].starter_value()
+
+    def value(self, player_id: str) -> float:
+        """Return the value of a player over their lowest replacement level."""
+        levels = [
+            self.replacement_level(position) for position in self.positions[player_id]
+        ]
+        return self.values[player_id] - min(levels, default=0.0)
+
+    def top(
+        self, k: int, include: Optional[Callable[[str], bool]] = None
+    ) -> list[tuple[str, float]]:
+        """Return the top K remaining players by value over replacement.
+
+        The remaining players at each position are already in order, so they are
+        merged lazily until K players are found.
+        """
+        levels = self.replacement_levels()
+        merged = heapq.merge(
+            *(
+                self._remaining_over(position, levels[position])
+                for position in REPLACEMENT_POSITIONS
+            )
+        )
+        seen: set[str] = set()
+        top: list[tuple[str, float]] = []
+        for negative_value, player_id in merged:
+            if len(top) == k:
+                break
+            if player_id in seen or (include is not None and not include(player_id)):
+                continue
+            seen.add(player_id)
+            top.append((player_id, -negative_value))
+        return top
+
+    def _remaining_over(
+        self, position: str, level: float
+    ) -> Iterator[tuple[float, str]]:
+        pool = self._pools[position]
+        for value, player_id in zip(pool.values, pool.player_ids):
+            if player_id not in self._filled_by:
+                yield level - value, player_id
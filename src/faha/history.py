@@ -0,0 +1,193 @@
+"""Season stats of players from past seasons.
+
+Execute with:
+$ backfill_history 2015 2023 --workers 4
+"""
+
+import argparse
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+from faha.league import extract_player, info_dir
+from faha.oauth.client import get_client
+from faha.players import (
+    STAT_IDS,
+    GoaliePlayer,
+    OffensePlayer,
+)
+from faha.yahoo import Yahoo
+
+PLAYERS_PER_PAGE = 25
+DEFAULT_WORKERS = 4
+
+
+@dataclass
+class HistoryStore:
+    """Append-only store of the season stats of players.
+
+    Each line of the JSON Lines file is either a player's stats in a season or a
+    marker that every player of a season has been stored. Players are appended a
+    page at a time, so an interrupted backfill resumes after the last stored
+    player, and a later line for the same player and season replaces an earlier
+    one when loaded.
+    """
+
+    path: Path
+    _lock: threading.Lock = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Drop a partly written last line left by an interruption."""
+        self._lock = threading.Lock()
+        if not self.path.exists():
+            return
+        with open(self.path, "rb+") as file_handle:
+            content = file_handle.read()
+            if content and not content.endswith(b"\n"):
+                file_handle.truncate(content.rfind(b"\n") + 1)
+
+    def append(
+        self, season: int, players: Iterable[OffensePlayer | GoaliePlayer]
+    ) -> None:
+        """Append the stats of players in a season."""
+        self._write([{"Season": season, **player} for player in players])
+
+    def mark_complete(self, season: int) -> None:
+        """Record that every player of a season has been stored."""
+        self._write([{"Complete": season}])
+
+    def completed_seasons(self) -> set[int]:
+        """Return the seasons with every player stored."""
+        return {line["Complete"] for line in self._lines() if "Complete" in line}
+
+    def num_players(self, season: int) -> int:
+        """Return the number of players stored for a season."""
+        return sum(1 for line in self._lines() if line.get("Season") == season)
+
+    def seasons(self) -> dict[int, dict[str, OffensePlayer | GoaliePlayer]]:
+        """Return the stats of the players in each season by player ID."""
+        seasons: dict[int, dict[str, OffensePlayer | GoaliePlayer]] = {}
+        for line in self._lines():
+            if "Season" in line:
+                season = line.pop("Season")
+                seasons.setdefault(season, {})[line["Player ID"]] = line  # type: ignore
+        return dict(sorted(seasons.items()))
+
+    def _write(self, lines: list[dict]) -> None:
+        content = "".join(json.dumps(line) + "\n" for line in lines)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as file_handle:
+                file_handle.write(content)
+
+    def _lines(self) -> Iterable[dict]:
+        if not self.path.exists():
+            return
+        with self._lock:
+            with open(self.path, "r", encoding="utf-8") as file_handle:
+                lines = file_handle.readlines()
+        for line in lines:
+            if line.endswith("\n"):
+                yield json.loads(line)
+
+
+def season_game_keys(yahoo_agent: Yahoo, seasons: list[int]) -> dict[int, str]:
+    """Return the NHL game key of each season."""
+    if not seasons:
+        return {}
+    raw_games = yahoo_agent.get_game_keys(seasons)["fantasy_content"]["games"]
+    raw_games.pop("count")
+    return {
+        int(game["game"][0]["season"]): game["game"][0]["game_key"]
+        for game in raw_games.values()
+    }
+
+
+def backfill(
+    yahoo_agent: Yahoo,
+    seasons: Iterable[int],
+    store: HistoryStore,
+    workers: Optional[int] = None,
+) -> dict[int, int]:
+    """Store the stats of every player in the seasons not yet completed.
+
+    Seasons are fetched concurrently, one game key per season, and each season
+    continues from the players already stored. Returns the number of players
+    fetched for each season.
+    """
+    completed = store.completed_seasons()
+    pending = sorted(set(seasons) - completed)
+    if not pending:
+        return {}
+    game_keys = season_game_keys(yahoo_agent, pending)
+    missing = set(pending) - set(game_keys)
+    if missing:
+        raise ValueError(f"No NHL game for seasons: {sorted(missing)}")
+    with ThreadPoolExecutor(max_workers=workers or DEFAULT_WORKERS) as executor:
+        counts = executor.map(
+            lambda season: backfill_season(
+                yahoo_agent, season, game_keys[season], store
+            ),
+            pending,
+        )
+        return dict(zip(pending, counts))
+
+
+def backfill_season(
+    yahoo_agent: Yahoo, season: int, game_key: str, store: HistoryStore
+) -> int:
+    """Store the stats of every player in a season, returning the number fetched."""
+    start_index = store.num_players(season)
+    fetched = 0
+    while True:
+        res = yahoo_agent.get_game_players(game_key, start_index)
+        raw_players = res["fantasy_content"]["game"][1]["players"]
+        # Yahoo returns an empty list rather than a collection past the last page
+        if isinstance(raw_players, dict):
+            raw_players.pop("count")
+            raw_players = list(raw_players.values())
+        players = [
+            extract_player(player_info, STAT_IDS.__getitem__)
+            for player_info in raw_players
+        ]
+        store.append(season, players)
+        start_index += len(players)
+        fetched += len(players)
+        if len(players) < PLAYERS_PER_PAGE:
+            break
+    store.mark_complete(season)
+    return fetched
+
+
+def history_file() -> Path:
+    """Return the path of the historical stats file."""
+    return info_dir() / "history.jsonl"
+
+
+def main() -> None:
+    """Backfill the stats of every player over a range of past seasons."""
+    parser = argparse.ArgumentParser(description="Backfill past season stats")
+    parser.add_argument("first", type=int, help="first season start year")
+    parser.add_argument("last", type=int, help="last season start year")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--file", type=Path, default=None)
+    args = parser.parse_args()
+    store = HistoryStore(args.file or history_file())
+    counts = backfill(
+        Yahoo(get_client()),
+        range(args.first, args.last + 1),
+        store,
+        workers=args.workers,
+    )
+    for season in range(args.first, args.last + 1):
+        if season in counts:
+            sys.stdout.write(f"{season}: fetched {counts[season]} players\n")
+        else:
+            sys.stdout.write(f"{season}: already stored\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,51 @@
 """League info."""
 
+import contextlib
+import functools
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
-
-from glom import (  # type: ignore
-    SKIP,
-    M,
-    Or,
-    T,
-    glom,
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
 )
 
 from faha._types import Status, Weights
+from faha.bundle import LeagueBundle, saved_bundle
+from faha.cache import DEFAULT_MAX_AGE, PlayerCache
 from faha.oauth.client import get_client
 from faha.players import (
+    STAT_IDS,
+    DraftPick,
     GoaliePlayer,
     GoalieSeasonStats,
     OffensePlayer,
     OffenseSeasonStats,
 )
 from faha.utils import json_io
-from faha.value import calculate_player_values, sort_players
+from faha.utils.lazy import lazy_import
+from faha.value import (
+    GOALIE_SHARE,
+    OFFENSE_SHARE,
+    calculate_player_points,
+    calculate_player_values,
+    calculate_team_value,
+    sort_players,
+)
 from faha.yahoo import Yahoo
 
+if TYPE_CHECKING:
+    import glom  # type: ignore
+else:
+    glom = lazy_import("glom")
+
+POINT_SCORING_TYPES = ("point", "headpoint")
+PLAYERS_PER_PAGE = 25
+ROSTER_MAX_AGE = 15 * 60  # seconds
+
 
 @dataclass
 class League:
@@ -31,6 +53,20 @@ class League:
 
     Note: only use this class with the current season
     because the game key is fixed to that season
+
+    With `stream_responses`, player and team responses are decoded incrementally
+    and records are extracted as they arrive rather than from a full decoded tree.
+
+    With a `player_cache`, the season stats of players are shared with the other
+    leagues of the game using the same cache, such as `shared_player_cache()`.
+    League data such as player status and rosters is always requested.
+
+    The game info and settings come from the season's bundle written by
+    `bootstrap_league` when there is one, unless the saved info or settings file
+    was written after it. A bundle of another league than the one in the league
+    ID file is not used. Team names, rosters and player status come from the
+    bundle for `ROSTER_MAX_AGE` seconds after it was fetched, and player stats
+    for `DEFAULT_MAX_AGE` seconds.
     """
 
     season: int
@@ -39,6 +75,14 @@ class League:
     team_rosters_cache: dict = field(default_factory=dict)
     taken_players_cache: dict = field(default_factory=dict)
     available_players_cache: dict = field(default_factory=dict)
+    stream_responses: bool = False
+    player_cache: Optional[PlayerCache] = None
+    bundle: Optional[LeagueBundle] = None
+
+    def __post_init__(self) -> None:
+        """Load the bundle of the season if it was not given."""
+        if self.bundle is None:
+            self.bundle = saved_bundle(self.season)
 
     @property
     def league_key(self) -> str:
@@ -48,25 +92,42 @@ class League:
     @property
     def game_key(self) -> str:
         """Return the league game key."""
-        league_info = json_io.read(info_file(self.season))
+        file = info_file(self.season)
+        if self.bundle is not None and not self.bundle.is_older_than(file):
+            return self.bundle.info["game_key"]
+        league_info = json_io.read(file)
         return league_info["game_key"]
 
     @property
     def league_id(self) -> str:
         """Return the league ID."""
+        if self.bundle is not None:
+            return self.bundle.league_id
         file = league_ids_file()
         return json_io.read(file)[str(self.season)]
 
     @property
     def _raw_settings(self) -> dict:
         """Return the raw league settings."""
-        return json_io.read(settings_file(self.season))
+        file = settings_file(self.season)
+        if self.bundle is not None and not self.bundle.is_older_than(file):
+            return self.bundle.settings
+        return json_io.read(file)
 
     @property
     def num_managers(self) -> int:
         """Return number of managers."""
         return self._raw_settings["settings"][2]["num_teams"]
 
+    @property
+    def roster_slots(self) -> dict[str, int]:
+        """Return the number of roster slots at each roster position."""
+        raw_positions = self._raw_settings["settings"][0]["roster_positions"]
+        return {
+            item["roster_position"]["position"]: int(item["roster_position"]["count"])
+            for item in raw_positions
+        }
+
     @property
     def all_manager_ids(self) -> list[str]:
         """Return the list of all manager IDs."""
@@ -75,6 +136,12 @@ class League:
     @property
     def team_names(self) -> dict[str, str]:
         """Return the team names."""
+        if (
+            self.bundle is not None
+            and self.bundle.teams
+            and self.bundle.is_fresh(ROSTER_MAX_AGE)
+        ):
+            return dict(self.bundle.teams)
         team_keys = self._team_keys(self.all_manager_ids)
         res = self.yahoo_agent.get_team_info(team_keys)
         raw_data = res["fantasy_content"]["teams"]
@@ -116,15 +183,28 @@ class League:
             }
         return stats
 
+    @property
+    def point_values(self) -> Optional[dict[str, float]]:
+        """Return the points of each stat in a points league, or None otherwise."""
+        return stat_point_values(self._raw_settings)
+
+    def value_players(self, players: dict, weights: Weights) -> dict:
+        """Value players, by their fantasy points per game in a points league."""
+        if self.point_values is not None:
+            return calculate_player_points(players, weights)
+        return calculate_player_values(players, weights)
+
     def team_stats(self, manager_ids: list[str]) -> dict:
         """Return the category stats for a manager."""
         team_keys = self._team_keys(manager_ids)
-        res = self.yahoo_agent.get_team_stats(team_keys)
-        raw_data = res["fantasy_content"]["teams"]
-        raw_data.pop("count")
+        if self.stream_responses:
+            team_records = _records(self.yahoo_agent.iter_team_stats(team_keys))
+        else:
+            res = self.yahoo_agent.get_team_stats(team_keys)
+            team_records = _collection_records(res["fantasy_content"]["teams"])
         team_stats = {
             team_info["team"][0][2]["name"]: self._extract_single_team_stats(team_info)
-            for team_info in raw_data.values()
+            for team_info in team_records
         }
         for team, stats in team_stats.items():
             self.team_stats_cache[team] = stats
@@ -146,20 +226,38 @@ class League:
     def team_roster(self, manager_ids: list[str] | str) -> dict:
         """Return the roster of a manager's team."""
         if isinstance(manager_ids, str):
-            team_keys = self._team_keys([manager_ids])
+            manager_ids = [manager_ids]
+        bundled = self._bundled_rosters(manager_ids)
+        if bundled is not None:
+            return bundled
+        team_keys = self._team_keys(manager_ids)
+        if self.stream_responses:
+            team_records = _records(self.yahoo_agent.iter_team_roster(team_keys))
         else:
-            team_keys = self._team_keys(manager_ids)
-        res = self.yahoo_agent.get_team_roster(team_keys)
-        raw_data = res["fantasy_content"]["teams"]
-        raw_data.pop("count")
+            res = self.yahoo_agent.get_team_roster(team_keys)
+            team_records = _collection_records(res["fantasy_content"]["teams"])
         team_rosters = {
             team_info["team"][0][2]["name"]: self._extract_single_team_roster(team_info)
-            for team_info in raw_data.values()
+            for team_info in team_records
         }
         for team, roster in team_rosters.items():
             self.team_rosters_cache[team] = roster
         return team_rosters
 
+    def _bundled_rosters(self, manager_ids: list[str]) -> Optional[dict]:
+        """Return rosters from a fresh bundle holding every team asked for."""
+        if self.bundle is None or not self.bundle.is_fresh(ROSTER_MAX_AGE):
+            return None
+        names = {team_id: name for name, team_id in self.bundle.teams.items()}
+        if not all(
+            names.get(manager_id) in self.bundle.rosters for manager_id in manager_ids
+        ):
+            return None
+        return {
+            names[manager_id]: dict(self.bundle.rosters[names[manager_id]])
+            for manager_id in manager_ids
+        }
+
     def team_player_stats(self, manager_id: str) -> dict:
         """Find players on a team and return their stats and info."""
         roster = self.team_roster(manager_id)
@@ -190,7 +288,7 @@ class League:
         ]
         for player_name in players_to_remove:
             player_stats.pop(player_name)
-        valued_stats = calculate_player_values(player_stats, weights)
+        valued_stats = self.value_players(player_stats, weights)
         return sort_players(valued_stats, condensed=True)  # type: ignore
 
     def team_values(self, weights: Weights) -> list[tuple[str, float]]:
@@ -202,16 +300,43 @@ class League:
         offensive (11 slots) and goalie (2 slots) players
         """
         team_list = []
+        # points count the same for skaters and goalies in a points league
+        shares = (
+            (OFFENSE_SHARE, GOALIE_SHARE) if self.point_values is None else (1.0, 1.0)
+        )
         for manager, manager_id in self.team_names.items():
             offense_values = self.team_offense_player_values(manager_id, weights)
             goalie_values = self.team_goalie_player_values(manager_id, weights)
-            team_value = (
-                sum(value for _, value in offense_values) * 8 / 12
-                + sum(value for _, value in goalie_values) * 4 / 12
-            )  # goalies only account for 4/12th of the stats
+            team_value = calculate_team_value(
+                (value for _, value in offense_values),
+                (value for _, value in goalie_values),
+                *shares,
+            )
             team_list.append((manager, team_value))
         return sorted(team_list, key=lambda x: x[1], reverse=True)
 
+    def draft_results(self) -> list[DraftPick]:
+        """Return the picks made so far in the draft in pick order."""
+        res = self.yahoo_agent.get_draft_results(self.league_key)
+        raw_results = res["fantasy_content"]["league"][1]["draft_results"]
+        picks = [
+            result["draft_result"]
+            for result in _collection_records(raw_results)
+            if "player_key" in result["draft_result"]
+        ]
+        return sorted(
+            (
+                {
+                    "Pick": int(pick["pick"]),
+                    "Round": int(pick["round"]),
+                    "Team Key": pick["team_key"],
+                    "Player ID": player_id_from_key(pick["player_key"]),
+                }
+                for pick in picks
+            ),
+            key=lambda pick: pick["Pick"],
+        )
+
     def _extract_single_team_roster(self, team_info: dict) -> dict:
         raw_players = team_info["team"][1]["roster"]["0"]["players"]
         raw_players.pop("count")
@@ -230,107 +355,65 @@ class League:
         """Return the list of team keys."""
         return [f"{self.game_key}.p.{player_id}" for player_id in player_ids]
 
-    def players(self, player_ids: list[str]) -> dict:
-        """Return stats for players matching the player ids."""
+    def players(self, player_ids: list[str], date: Optional[str] = None) -> dict:
+        """Return stats for players matching the player ids.
+
+        With a date as YYYY-MM-DD, the stats are of that day rather than the season.
+        """
+        if (
+            date is None
+            and self.bundle is not None
+            and self.bundle.players
+            and self.bundle.is_fresh(DEFAULT_MAX_AGE)
+        ):
+            bundled = self.bundle.players
+            missing = [
+                player_id for player_id in player_ids if player_id not in bundled
+            ]
+            players = self._cached_players(missing) if missing else {}
+            return {
+                bundled[player_id]["Name"]: bundled[player_id]
+                for player_id in player_ids
+                if player_id in bundled
+            } | players
+        return self._cached_players(player_ids, date)
+
+    def _cached_players(
+        self, player_ids: list[str], date: Optional[str] = None
+    ) -> dict:
+        """Return players from the player cache or Yahoo."""
+        if self.player_cache is None or date is not None:
+            return self._fetch_player_stats(player_ids, date)
+        players = self.player_cache.get_many(
+            self.game_key,
+            player_ids,
+            lambda missing: self._fetch_player_stats(missing).values(),
+        )
+        return {player["Name"]: player for player in players.values()}
+
+    def _fetch_player_stats(
+        self, player_ids: list[str], date: Optional[str] = None
+    ) -> dict:
+        """Request the stats for players matching the player ids."""
         player_keys = self._player_keys(player_ids)
-        res = self.yahoo_agent.get_player_stats(player_keys)
-        raw_data = res["fantasy_content"]["players"]
-        raw_data.pop("count")
+        if self.stream_responses:
+            player_records = _records(
+                self.yahoo_agent.iter_player_stats(player_keys, date)
+            )
+        else:
+            res = self.yahoo_agent.get_player_stats(player_keys, date)
+            player_records = _collection_records(res["fantasy_content"]["players"])
         player_info = {
             player_info["player"][0][2]["name"]["full"]: self._extract_player_data(
                 player_info
             )
-            for player_info in raw_data.values()
+            for player_info in player_records
         }
         return player_info
 
     def _extract_player_data(self, player_info: dict) -> OffensePlayer | GoaliePlayer:
         """Extract the player from raw data."""
-        player_id = _get_player_id(player_info)
-        name = _get_player_name(player_info)
-        nhl_team = _get_nhl_team(player_info)
-        positions = _get_positions(player_info)
-        position_type = _get_position_type(player_info)
-        if position_type == "P":
-            oplayer: OffensePlayer = {
-                "Player ID": player_id,
-                "Name": name,
-                "NHL Team": nhl_team,
-                "Positions": positions,
-                "Position Type": position_type,
-                "Season Stats": self._get_offensive_stats(player_info),
-            }
-            return oplayer
-        if position_type == "G":
-            gplayer: GoaliePlayer = {
-                "Player ID": player_id,
-                "Name": name,
-                "NHL Team": nhl_team,
-                "Positions": positions,
-                "Position Type": position_type,
-                "Season Stats": self._get_goalie_stats(player_info),
-            }
-            return gplayer
-        raise ValueError(f"Unknown position type, {position_type}")
-
-    def _get_offensive_stats(self, player_info: dict) -> OffenseSeasonStats:
-        """Return an offensive player's stats."""
-        games_played = convert(self._extract_stat(player_info, "Games Played"), int)
-        goals = convert(self._extract_stat(player_info, "Goals"), int)
-        assists = convert(self._extract_stat(player_info, "Assists"), int)
-        plus_minus = convert(self._extract_stat(player_info, "Plus/Minus"), int)
-        powerplay_points = convert(
-            self._extract_stat(player_info, "Powerplay Points"), int
-        )
-        shots_on_goal = convert(self._extract_stat(player_info, "Shots on Goal"), int)
-        faceoffs_won = convert(self._extract_stat(player_info, "Faceoffs Won"), int)
-        hits = convert(self._extract_stat(player_info, "Hits"), int)
-        blocks = convert(self._extract_stat(player_info, "Blocks"), int)
-        stats: OffenseSeasonStats = {
-            "Games Played": games_played,
-            "Goals": goals,
-            "Assists": assists,
-            "Plus/Minus": plus_minus,
-            "Powerplay Points": powerplay_points,
-            "Shots on Goal": shots_on_goal,
-            "Faceoffs Won": faceoffs_won,
-            "Hits": hits,
-            "Blocks": blocks,
-        }
-        return stats
-
-    def _get_goalie_stats(self, player_info: dict) -> GoalieSeasonStats:
-        """Return an goalie player's stats."""
-        games_started = convert(self._extract_stat(player_info, "Games Started"), int)
-        wins = convert(self._extract_stat(player_info, "Wins"), int)
-        saves = convert(self._extract_stat(player_info, "Saves"), int)
-        save_percentage = convert(
-            self._extract_stat(player_info, "Save Percentage"), float
-        )
-        shutouts = convert(self._extract_stat(player_info, "Shutouts"), int)
-        stats: GoalieSeasonStats = {
-            "Games Started": games_started,
-            "Wins": wins,
-            "Saves": saves,
-            "Save Percentage": save_percentage,
-            "Shutouts": shutouts,
-        }
-        return stats
-
-    def _extract_stat(self, player_info: dict, stat_name: str) -> str:
-        """Extract a stat."""
-        return glom(player_info, self._stat_spec(stat_name))[0]
-
-    def _stat_spec(self, stat_name: str) -> tuple:
-        """Return the glom stat spec."""
-        stat_id = self._stat_id(stat_name)
-        return (
-            "player",
-            T[1],
-            "player_stats.stats",
-            [T["stat"]],
-            [Or((M(T["stat_id"]) == stat_id, "value"), default=SKIP)],
-        )
+        return extract_player(player_info, self._stat_id)
 
     def _stat_id(self, stat_name: str) -> str:
         """Return the stat ID for a stat name."""
@@ -372,33 +455,48 @@ class League:
                 - 'A' available players (FA + WA)
                 - 'ALL' all players
         """
-        # The Yahoo! API we use doles out players 25 per page.  We need to make
-        # successive calls to gather all of the players.  We stop when we fetch
-        # less then 25.
-        player_keys = self._fetch_players_ids(status, position)
-        player_key_chunks = [
-            player_keys[ii : ii + 25]  # noqa: E203
-            for ii in range(0, len(player_keys), 25)
-        ]
         players: dict = {}
-        for players_in_chunk in player_key_chunks:
-            potential_players = self.players(players_in_chunk)
-            players |= {
-                k: v
-                for k, v in potential_players.items()
-                if not (
-                    (
-                        "Games Started" in v["Season Stats"]
-                        and v["Season Stats"]["Games Started"] == 0
-                    )
-                    or (
-                        "Games Played" in v["Season Stats"]
-                        and v["Season Stats"]["Games Played"] == 0
-                    )
-                )
-            }
+        for page in self.iter_players(status, position):
+            players |= page
         return players
 
+    def iter_players(
+        self,
+        status: Status,
+        position: Optional[str] = None,
+        weights: Optional[Weights] = None,
+        date: Optional[str] = None,
+    ) -> Iterator[dict]:
+        """Yield players from Yahoo one page at a time as the pages arrive.
+
+        Players who have not played a game are skipped. Only the current page is
+        held in memory, so consumers that aggregate the players stay bounded.
+        Players fetched into the player cache are written to disk once, after
+        the last page.
+
+        Args:
+            status (Status): Indicates what type of players to get, see
+                `_fetch_players`
+            position (str, optional): Only get players eligible at a position
+            weights (Weights, optional): Value the players with these weights
+            date (str, optional): Use the stats of this day, as YYYY-MM-DD, rather
+                than the season
+        """
+        with (
+            self.player_cache.batch()
+            if self.player_cache is not None
+            else contextlib.nullcontext()
+        ):
+            for player_ids in self._iter_player_id_pages(status, position):
+                players = {
+                    name: player
+                    for name, player in self.players(player_ids, date).items()
+                    if _has_played(player)
+                }
+                if weights is not None:
+                    players = self.value_players(players, weights)
+                yield players
+
     def _fetch_players_ids(
         self,
         status: Status,
@@ -415,26 +513,218 @@ class League:
                 - 'A' available players (FA + WA)
                 - 'ALL' all players
         """
+        return [
+            player_id
+            for page in self._iter_player_id_pages(status, position)
+            for player_id in page
+        ]
+
+    def _iter_player_id_pages(
+        self,
+        status: Status,
+        position: Optional[str] = None,
+    ) -> Iterator[list[str]]:
+        """Yield the pages of player ids from Yahoo with a status."""
+        bundled = self._bundled_player_ids(status, position)
+        if bundled is not None:
+            for start in range(0, len(bundled), PLAYERS_PER_PAGE):
+                yield bundled[start : start + PLAYERS_PER_PAGE]  # noqa: E203
+            return
         # The Yahoo! API we use doles out players 25 per page.  We need to make
         # successive calls to gather all of the players.  We stop when we fetch
         # less then 25.
-        players_per_page = 25
-        player_ids = []
         player_index = 0
-        while player_index % players_per_page == 0:
+        while player_index % PLAYERS_PER_PAGE == 0:
+            player_ids = self.player_id_page(status, player_index, position)
+            if not player_ids:
+                break
+            player_index += len(player_ids)
+            yield player_ids
+
+    def player_id_page(
+        self, status: Status, start: int, position: Optional[str] = None
+    ) -> list[str]:
+        """Return a page of player ids from Yahoo with a status, from an index."""
+        if self.stream_responses:
+            player_records = _records(
+                self.yahoo_agent.iter_player_category_stats(
+                    self.league_key, start, status, position
+                )
+            )
+        else:
             res = self.yahoo_agent.get_player_category_stats(
-                self.league_key, player_index, status, position
+                self.league_key, start, status, position
             )
-            raw_data = res["fantasy_content"]["league"][1]["players"]
-            num_paginated_players = raw_data["count"]
-            if num_paginated_players == 0:
-                break
-            raw_data.pop("count")
-            player_index += num_paginated_players
-            player_ids += [
-                _get_player_id(player_info) for player_info in raw_data.values()
-            ]
-        return player_ids
+            player_records = _collection_records(
+                res["fantasy_content"]["league"][1]["players"]
+            )
+        return [_get_player_id(player_info) for player_info in player_records]
+
+    def _bundled_player_ids(
+        self, status: Status, position: Optional[str] = None
+    ) -> Optional[list[str]]:
+        """Return the ids of the players with a status from a fresh bundle.
+
+        Taken players are those on the bundled rosters and available players the
+        others, so free agents, waivers and keepers are always requested.
+        """
+        if (
+            status not in ("ALL", "T", "A")
+            or self.bundle is None
+            or not self.bundle.players
+            or not self.bundle.is_fresh(ROSTER_MAX_AGE)
+        ):
+            return None
+        rostered = {
+            player_id for roster in self.bundle.rosters.values() for player_id in roster
+        }
+        return [
+            player_id
+            for player_id, player in self.bundle.players.items()
+            if (status == "ALL" or (player_id in rostered) == (status == "T"))
+            and (position is None or position in player["Positions"])
+        ]
+
+
+def extract_player(
+    player_info: dict, stat_id: Callable[[str], str]
+) -> OffensePlayer | GoaliePlayer:
+    """Extract a player from raw data, given the stat ID of each stat name."""
+    player_id = _get_player_id(player_info)
+    name = _get_player_name(player_info)
+    nhl_team = _get_nhl_team(player_info)
+    positions = _get_positions(player_info)
+    position_type = _get_position_type(player_info)
+    if position_type == "P":
+        oplayer: OffensePlayer = {
+            "Player ID": player_id,
+            "Name": name,
+            "NHL Team": nhl_team,
+            "Positions": positions,
+            "Position Type": position_type,
+            "Season Stats": _get_offensive_stats(player_info, stat_id),
+        }
+        return oplayer
+    if position_type == "G":
+        gplayer: GoaliePlayer = {
+            "Player ID": player_id,
+            "Name": name,
+            "NHL Team": nhl_team,
+            "Positions": positions,
+            "Position Type": position_type,
+            "Season Stats": _get_goalie_stats(player_info, stat_id),
+        }
+        return gplayer
+    raise ValueError(f"Unknown position type, {position_type}")
+
+
+def stat_point_values(raw_settings: dict) -> Optional[dict[str, float]]:
+    """Return the points of each stat from raw league settings.
+
+    Returns None unless the league uses points scoring. Stats that are not
+    extracted for players, such as goals against, are left out.
+    """
+    settings = raw_settings["settings"][0]
+    if settings.get("scoring_type") not in POINT_SCORING_TYPES:
+        return None
+    stat_names = {stat_id: name for name, stat_id in STAT_IDS.items()}
+    modifiers = (item["stat"] for item in settings["stat_modifiers"]["stats"])
+    return {
+        stat_names[str(modifier["stat_id"])]: float(modifier["value"])
+        for modifier in modifiers
+        if str(modifier["stat_id"]) in stat_names
+    }
+
+
+def _get_offensive_stats(
+    player_info: dict, stat_id: Callable[[str], str]
+) -> OffenseSeasonStats:
+    """Return an offensive player's stats."""
+    games_played = convert(_extract_stat(player_info, stat_id("Games Played")), int)
+    goals = convert(_extract_stat(player_info, stat_id("Goals")), int)
+    assists = convert(_extract_stat(player_info, stat_id("Assists")), int)
+    plus_minus = convert(_extract_stat(player_info, stat_id("Plus/Minus")), int)
+    powerplay_points = convert(
+        _extract_stat(player_info, stat_id("Powerplay Points")), int
+    )
+    shots_on_goal = convert(_extract_stat(player_info, stat_id("Shots on Goal")), int)
+    faceoffs_won = convert(_extract_stat(player_info, stat_id("Faceoffs Won")), int)
+    hits = convert(_extract_stat(player_info, stat_id("Hits")), int)
+    blocks = convert(_extract_stat(player_info, stat_id("Blocks")), int)
+    stats: OffenseSeasonStats = {
+        "Games Played": games_played,
+        "Goals": goals,
+        "Assists": assists,
+        "Plus/Minus": plus_minus,
+        "Powerplay Points": powerplay_points,
+        "Shots on Goal": shots_on_goal,
+        "Faceoffs Won": faceoffs_won,
+        "Hits": hits,
+        "Blocks": blocks,
+    }
+    return stats
+
+
+def _get_goalie_stats(
+    player_info: dict, stat_id: Callable[[str], str]
+) -> GoalieSeasonStats:
+    """Return an goalie player's stats."""
+    games_started = convert(_extract_stat(player_info, stat_id("Games Started")), int)
+    wins = convert(_extract_stat(player_info, stat_id("Wins")), int)
+    saves = convert(_extract_stat(player_info, stat_id("Saves")), int)
+    save_percentage = convert(
+        _extract_stat(player_info, stat_id("Save Percentage")), float
+    )
+    shutouts = convert(_extract_stat(player_info, stat_id("Shutouts")), int)
+    stats: GoalieSeasonStats = {
+        "Games Started": games_started,
+        "Wins": wins,
+        "Saves": saves,
+        "Save Percentage": save_percentage,
+        "Shutouts": shutouts,
+    }
+    return stats
+
+
+def _extract_stat(player_info: dict, stat_id: str) -> str:
+    """Extract a stat."""
+    return glom.glom(player_info, _stat_spec(stat_id))[0]
+
+
+def _stat_spec(stat_id: str) -> tuple:
+    """Return the glom stat spec."""
+    return (
+        "player",
+        glom.T[1],
+        "player_stats.stats",
+        [glom.T["stat"]],
+        [glom.Or((glom.M(glom.T["stat_id"]) == stat_id, "value"), default=glom.SKIP)],
+    )
+
+
+def _collection_records(collection: dict) -> Iterable[dict]:
+    """Return the records of a decoded Yahoo collection."""
+    collection.pop("count")
+    return collection.values()
+
+
+def _records(members: Iterable[tuple[str | int, Any]]) -> Iterable[dict]:
+    """Return the records of a streamed Yahoo collection."""
+    return (record for _, record in members)
+
+
+def _has_played(player: OffensePlayer | GoaliePlayer) -> bool:
+    """Return whether a player has played or started a game."""
+    stats = player["Season Stats"]
+    return not (
+        ("Games Started" in stats and stats["Games Started"] == 0)  # type: ignore
+        or ("Games Played" in stats and stats["Games Played"] == 0)  # type: ignore
+    )
+
+
+def player_id_from_key(player_key: str) -> str:
+    """Return the player ID of a player key such as 453.p.6743."""
+    return player_key.rsplit(".", 1)[-1]
 
 
 def convert(quantity: str, new_type: type) -> int:
@@ -443,45 +733,60 @@ def convert(quantity: str, new_type: type) -> int:
 
 
 def _get_player_id(player_info: dict) -> str:
-    return glom(
+    return glom.glom(
         player_info,
-        ("player", T[0], ([Or((M(T["player_id"]), "player_id"), default=SKIP)])),
+        (
+            "player",
+            glom.T[0],
+            ([glom.Or((glom.M(glom.T["player_id"]), "player_id"), default=glom.SKIP)]),
+        ),
     )[0]
 
 
 def _get_player_name(player_info: dict) -> str:
-    return glom(
+    return glom.glom(
         player_info,
-        ("player", T[0], ([Or((M(T["name"]), "name.full"), default=SKIP)])),
+        (
+            "player",
+            glom.T[0],
+            ([glom.Or((glom.M(glom.T["name"]), "name.full"), default=glom.SKIP)]),
+        ),
     )[0]
 
 
 def _get_nhl_team(player_info: dict) -> str:
-    return glom(
+    return glom.glom(
         player_info,
         (
             "player",
-            T[0],
-            ([Or((M(T["editorial_team_abbr"]), "editorial_team_abbr"), default=SKIP)]),
+            glom.T[0],
+            (
+                [
+                    glom.Or(
+                        (glom.M(glom.T["editorial_team_abbr"]), "editorial_team_abbr"),
+                        default=glom.SKIP,
+                    )
+                ]
+            ),
         ),
     )[0]
 
 
 def _get_positions(player_info: dict) -> list[str]:
-    return glom(
+    return glom.glom(
         player_info,
         (
             "player",
-            T[0],
+            glom.T[0],
             (
                 [
-                    Or(
+                    glom.Or(
                         (
-                            M(T["eligible_positions"]),
+                            glom.M(glom.T["eligible_positions"]),
                             "eligible_positions",
                             ["position"],
                         ),
-                        default=SKIP,
+                        default=glom.SKIP,
                     )
                 ]
             ),
@@ -490,19 +795,31 @@ def _get_positions(player_info: dict) -> list[str]:
 
 
 def _get_position_type(player_info: dict) -> str:
-    return glom(
+    return glom.glom(
         player_info,
         (
             "player",
-            T[0],
-            ([Or((M(T["position_type"]), "position_type"), default=SKIP)]),
+            glom.T[0],
+            (
+                [
+                    glom.Or(
+                        (glom.M(glom.T["position_type"]), "position_type"),
+                        default=glom.SKIP,
+                    )
+                ]
+            ),
         ),
     )[0]
 
 
 def _get_team_info(team_info: dict, category) -> str:
-    return glom(
-        team_info, ("team", T[0], ([Or((M(T[category]), category), default=SKIP)]))
+    return glom.glom(
+        team_info,
+        (
+            "team",
+            glom.T[0],
+            ([glom.Or((glom.M(glom.T[category]), category), default=glom.SKIP)]),
+        ),
     )
 
 
@@ -556,12 +873,14 @@ def input_league_id() -> None:
     """Input the league ID into the ID file."""
     league_id = input("What is the league ID? ")
     season = int(input("What year did the season start? "))
+    save_league_id(season, league_id)
+
+
+def save_league_id(season: int, league_id: str) -> None:
+    """Save the league ID of a season into the ID file."""
     file = league_ids_file()
-    if file.exists():
-        content = json_io.read(file)
-        content[season] = league_id
-    else:
-        content = {season: league_id}
+    content = json_io.read(file) if file.exists() else {}
+    content[str(season)] = league_id
     json_io.write(file, content)
 
 
@@ -580,6 +899,17 @@ def settings_file(season: int) -> Path:
     return info_dir() / f"settings_{season}.json"
 
 
+def bundle_file(season: int) -> Path:
+    """Return the path of the league bundle file."""
+    return info_dir() / f"bundle_{season}.json"
+
+
+@functools.cache
+def shared_player_cache() -> PlayerCache:
+    """Return the player cache shared by the leagues of this process and on disk."""
+    return PlayerCache(info_dir())
+
+
 def info_dir() -> Path:
     """Return the directory storing the info files."""
     return Path(__file__).parent.resolve() / "data"
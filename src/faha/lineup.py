@@ -0,0 +1,159 @@
+"""Optimal lineups of rostered players from their eligible positions."""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from faha._types import Weights
+from faha.league import League
+from faha.pool import StatPool, pool_values
+from faha.vorp import (
+    BENCH_POSITION,
+    FLEX_POSITIONS,
+    RESERVE_POSITIONS,
+)
+
+
+@dataclass
+class Lineup:
+    """Players started by a team on a day.
+
+    Attributes:
+        slots: IDs of the players started at each slot position
+        bench: IDs of the rostered players not started
+        value: Total value of the started players
+    """
+
+    slots: dict[str, list[str]]
+    bench: list[str]
+    value: float
+
+
+@dataclass
+class LineupOptimizer:
+    """Assign rostered players to the starting slots of a league.
+
+    A player adds the same value in any slot they start in, so the best lineup is
+    a maximum weight bipartite matching with the weights on the players. The
+    sets of players that fit in the slots together form a transversal matroid,
+    so adding players in order of value whenever an augmenting path reaches an
+    open slot gives an optimal matching. Paths run over slot positions with
+    their counts rather than single slots, so a lineup takes a few dozen steps
+    and every team can be solved for every day of a week in milliseconds.
+
+    Attributes:
+        pool: Players on any roster
+        values: Value of each player per game played
+        roster_slots: Roster slots of a team
+        rosters: IDs of the players on each team's roster
+    """
+
+    pool: StatPool
+    values: np.ndarray
+    roster_slots: dict[str, int]
+    rosters: dict[str, list[str]] = field(default_factory=dict)
+    _positions: list[str] = field(init=False, repr=False)
+    _capacity: list[int] = field(init=False, repr=False)
+    _eligible: list[tuple[int, ...]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Find the starting slot positions each player is eligible for."""
+        self._positions = [
+            position
+            for position, count in self.roster_slots.items()
+            if count > 0
+            and position != BENCH_POSITION
+            and position not in RESERVE_POSITIONS
+        ]
+        self._capacity = [self.roster_slots[position] for position in self._positions]
+        self._eligible = [
+            tuple(
+                index
+                for index, slot in enumerate(self._positions)
+                if slot_accepts(slot, positions)
+            )
+            for positions in self.pool.positions
+        ]
+
+    @classmethod
+    def from_league(cls, league: League, weights: Weights) -> "LineupOptimizer":
+        """Build the optimizer from the current rosters of a league."""
+        pool, rosters = StatPool.from_rosters(league)
+        return cls(pool, pool_values(pool, weights), league.roster_slots, rosters)
+
+    def lineup(
+        self, player_ids: list[str], games: Optional[np.ndarray] = None
+    ) -> Lineup:
+        """Return the best lineup of a team's players.
+
+        Args:
+            player_ids: IDs of the players on the roster
+            games: Games of each pool player on the day, or one each if None
+        """
+        rows = [self.pool.row(player_id) for player_id in player_ids]
+        played = self.values[rows] * (1.0 if games is None else games[rows])
+        slot_of = self._assign(rows, played)
+        slots: dict[str, list[str]] = {position: [] for position in self._positions}
+        for row, slot in slot_of.items():
+            slots[self._positions[slot]].append(self.pool.player_ids[row])
+        return Lineup(
+            slots=slots,
+            bench=[self.pool.player_ids[row] for row in rows if row not in slot_of],
+            value=float(sum(played[rows.index(row)] for row in slot_of)),
+        )
+
+    def starts(self, games: np.ndarray) -> np.ndarray:
+        """Return whether each pool player (columns) starts on each day (rows).
+
+        The lineup of every team in `rosters` is solved for every day, from the
+        games of each player (columns) on each day (rows). Summed over the days
+        of a week, the starts can be passed as games to `MatchupEngine`.
+        """
+        games = np.atleast_2d(games)
+        started = np.zeros(games.shape, dtype=bool)
+        for player_ids in self.rosters.values():
+            rows = [self.pool.row(player_id) for player_id in player_ids]
+            for day, day_games in enumerate(games):
+                chosen = self._assign(rows, self.values[rows] * day_games[rows])
+                started[day, list(chosen)] = True
+        return started
+
+    def _assign(self, rows: list[int], values: np.ndarray) -> dict[int, int]:
+        """Return the slot position of each started row, adding rows by value."""
+        slot_of: dict[int, int] = {}
+        members: list[list[int]] = [[] for _ in self._positions]
+        for index in np.argsort(-values, kind="stable"):
+            if values[index] <= 0:
+                break
+            self._augment(rows[index], set(), slot_of, members)
+        return slot_of
+
+    def _augment(
+        self,
+        row: int,
+        visited: set[int],
+        slot_of: dict[int, int],
+        members: list[list[int]],
+    ) -> bool:
+        """Start a row, moving started rows along a path to an open slot."""
+        for slot in self._eligible[row]:
+            if slot in visited:
+                continue
+            visited.add(slot)
+            if len(members[slot]) < self._capacity[slot] or any(
+                self._augment(other, visited, slot_of, members)
+                for other in list(members[slot])
+            ):
+                if row in slot_of:
+                    members[slot_of[row]].remove(row)
+                slot_of[row] = slot
+                members[slot].append(row)
+                return True
+        return False
+
+
+def slot_accepts(slot: str, positions: list[str]) -> bool:
+    """Return whether a player eligible at some positions can start in a slot."""
+    eligible = FLEX_POSITIONS.get(slot, (slot,))
+    return any(position in eligible for position in positions)
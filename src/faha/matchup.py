@@ -0,0 +1,234 @@
+"""Head-to-head category matchup win probabilities."""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from faha.league import League
+from faha.pool import (
+    CATEGORIES,
+    SAVE_PERCENTAGE,
+    StatPool,
+)
+
+SKATER_GAMES_PER_WEEK = 3.5
+GOALIE_STARTS_PER_WEEK = 2.0
+PLUS_MINUS_VARIANCE_PER_GAME = 1.0
+PLUS_MINUS = CATEGORIES.index("Plus/Minus")
+SAVES = CATEGORIES.index("Saves")
+
+
+@dataclass
+class Matchups:
+    """Win probabilities of every pair of teams in every week.
+
+    Attributes:
+        teams: Team names
+        category_win: Probability the row team beats the column team in each
+            category, with shape (weeks, teams, teams, categories)
+        win: Probability the row team wins more categories, (weeks, teams, teams)
+        tie: Probability both teams win the same number of categories
+    """
+
+    teams: list[str]
+    category_win: np.ndarray
+    win: np.ndarray
+    tie: np.ndarray
+
+    def expected_categories(self) -> np.ndarray:
+        """Return the expected number of categories won, (weeks, teams, teams)."""
+        return self.category_win.sum(axis=-1)
+
+
+@dataclass
+class MatchupEngine:
+    """Weekly category output of rostered players as normal distributions.
+
+    Counting stats are treated as Poisson with the player's per-game rate, so
+    their variance equals their mean, while plus/minus has a fixed variance per
+    game and team save percentage is binomial over the shots faced. Rosters are
+    rows of a matrix, so changing a roster only changes one row before all pairs
+    and weeks are recomputed with a few array operations.
+    """
+
+    pool: StatPool
+    teams: list[str]
+    rosters: np.ndarray
+    games: np.ndarray
+    _contributions: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Cache the per-game contributions of the pool."""
+        self._contributions = per_game_contributions(self.pool)
+
+    @classmethod
+    def from_rosters(
+        cls,
+        pool: StatPool,
+        rosters: dict[str, list[str]],
+        games: Optional[np.ndarray] = None,
+    ) -> "MatchupEngine":
+        """Build the engine from team names and the player IDs on their rosters.
+
+        Args:
+            pool: Players on any roster
+            rosters: Player IDs on each team's roster
+            games: Games of each player (columns) in each week (rows), or one
+                week of typical games if None
+        """
+        if games is None:
+            games = typical_games(pool)[np.newaxis]
+        engine = cls(
+            pool=pool,
+            teams=list(rosters),
+            rosters=np.zeros((len(rosters), len(pool))),
+            games=np.asarray(games, dtype=float),
+        )
+        for team, player_ids in rosters.items():
+            engine.set_roster(team, player_ids)
+        return engine
+
+    @classmethod
+    def from_league(
+        cls, league: League, games: Optional[np.ndarray] = None
+    ) -> "MatchupEngine":
+        """Build the engine from the current rosters of a league."""
+        pool, rosters = StatPool.from_rosters(league)
+        return cls.from_rosters(pool, rosters, games)
+
+    def set_roster(self, team: str, player_ids: list[str]) -> None:
+        """Replace the players on a team's roster."""
+        row = self.teams.index(team)
+        self.rosters[row] = 0
+        self.rosters[row, [self.pool.row(player_id) for player_id in player_ids]] = 1
+
+    def distributions(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the mean and variance of each team's weekly category output.
+
+        Both have shape (weeks, teams, categories).
+        """
+        played = self.rosters[np.newaxis] * self.games[:, np.newaxis]
+        return team_distributions(played @ self._contributions)
+
+    def matchups(self) -> Matchups:
+        """Return the win probabilities of every pair of teams in every week."""
+        means, variances = self.distributions()
+        category_win, win, tie = compare_teams(
+            means[:, :, np.newaxis],
+            variances[:, :, np.newaxis],
+            means[:, np.newaxis],
+            variances[:, np.newaxis],
+        )
+        return Matchups(self.teams, category_win, win, tie)
+
+
+def typical_games(pool: StatPool) -> np.ndarray:
+    """Return the typical games of each player in a week."""
+    return np.where(pool.is_goalie, GOALIE_STARTS_PER_WEEK, SKATER_GAMES_PER_WEEK)
+
+
+def per_game_contributions(pool: StatPool) -> np.ndarray:
+    """Return what each player adds to their team's output in one game.
+
+    Rows hold the category means, the category variances and the shots faced,
+    which all add up over games and players. The save percentage columns are
+    zero because save percentage is found from the team's saves and shots.
+    """
+    rates = pool.per_game()
+    save_percentage = rates[:, SAVE_PERCENTAGE]
+    shots = np.divide(
+        rates[:, SAVES],
+        save_percentage,
+        out=np.zeros(len(pool)),
+        where=save_percentage > 0,
+    )
+    means = rates.copy()
+    means[:, SAVE_PERCENTAGE] = 0
+    variances = means.copy()
+    variances[:, PLUS_MINUS] = PLUS_MINUS_VARIANCE_PER_GAME
+    return np.column_stack([means, variances, shots])
+
+
+def weekly_contributions(pool: StatPool) -> np.ndarray:
+    """Return what each player adds to their team's output in a typical week."""
+    return per_game_contributions(pool) * typical_games(pool)[:, np.newaxis]
+
+
+def team_distributions(sums: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the category means and variances of summed player contributions."""
+    num_categories = len(CATEGORIES)
+    means = sums[..., :num_categories].copy()
+    variances = sums[..., num_categories : 2 * num_categories].copy()  # noqa: E203
+    shots = sums[..., -1]
+    save_percentage = np.divide(
+        means[..., SAVES], shots, out=np.zeros_like(shots), where=shots > 0
+    )
+    means[..., SAVE_PERCENTAGE] = save_percentage
+    variances[..., SAVE_PERCENTAGE] = np.divide(
+        save_percentage * (1 - save_percentage),
+        shots,
+        out=np.zeros_like(shots),
+        where=shots > 0,
+    )
+    return means, variances
+
+
+def compare_teams(
+    means: np.ndarray,
+    variances: np.ndarray,
+    other_means: np.ndarray,
+    other_variances: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the category win, overall win and tie probabilities of teams.
+
+    The arrays broadcast against each other with categories along the last axis.
+    """
+    difference = means - other_means
+    spread = np.sqrt(variances + other_variances)
+    z_score = np.divide(
+        difference, spread, out=np.zeros_like(difference), where=spread > 0
+    )
+    category_win = normal_cdf(z_score)
+    category_win[(spread == 0) & (difference == 0)] = 0.5
+    wins = category_count_distribution(category_win)
+    half = len(CATEGORIES) / 2
+    counts = np.arange(wins.shape[-1])
+    return (
+        category_win,
+        wins[..., counts > half].sum(axis=-1),
+        wins[..., counts == half].sum(axis=-1),
+    )
+
+
+def category_count_distribution(probabilities: np.ndarray) -> np.ndarray:
+    """Return the distribution of the number of categories won.
+
+    The categories are independent with the win probabilities along the last
+    axis, and the result has a last axis of length categories + 1.
+    """
+    distribution = np.zeros(probabilities.shape[:-1] + (probabilities.shape[-1] + 1,))
+    distribution[..., 0] = 1
+    for category in range(probabilities.shape[-1]):
+        probability = probabilities[..., category, np.newaxis]
+        shifted = np.zeros_like(distribution)
+        shifted[..., 1:] = distribution[..., :-1]
+        distribution = distribution * (1 - probability) + shifted * probability
+    return distribution
+
+
+def normal_cdf(values: np.ndarray) -> np.ndarray:
+    """Return the standard normal cumulative distribution function."""
+    return 0.5 * (1 + _erf(values / np.sqrt(2)))
+
+
+def _erf(values: np.ndarray) -> np.ndarray:
+    """Return the error function to within 1.5e-7 (Abramowitz and Stegun 7.1.26)."""
+    sign = np.sign(values)
+    x = np.abs(values)
+    t = 1 / (1 + 0.3275911 * x)
+    polynomial = t * (
+        0.254829592
+        + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429)))
+    )
+    return sign * (1 - polynomial * np.exp(-x * x))
@@ -1,15 +1,20 @@
 """Get OAuth Tokens."""
 
 from pathlib import Path
-
-from yahoo_oauth import OAuth2  # type: ignore
+from typing import TYPE_CHECKING
 
 from faha.utils import json_io
+from faha.utils.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import yahoo_oauth  # type: ignore
+else:
+    yahoo_oauth = lazy_import("yahoo_oauth")
 
 
-def get_client() -> OAuth2:
+def get_client() -> "yahoo_oauth.OAuth2":
     """Authenticate to get OAuth tokens."""
-    oauth = OAuth2(None, None, from_file=token_file())
+    oauth = yahoo_oauth.OAuth2(None, None, from_file=token_file())
     if not oauth.token_is_valid():
         oauth.refresh_access_token()
     return oauth
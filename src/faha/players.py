@@ -2,6 +2,24 @@
 
 from typing import TypedDict
 
+# Yahoo stat IDs of the tracked NHL stats
+STAT_IDS = {
+    "Goals": "1",
+    "Assists": "2",
+    "Plus/Minus": "4",
+    "Powerplay Points": "8",
+    "Shots on Goal": "14",
+    "Faceoffs Won": "16",
+    "Hits": "31",
+    "Blocks": "32",
+    "Games Started": "18",
+    "Wins": "19",
+    "Saves": "25",
+    "Save Percentage": "26",
+    "Shutouts": "27",
+    "Games Played": "29",
+}
+
 GoalieSeasonStats = TypedDict(
     "GoalieSeasonStats",
     {
@@ -42,6 +60,16 @@ Player = TypedDict(
 )
 
 
+DraftPick = TypedDict(
+    "DraftPick",
+    {
+        "Pick": int,
+        "Round": int,
+        "Team Key": str,
+        "Player ID": str,
+    },
+)
+
 Value = TypedDict(
     "Value",
     {"Value": float},
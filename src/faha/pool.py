@@ -0,0 +1,215 @@
+"""Player pools as arrays of stats for vectorized valuation."""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable
+
+import numpy as np
+
+from faha._types import Weights
+from faha.players import GoaliePlayer, OffensePlayer
+
+if TYPE_CHECKING:
+    from faha.league import League
+
+OFFENSE_CATEGORIES = (
+    "Goals",
+    "Assists",
+    "Plus/Minus",
+    "Powerplay Points",
+    "Shots on Goal",
+    "Faceoffs Won",
+    "Hits",
+    "Blocks",
+)
+GOALIE_CATEGORIES = ("Wins", "Saves", "Save Percentage", "Shutouts")
+CATEGORIES = OFFENSE_CATEGORIES + GOALIE_CATEGORIES
+SAVE_PERCENTAGE = CATEGORIES.index("Save Percentage")
+
+
+@dataclass
+class StatPool:
+    """Season stats of a pool of players as arrays.
+
+    Row `i` of every array belongs to `player_ids[i]`. The `totals` columns
+    follow `CATEGORIES`, where save percentage is a rate rather than a total and
+    the categories of the other position type are zero.
+    """
+
+    player_ids: list[str]
+    names: list[str]
+    positions: list[list[str]]
+    nhl_teams: list[str]
+    is_goalie: np.ndarray
+    games: np.ndarray
+    totals: np.ndarray
+    _rows: dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Index the rows by player ID."""
+        self._rows = {player_id: row for row, player_id in enumerate(self.player_ids)}
+
+    @classmethod
+    def from_players(
+        cls, players: Iterable[OffensePlayer | GoaliePlayer]
+    ) -> "StatPool":
+        """Build the pool from players."""
+        players = list(players)
+        totals = np.zeros((len(players), len(CATEGORIES)))
+        games = np.zeros(len(players))
+        is_goalie = np.zeros(len(players), dtype=bool)
+        categories: tuple[str, ...]
+        for row, player in enumerate(players):
+            stats = player["Season Stats"]
+            if player["Position Type"] == "G":
+                is_goalie[row] = True
+                games[row] = stats["Games Started"]  # type: ignore
+                categories = GOALIE_CATEGORIES
+            else:
+                games[row] = stats["Games Played"]  # type: ignore
+                categories = OFFENSE_CATEGORIES
+            for category in categories:
+                column = CATEGORIES.index(category)
+                totals[row, column] = stats[category]  # type: ignore
+        return cls(
+            player_ids=[player["Player ID"] for player in players],
+            names=[player["Name"] for player in players],
+            positions=[player["Positions"] for player in players],
+            nhl_teams=[player["NHL Team"] for player in players],
+            is_goalie=is_goalie,
+            games=games,
+            totals=totals,
+        )
+
+    @classmethod
+    def from_rosters(cls, league: "League") -> tuple["StatPool", dict[str, list[str]]]:
+        """Build the pool of the players on a league's rosters.
+
+        Also returns the IDs of each team's players, leaving out any player
+        missing from the pool.
+        """
+        rosters = league.team_roster(league.all_manager_ids)
+        pool = cls.from_players(
+            player
+            for roster in rosters.values()
+            for player in league.players(list(roster)).values()
+        )
+        return pool, {
+            team: [player_id for player_id in roster if player_id in pool]
+            for team, roster in rosters.items()
+        }
+
+    def __len__(self) -> int:
+        """Return the number of players."""
+        return len(self.player_ids)
+
+    def __contains__(self, player_id: object) -> bool:
+        """Return whether a player is in the pool."""
+        return player_id in self._rows
+
+    def row(self, player_id: str) -> int:
+        """Return the row of a player."""
+        return self._rows[player_id]
+
+    def set_player(self, player: OffensePlayer | GoaliePlayer) -> int:
+        """Replace the stats of a player in the pool, returning their row."""
+        row = self.row(player["Player ID"])
+        replacement = StatPool.from_players([player])
+        self.is_goalie[row] = replacement.is_goalie[0]
+        self.games[row] = replacement.games[0]
+        self.totals[row] = replacement.totals[0]
+        return row
+
+    def players(self) -> dict[str, OffensePlayer | GoaliePlayer]:
+        """Return the players by name, the inverse of `from_players`.
+
+        Stats are left as floats, which the valuation functions accept.
+        """
+        players: dict[str, OffensePlayer | GoaliePlayer] = {}
+        categories: tuple[str, ...]
+        for row, player_id in enumerate(self.player_ids):
+            if self.is_goalie[row]:
+                games_name, categories = "Games Started", GOALIE_CATEGORIES
+            else:
+                games_name, categories = "Games Played", OFFENSE_CATEGORIES
+            stats = {games_name: float(self.games[row])} | {
+                category: float(self.totals[row, CATEGORIES.index(category)])
+                for category in categories
+            }
+            players[self.names[row]] = {  # type: ignore
+                "Player ID": player_id,
+                "Name": self.names[row],
+                "NHL Team": self.nhl_teams[row],
+                "Positions": self.positions[row],
+                "Position Type": "G" if self.is_goalie[row] else "P",
+                "Season Stats": stats,
+            }
+        return players
+
+    def per_game(self) -> np.ndarray:
+        """Return the stats per game, with save percentage left as a rate."""
+        rates = np.divide(
+            self.totals,
+            self.games[:, np.newaxis],
+            out=np.zeros_like(self.totals),
+            where=self.games[:, np.newaxis] > 0,
+        )
+        rates[:, SAVE_PERCENTAGE] = self.totals[:, SAVE_PERCENTAGE]
+        return rates
+
+    def design_matrix(self) -> np.ndarray:
+        """Return the per game stats with a goalie indicator column appended.
+
+        The product with a vector from `weight_vector` gives the values of
+        `faha.value` for every player at once.
+        """
+        return np.column_stack([self.per_game(), self.is_goalie.astype(float)])
+
+    def subset(self, rows: np.ndarray | list[int]) -> "StatPool":
+        """Return the pool of the players in some rows."""
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        return StatPool(
+            player_ids=[self.player_ids[row] for row in rows],
+            names=[self.names[row] for row in rows],
+            positions=[self.positions[row] for row in rows],
+            nhl_teams=[self.nhl_teams[row] for row in rows],
+            is_goalie=self.is_goalie[rows],
+            games=self.games[rows],
+            totals=self.totals[rows],
+        )
+
+
+def weight_vector(weights: Weights) -> np.ndarray:
+    """Return the weights as a vector matching `StatPool.design_matrix`.
+
+    The save percentage function is assumed to be affine, as produced by
+    `calculate_stat_weights`, and is split into a slope on the save percentage
+    column and an intercept on the goalie indicator column.
+    """
+    save_percentage = weights["Save Percentage"]
+    intercept = save_percentage(0.0)
+    vector = [
+        (
+            save_percentage(1.0) - intercept
+            if category == "Save Percentage"
+            else weights[category]  # type: ignore
+        )
+        for category in CATEGORIES
+    ]
+    return np.array(vector + [intercept])
+
+
+def pool_values(pool: StatPool, weights: Weights) -> np.ndarray:
+    """Return the value of every player in a pool."""
+    return pool.design_matrix() @ weight_vector(weights)
+
+
+def pool_points(pool: StatPool, weights: Weights) -> tuple[np.ndarray, np.ndarray]:
+    """Return the fantasy points and points per game of every player in a pool.
+
+    The weights hold the points of each stat, as from `calculate_point_weights`,
+    so the value of a player is their points per game.
+    """
+    points_per_game = pool_values(pool, weights)
+    return points_per_game * pool.games, points_per_game
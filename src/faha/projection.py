@@ -0,0 +1,143 @@
+"""Projected season stats of players from their past seasons."""
+
+import hashlib
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from faha.history import HistoryStore
+from faha.players import GoaliePlayer, OffensePlayer
+from faha.pool import SAVE_PERCENTAGE, StatPool
+
+SEASON_GAMES = 82
+DEFAULT_RECENCY = 0.6
+DEFAULT_REGRESSION_GAMES = 25.0
+
+
+@dataclass
+class Projector:
+    """Project the stats of a pool of players from their past seasons.
+
+    A player's projected per game rates blend their current and past seasons,
+    each weighted by its games played and by `recency` to the power of its age
+    in seasons, together with `regression_games` games at the mean rates of
+    their primary position. Save percentage is blended weighted by games
+    started. Projections are cached by the contents of the current pool.
+    """
+
+    history: dict[int, dict[str, OffensePlayer | GoaliePlayer]]
+    season: int
+    recency: float = DEFAULT_RECENCY
+    regression_games: float = DEFAULT_REGRESSION_GAMES
+    season_games: int = SEASON_GAMES
+    _past: list[tuple[float, StatPool]] = field(init=False, repr=False)
+    _cache: dict[bytes, StatPool] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Build the pools of the past seasons."""
+        self._past = [
+            (
+                self.recency ** (self.season - past),
+                StatPool.from_players(players.values()),
+            )
+            for past, players in self.history.items()
+            if past < self.season
+        ]
+        self._cache = {}
+
+    @classmethod
+    def from_store(cls, store: HistoryStore, season: int, **kwargs) -> "Projector":
+        """Build the projector from the seasons in a history store."""
+        return cls(store.seasons(), season, **kwargs)
+
+    def project(self, pool: StatPool) -> StatPool:
+        """Return the projected stats of every player in a pool.
+
+        The returned pool is shared by every call with the same stats, so copy
+        it with `subset` before changing it.
+        """
+        key = snapshot_key(pool)
+        if key not in self._cache:
+            self._cache[key] = self._project(pool)
+        return self._cache[key]
+
+    def project_players(
+        self, players: dict[str, OffensePlayer | GoaliePlayer]
+    ) -> dict[str, OffensePlayer | GoaliePlayer]:
+        """Return the players by name with their projected season stats."""
+        return self.project(StatPool.from_players(players.values())).players()
+
+    def _project(self, pool: StatPool) -> StatPool:
+        games = pool.games.copy()
+        counts = counting_totals(pool)
+        for weight, past in self._past:
+            rows, past_rows = aligned_rows(pool, past)
+            games[rows] += weight * past.games[past_rows]
+            counts[rows] += weight * counting_totals(past)[past_rows]
+        groups = position_groups(pool)
+        group_games = np.bincount(groups, weights=games)
+        group_counts = np.zeros((len(group_games), counts.shape[1]))
+        np.add.at(group_counts, groups, counts)
+        means = np.divide(
+            group_counts,
+            group_games[:, np.newaxis],
+            out=np.zeros_like(group_counts),
+            where=group_games[:, np.newaxis] > 0,
+        )
+        regressed_games = games + self.regression_games
+        rates = np.divide(
+            counts + self.regression_games * means[groups],
+            regressed_games[:, np.newaxis],
+            out=np.zeros_like(counts),
+            where=regressed_games[:, np.newaxis] > 0,
+        )
+        totals = rates * self.season_games
+        totals[:, SAVE_PERCENTAGE] = rates[:, SAVE_PERCENTAGE]
+        return StatPool(
+            player_ids=list(pool.player_ids),
+            names=list(pool.names),
+            positions=list(pool.positions),
+            nhl_teams=list(pool.nhl_teams),
+            is_goalie=pool.is_goalie.copy(),
+            games=np.full(len(pool), float(self.season_games)),
+            totals=totals,
+        )
+
+
+def snapshot_key(pool: StatPool) -> bytes:
+    """Return a digest of the players and stats of a pool."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\0".join(pool.player_ids).encode())
+    for array in (pool.is_goalie, pool.games, pool.totals):
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.digest()
+
+
+def counting_totals(pool: StatPool) -> np.ndarray:
+    """Return the totals with save percentage weighted by games started."""
+    counts = pool.totals.copy()
+    counts[:, SAVE_PERCENTAGE] *= pool.games
+    return counts
+
+
+def aligned_rows(pool: StatPool, other: StatPool) -> tuple[np.ndarray, np.ndarray]:
+    """Return the rows of the players in both pools, in each of the pools."""
+    pairs = [
+        (row, other.row(player_id))
+        for row, player_id in enumerate(pool.player_ids)
+        if player_id in other
+    ]
+    if not pairs:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+    rows, other_rows = zip(*pairs)
+    return np.array(rows), np.array(other_rows)
+
+
+def position_groups(pool: StatPool) -> np.ndarray:
+    """Return an index of the primary position of every player."""
+    labels = [
+        positions[0] if positions else ("G" if is_goalie else "P")
+        for positions, is_goalie in zip(pool.positions, pool.is_goalie)
+    ]
+    _, groups = np.unique(np.array(labels, dtype=str), return_inverse=True)
+    return groups.reshape(-1).astype(int)
@@ -0,0 +1,100 @@
+"""Rank players by value."""
+
+from bisect import bisect_left, insort
+from typing import Iterable, Optional
+
+OVERALL = ""
+
+
+class RankedIndex:
+    """Players ranked by value, overall and within groups such as positions.
+
+    Every ranking is a list of `(-value, player_id)` kept in sorted order, so the
+    top K players are a slice, a rank is a binary search, and adding, removing
+    or revaluing a player only touches the rankings of that player's groups.
+    """
+
+    def __init__(self) -> None:
+        """Initialize class."""
+        self._rankings: dict[str, list[tuple[float, str]]] = {OVERALL: []}
+        self._entries: dict[str, tuple[float, tuple[str, ...]]] = {}
+
+    @classmethod
+    def from_values(
+        cls, values: Iterable[tuple[str, float, Iterable[str]]]
+    ) -> "RankedIndex":
+        """Build the index from player IDs, values and groups with a single sort."""
+        index = cls()
+        for player_id, value, groups in values:
+            groups = tuple(groups)
+            index._entries[player_id] = (value, groups)
+            for group in (OVERALL, *groups):
+                index._rankings.setdefault(group, []).append((-value, player_id))
+        for ranking in index._rankings.values():
+            ranking.sort()
+        return index
+
+    def __contains__(self, player_id: object) -> bool:
+        """Return whether a player is ranked."""
+        return player_id in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of ranked players."""
+        return len(self._entries)
+
+    def add(self, player_id: str, value: float, groups: Iterable[str] = ()) -> None:
+        """Add a player, replacing any previous entry of the player."""
+        if player_id in self._entries:
+            self.remove(player_id)
+        groups = tuple(groups)
+        self._entries[player_id] = (value, groups)
+        for group in (OVERALL, *groups):
+            insort(self._rankings.setdefault(group, []), (-value, player_id))
+
+    def remove(self, player_id: str) -> None:
+        """Remove a player."""
+        value, groups = self._entries.pop(player_id)
+        for group in (OVERALL, *groups):
+            ranking = self._rankings[group]
+            del ranking[bisect_left(ranking, (-value, player_id))]
+
+    def update(self, player_id: str, value: float) -> None:
+        """Change the value of a player."""
+        self.add(player_id, value, self._entries[player_id][1])
+
+    def value(self, player_id: str) -> float:
+        """Return the value of a player."""
+        return self._entries[player_id][0]
+
+    def groups(self, player_id: str) -> tuple[str, ...]:
+        """Return the groups of a player."""
+        return self._entries[player_id][1]
+
+    def count(self, group: Optional[str] = None) -> int:
+        """Return the number of players ranked in a group, or overall."""
+        return len(self._rankings.get(group or OVERALL, []))
+
+    def top(self, k: int, group: Optional[str] = None) -> list[str]:
+        """Return the IDs of the top K players in a group, or overall."""
+        return [player_id for _, player_id in self._ranking(group)[:k]]
+
+    def top_items(self, k: int, group: Optional[str] = None) -> list[tuple[str, float]]:
+        """Return the IDs and values of the top K players in a group, or overall."""
+        return [(player_id, -value) for value, player_id in self._ranking(group)[:k]]
+
+    def rank(self, player_id: str, group: Optional[str] = None) -> int:
+        """Return the one-based rank of a player in a group, or overall."""
+        value, groups = self._entries[player_id]
+        if group and group not in groups:
+            raise KeyError(f"Player {player_id} is not ranked in {group}")
+        return bisect_left(self._ranking(group), (-value, player_id)) + 1
+
+    def value_at(self, rank: int, group: Optional[str] = None) -> Optional[float]:
+        """Return the value at a one-based rank in a group, or None if unfilled."""
+        ranking = self._ranking(group)
+        if rank < 1 or rank > len(ranking):
+            return None
+        return -ranking[rank - 1][0]
+
+    def _ranking(self, group: Optional[str]) -> list[tuple[float, str]]:
+        return self._rankings.get(group or OVERALL, [])
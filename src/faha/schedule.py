@@ -0,0 +1,345 @@
+"""NHL team schedules over the fantasy weeks of a season.
+
+Rank the free agents by their expected value over the rest of the week with:
+$ rank_streamers 2024 [--date 2024-11-05] [--top 20] [--refresh]
+"""
+
+import argparse
+import datetime
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Optional,
+)
+
+import numpy as np
+
+from faha._types import Weights
+from faha.league import (
+    League,
+    info_dir,
+    shared_player_cache,
+)
+from faha.matchup import SKATER_GAMES_PER_WEEK, typical_games
+from faha.oauth.client import get_client
+from faha.pool import (
+    SAVE_PERCENTAGE,
+    StatPool,
+    pool_values,
+)
+from faha.utils import json_io
+from faha.utils.lazy import lazy_import
+from faha.weights import stat_weights_from_disk
+from faha.yahoo import Yahoo
+
+if TYPE_CHECKING:
+    import requests
+else:
+    requests = lazy_import("requests")
+
+NHL_SCHEDULE_ENDPOINT = "https://api-web.nhle.com/v1/schedule"
+SCHEDULE_DAYS = 7  # days of games in each NHL schedule response
+DEFAULT_SCHEDULE_WORKERS = 4
+YAHOO_TO_NHL = {
+    "CLS": "CBJ",
+    "LA": "LAK",
+    "MON": "MTL",
+    "NJ": "NJD",
+    "SJ": "SJS",
+    "TB": "TBL",
+    "WAS": "WSH",
+}
+
+WeekGames = Callable[[datetime.date], dict[str, list[tuple[str, str]]]]
+
+
+@dataclass
+class SeasonSchedule:
+    """Games of every NHL team on every day of the fantasy weeks of a season.
+
+    Attributes:
+        season: Start year of the season
+        weeks: First and last day of each fantasy week, as YYYY-MM-DD
+        teams: NHL team abbreviations
+        games: Games of each team (rows) on each day (columns) from the first day
+            of the first week to the last day of the last week
+    """
+
+    season: int
+    weeks: list[tuple[str, str]]
+    teams: list[str]
+    games: np.ndarray
+    _rows: dict[str, int] = field(init=False, repr=False)
+    _week_days: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Index the teams and find the week of each day."""
+        self.weeks = [(first, last) for first, last in self.weeks]
+        self._rows = {team: row for row, team in enumerate(self.teams)}
+        self._week_days = np.zeros((self.games.shape[1], len(self.weeks)))
+        for week, (first, last) in enumerate(self.weeks):
+            start = self.day_index(datetime.date.fromisoformat(first))
+            end = self.day_index(datetime.date.fromisoformat(last))
+            self._week_days[start : end + 1, week] = 1.0  # noqa: E203
+
+    @property
+    def first_day(self) -> datetime.date:
+        """Return the first day of the first week."""
+        return datetime.date.fromisoformat(self.weeks[0][0])
+
+    def day_index(self, day: datetime.date) -> int:
+        """Return the column of a day, which is out of range outside the weeks."""
+        return (day - self.first_day).days
+
+    def week_of(self, day: datetime.date) -> int:
+        """Return the index of the week holding a day, or of the next week."""
+        for week, (_, last) in enumerate(self.weeks):
+            if day <= datetime.date.fromisoformat(last):
+                return week
+        raise ValueError(f"{day} is after the last week of the {self.season} season")
+
+    def week_matrix(self, day: Optional[datetime.date] = None) -> np.ndarray:
+        """Return the games of each team (rows) in each week (columns).
+
+        With a day, only the games on or after it are counted, so the column of
+        its week holds the games remaining in that week.
+        """
+        start = 0 if day is None else max(self.day_index(day), 0)
+        return self.games[:, start:] @ self._week_days[start:]
+
+    def games_played(self, day: datetime.date) -> np.ndarray:
+        """Return the games of each team before a day."""
+        return self.games[:, : max(self.day_index(day), 0)].sum(axis=1)
+
+    def team_rows(self, nhl_teams: list[str]) -> np.ndarray:
+        """Return the row of each of Yahoo's NHL team abbreviations, or -1."""
+        return np.array(
+            [self._rows.get(nhl_abbreviation(team), -1) for team in nhl_teams],
+            dtype=int,
+        )
+
+    def write(self, path: Path) -> None:
+        """Write the schedule to a file."""
+        json_io.write(
+            path,
+            {
+                "season": self.season,
+                "weeks": self.weeks,
+                "teams": self.teams,
+                "games": self.games.astype(int).tolist(),
+            },
+        )
+
+    @classmethod
+    def read(cls, path: Path) -> "SeasonSchedule":
+        """Read a schedule written by `write`."""
+        content = json_io.read(path)
+        return cls(
+            season=content["season"],
+            weeks=content["weeks"],
+            teams=content["teams"],
+            games=np.array(content["games"], dtype=float).reshape(
+                len(content["teams"]), -1
+            ),
+        )
+
+
+@dataclass
+class WeeklyPlanner:
+    """Expected games and output of players in each fantasy week of a season.
+
+    A player plays the share of their team's games that they played before the
+    day, capped at one, or a typical share before their team has played. Their
+    expected games in each week are that share of their team's games remaining
+    from the day, so streaming pickups are ranked by looking up the column of
+    the day's week rather than requesting anything per player.
+
+    Attributes:
+        pool: Players to plan for
+        schedule: Schedule of the season
+        day: Day the weeks are planned from
+        games: Expected games of each player (rows) in each week (columns)
+    """
+
+    pool: StatPool
+    schedule: SeasonSchedule
+    day: datetime.date
+    games: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Spread the remaining games of each team over its players."""
+        rows = self.schedule.team_rows(self.pool.nhl_teams)
+        known = rows >= 0
+        team_games = np.zeros((len(self.pool), len(self.schedule.weeks)))
+        team_games[known] = self.schedule.week_matrix(self.day)[rows[known]]
+        played = np.zeros(len(self.pool))
+        played[known] = self.schedule.games_played(self.day)[rows[known]]
+        share = np.divide(
+            self.pool.games,
+            played,
+            out=typical_games(self.pool) / SKATER_GAMES_PER_WEEK,
+            where=played > 0,
+        )
+        self.games = team_games * np.minimum(share, 1.0)[:, np.newaxis]
+
+    @property
+    def week(self) -> int:
+        """Return the index of the week holding the day."""
+        return self.schedule.week_of(self.day)
+
+    def weekly_totals(self, week: Optional[int] = None) -> np.ndarray:
+        """Return the expected stat totals of each player in a week.
+
+        The week is the day's week by default. Save percentage is left as a rate.
+        """
+        week = self.week if week is None else week
+        totals = self.pool.per_game() * self.games[:, week, np.newaxis]
+        totals[:, SAVE_PERCENTAGE] = self.pool.totals[:, SAVE_PERCENTAGE]
+        return totals
+
+    def weekly_values(self, weights: Weights, week: Optional[int] = None) -> np.ndarray:
+        """Return the expected value of each player in a week, the day's by default."""
+        week = self.week if week is None else week
+        return pool_values(self.pool, weights) * self.games[:, week]
+
+    def streamers(
+        self, weights: Weights, count: int = 10
+    ) -> list[tuple[str, float, float]]:
+        """Return the IDs, games and values of the best players for the week's rest."""
+        week = self.week
+        values = self.weekly_values(weights, week)
+        count = min(count, len(values))
+        if not count:
+            return []
+        best = np.argpartition(-values, count - 1)[:count]
+        best = best[np.argsort(-values[best], kind="stable")]
+        return [
+            (
+                self.pool.player_ids[row],
+                float(self.games[row, week]),
+                float(values[row]),
+            )
+            for row in best
+        ]
+
+
+def nhl_abbreviation(team: str) -> str:
+    """Return the NHL abbreviation of one of Yahoo's NHL team abbreviations."""
+    team = team.upper()
+    return YAHOO_TO_NHL.get(team, team)
+
+
+def game_weeks(raw_weeks: dict) -> list[tuple[str, str]]:
+    """Return the first and last day of each week from a game weeks response."""
+    collection = raw_weeks["fantasy_content"]["game"][1]["game_weeks"]
+    weeks = sorted(
+        (int(item["game_week"]["week"]), item["game_week"])
+        for key, item in collection.items()
+        if key != "count"
+    )
+    return [(week["start"], week["end"]) for _, week in weeks]
+
+
+def nhl_week_games(start: datetime.date) -> dict[str, list[tuple[str, str]]]:
+    """Return the away and home teams of the NHL games on each day of a week."""
+    response = requests.get(f"{NHL_SCHEDULE_ENDPOINT}/{start.isoformat()}", timeout=30)
+    response.raise_for_status()
+    return {
+        day["date"]: [
+            (game["awayTeam"]["abbrev"], game["homeTeam"]["abbrev"])
+            for game in day["games"]
+        ]
+        for day in response.json()["gameWeek"]
+    }
+
+
+def fetch_schedule(
+    yahoo_agent: Yahoo,
+    game_key: str,
+    season: int,
+    week_games: WeekGames = nhl_week_games,
+    workers: int = DEFAULT_SCHEDULE_WORKERS,
+) -> SeasonSchedule:
+    """Fetch the fantasy weeks of a game and the NHL games on their days.
+
+    The NHL schedule is requested a week at a time, with the weeks fetched
+    concurrently.
+    """
+    weeks = game_weeks(yahoo_agent.get_game_weeks(game_key))
+    first = datetime.date.fromisoformat(weeks[0][0])
+    num_days = (datetime.date.fromisoformat(weeks[-1][1]) - first).days + 1
+    starts = [
+        first + datetime.timedelta(days=offset)
+        for offset in range(0, num_days, SCHEDULE_DAYS)
+    ]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        days: dict[str, list[tuple[str, str]]] = {}
+        for week in executor.map(week_games, starts):
+            days |= week
+    teams = sorted({team for games in days.values() for game in games for team in game})
+    rows = {team: row for row, team in enumerate(teams)}
+    games = np.zeros((len(teams), num_days))
+    for date, day_games in days.items():
+        column = (datetime.date.fromisoformat(date) - first).days
+        if 0 <= column < num_days:
+            for game in day_games:
+                games[[rows[team] for team in game], column] += 1
+    return SeasonSchedule(season, weeks, teams, games)
+
+
+def load_schedule(
+    league: League, week_games: WeekGames = nhl_week_games, refresh: bool = False
+) -> SeasonSchedule:
+    """Return the schedule of a league's season, fetched once and kept on disk.
+
+    With `refresh`, the schedule is fetched again, such as after games were
+    rescheduled.
+    """
+    file = schedule_file(league.season)
+    if file.exists() and not refresh:
+        return SeasonSchedule.read(file)
+    schedule = fetch_schedule(
+        league.yahoo_agent, league.game_key, league.season, week_games
+    )
+    schedule.write(file)
+    return schedule
+
+
+def schedule_file(season: int) -> Path:
+    """Return the path of the season schedule file."""
+    return info_dir() / f"schedule_{season}.json"
+
+
+def main() -> None:
+    """Rank the free agents by their expected value over the rest of the week."""
+    parser = argparse.ArgumentParser(description="Rank streaming pickups")
+    parser.add_argument("year", type=int, help="season start year")
+    parser.add_argument("--date", type=datetime.date.fromisoformat, default=None)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument(
+        "--refresh", action="store_true", help="fetch the schedule again"
+    )
+    args = parser.parse_args()
+    day = args.date or datetime.date.today()
+    league = League(args.year, Yahoo(get_client()), player_cache=shared_player_cache())
+    schedule = load_schedule(league, refresh=args.refresh)
+    try:
+        schedule.week_of(day)
+    except ValueError as error:
+        parser.error(str(error))
+    pool = StatPool.from_players(league.available_players().values())
+    planner = WeeklyPlanner(pool, schedule, day)
+    weights = stat_weights_from_disk(args.year)
+    for player_id, games, value in planner.streamers(weights, args.top):
+        row = pool.row(player_id)
+        sys.stdout.write(
+            f"{pool.names[row]:<28}{pool.nhl_teams[row]:<5}{games:5.1f}{value:8.2f}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Search players by name."""
+
+import heapq
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    Iterable,
+    NamedTuple,
+    Optional,
+)
+
+NGRAM_SIZE = 3
+MIN_SIMILARITY = 0.3
+FUZZY_MARGIN = 0.15
+EXACT = 2
+PREFIX = 1
+FUZZY = 0
+
+
+class SearchMatch(NamedTuple):
+    """A player matching a search, with how closely their name matches."""
+
+    player_id: str
+    tier: int
+    similarity: float
+
+
+@dataclass
+class PlayerSearchIndex:
+    """Names of players indexed for prefix and fuzzy search.
+
+    Names are folded to lowercase without accents or punctuation. The full names
+    and each word of the names are kept sorted, so a prefix is a binary search,
+    and the n-grams of the names map to the players containing them, so fuzzy
+    matches only count the n-grams shared with the query.
+    """
+
+    names: dict[str, str]
+    _prefixes: list[tuple[str, str]]
+    _ngrams: dict[str, list[str]]
+    _num_ngrams: dict[str, int]
+
+    @classmethod
+    def from_names(cls, names: Iterable[tuple[str, str]]) -> "PlayerSearchIndex":
+        """Build the index from player IDs and names."""
+        folded = {player_id: fold(name) for player_id, name in names}
+        prefixes = sorted(
+            {
+                (key, player_id)
+                for player_id, name in folded.items()
+                for key in (name, *name.split())
+            }
+        )
+        ngrams: dict[str, list[str]] = {}
+        num_ngrams = {}
+        for player_id, name in folded.items():
+            grams = name_ngrams(name)
+            num_ngrams[player_id] = len(grams)
+            for gram in grams:
+                ngrams.setdefault(gram, []).append(player_id)
+        return cls(folded, prefixes, ngrams, num_ngrams)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        include: Optional[Callable[[str], bool]] = None,
+    ) -> list[SearchMatch]:
+        """Return the players best matching a name or the start of a name.
+
+        Exact matches rank first, then players with a name or word starting with
+        the query, then players sharing enough n-grams with the query. Within a
+        tier, players are ranked by their n-gram similarity to the query.
+        """
+        folded = fold(query)
+        if not folded:
+            return []
+        tiers: dict[str, int] = {}
+        start = bisect_left(self._prefixes, (folded, ""))
+        for key, player_id in self._prefixes[start:]:
+            if not key.startswith(folded):
+                break
+            tier = EXACT if key == folded == self.names[player_id] else PREFIX
+            tiers[player_id] = max(tier, tiers.get(player_id, FUZZY))
+        grams = name_ngrams(folded)
+        shared = Counter(
+            player_id for gram in grams for player_id in self._ngrams.get(gram, ())
+        )
+        matches = []
+        for player_id in tiers.keys() | shared.keys():
+            if include is not None and not include(player_id):
+                continue
+            similarity = (
+                2 * shared[player_id] / (len(grams) + self._num_ngrams[player_id])
+            )
+            tier = tiers.get(player_id, FUZZY)
+            if tier == FUZZY and similarity < MIN_SIMILARITY:
+                continue
+            matches.append(SearchMatch(player_id, tier, similarity))
+        return heapq.nlargest(limit, matches, key=lambda match: match[1:])
+
+
+def best_match(matches: list[SearchMatch]) -> Optional[SearchMatch]:
+    """Return the match a search resolves to, or None if it is ambiguous.
+
+    A search resolves when a single player is in the best tier. When only fuzzy
+    matches are found, the closest must also be clearly closer than the next.
+    """
+    if not matches:
+        return None
+    best, *others = matches
+    if not others or others[0].tier < best.tier:
+        return best
+    if best.tier == FUZZY and best.similarity - others[0].similarity >= FUZZY_MARGIN:
+        return best
+    return None
+
+
+def fold(name: str) -> str:
+    """Return a name in lowercase without accents, punctuation or extra spaces."""
+    decomposed = unicodedata.normalize("NFKD", name.casefold())
+    letters = "".join(
+        char if char.isalnum() else " "
+        for char in decomposed
+        if not unicodedata.combining(char) and char not in "'’."
+    )
+    return " ".join(letters.split())
+
+
+def name_ngrams(name: str) -> set[str]:
+    """Return the n-grams of a folded name, padded at the ends."""
+    padded = f" {name} "
+    return {
+        padded[index : index + NGRAM_SIZE]  # noqa: E203
+        for index in range(max(len(padded) - NGRAM_SIZE + 1, 1))
+    }
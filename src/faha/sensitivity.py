@@ -0,0 +1,176 @@
+"""Sensitivity of player values and rankings to the stat weights."""
+
+import itertools
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from faha._types import Weights
+from faha.players import GoaliePlayer, OffensePlayer
+from faha.pool import (
+    CATEGORIES,
+    StatPool,
+    weight_vector,
+)
+from faha.weights import SAVE_PERCENTAGE_FLOOR
+
+
+@dataclass
+class WeightGrid:
+    """Choices made when calculating the stat weights, varied over a grid.
+
+    The defaults are the choices of `calculate_stat_weights`.
+    """
+
+    top_teams: Sequence[int] = (2,)
+    plus_minus_weight: Sequence[float] = (1 / 3,)
+    shutout_divisor: Sequence[float] = (3,)
+    save_percentage_scale: Sequence[float] = (60,)
+
+    def variants(self) -> list[dict[str, float]]:
+        """Return the choices of every variant in the grid."""
+        names = (
+            "top_teams",
+            "plus_minus_weight",
+            "shutout_divisor",
+            "save_percentage_scale",
+        )
+        return [
+            dict(zip(names, choices))
+            for choices in itertools.product(*(getattr(self, name) for name in names))
+        ]
+
+    def weight_matrix(self, all_stats: dict) -> np.ndarray:
+        """Return the weight vectors of every variant as rows of a matrix.
+
+        Rows follow `variants` and match `StatPool.design_matrix`. The team
+        averages are computed once per `top_teams` and broadcast over the
+        remaining choices.
+        """
+        sorted_stats = np.sort(
+            np.array([all_stats[category] for category in CATEGORIES], dtype=float),
+            axis=1,
+        )
+        base = np.array(
+            [
+                sorted_stats[:, -top:].mean(axis=1)
+                for top in self.top_teams
+                for _ in range(
+                    len(self.plus_minus_weight)
+                    * len(self.shutout_divisor)
+                    * len(self.save_percentage_scale)
+                )
+            ]
+        )
+        matrix = base[:, [CATEGORIES.index("Goals")]] / base
+        variants = self.variants()
+        plus_minus, shutout_divisor, scale = (
+            np.array([variant[name] for variant in variants])
+            for name in (
+                "plus_minus_weight",
+                "shutout_divisor",
+                "save_percentage_scale",
+            )
+        )
+        matrix[:, CATEGORIES.index("Plus/Minus")] = plus_minus
+        matrix[:, CATEGORIES.index("Shutouts")] /= shutout_divisor
+        matrix[:, CATEGORIES.index("Save Percentage")] = scale
+        return np.column_stack([matrix, -scale * SAVE_PERCENTAGE_FLOOR])
+
+
+@dataclass
+class RankStability:
+    """Stability of the player rankings across weight variants.
+
+    Attributes:
+        ranks: One-based rank of every player (columns) under every variant (rows)
+        mean_rank: Mean rank of each player over the variants
+        rank_std: Standard deviation of the rank of each player
+        best_rank: Best rank of each player
+        worst_rank: Worst rank of each player
+        spearman: Rank correlation of each variant with the baseline variant
+        top_overlap: Fraction of the baseline top players in each variant's top
+    """
+
+    ranks: np.ndarray
+    mean_rank: np.ndarray
+    rank_std: np.ndarray
+    best_rank: np.ndarray
+    worst_rank: np.ndarray
+    spearman: np.ndarray
+    top_overlap: np.ndarray
+
+
+@dataclass
+class Sensitivity:
+    """Values of a pool of players under many weight variants."""
+
+    player_ids: list[str]
+    values: np.ndarray
+    stability: RankStability
+
+
+def weight_matrix(weight_sets: Iterable[Weights]) -> np.ndarray:
+    """Return weight sets as rows of a matrix matching `StatPool.design_matrix`."""
+    return np.array([weight_vector(weights) for weights in weight_sets])
+
+
+def value_matrix(pool: StatPool, weights: np.ndarray) -> np.ndarray:
+    """Return the value of every player (columns) under every weight row."""
+    return weights @ pool.design_matrix().T
+
+
+def rank_rows(values: np.ndarray) -> np.ndarray:
+    """Return the one-based rank of every column within each row, highest first."""
+    order = np.argsort(-values, axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(
+        ranks,
+        order,
+        np.broadcast_to(np.arange(1, values.shape[1] + 1), order.shape),
+        axis=1,
+    )
+    return ranks
+
+
+def rank_stability(
+    values: np.ndarray, baseline: int = 0, top: int = 50
+) -> RankStability:
+    """Return the stability of the rankings given by rows of player values."""
+    num_variants, num_players = values.shape
+    ranks = rank_rows(values)
+    squared_differences = ((ranks - ranks[baseline]) ** 2).sum(axis=1)
+    spearman = 1 - 6 * squared_differences / max(num_players * (num_players**2 - 1), 1)
+    top = min(top, num_players)
+    in_top = ranks <= top
+    top_overlap = (in_top & in_top[baseline]).sum(axis=1) / max(top, 1)
+    return RankStability(
+        ranks=ranks,
+        mean_rank=ranks.mean(axis=0),
+        rank_std=ranks.std(axis=0),
+        best_rank=ranks.min(axis=0),
+        worst_rank=ranks.max(axis=0),
+        spearman=spearman if num_variants else np.empty(0),
+        top_overlap=top_overlap,
+    )
+
+
+def sensitivity_analysis(
+    players: Iterable[OffensePlayer | GoaliePlayer],
+    weights: np.ndarray,
+    baseline: int = 0,
+    top: int = 50,
+) -> Sensitivity:
+    """Value a pool of players under every row of a weight matrix at once.
+
+    Args:
+        players: The pool of players
+        weights: Weight vectors as rows, from `weight_matrix` or
+            `WeightGrid.weight_matrix`
+        baseline: Row of the weights the rankings are compared with
+        top: Number of top players compared between rankings
+    """
+    pool = StatPool.from_players(players)
+    values = value_matrix(pool, weights)
+    return Sensitivity(pool.player_ids, values, rank_stability(values, baseline, top))
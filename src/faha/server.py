@@ -0,0 +1,264 @@
+"""Local HTTP/JSON server of player rankings and a shared draft board.
+
+Execute with:
+$ serve_rankings 2024 --mode draft --port 8766
+
+The board is held in memory, so every client shares the same state:
+GET /top?position=C&n=20[&replacement=1]  top remaining players
+GET /players/{id}                         a player and their ranks
+GET /search?q=name                        remaining players matching a name
+POST /players/{id}/delete                 take a player off the board
+POST /undo                                restore the last deletion
+GET /status                               remaining and deleted counts
+"""
+
+import argparse
+import json
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Optional,
+    get_args,
+)
+from urllib.parse import (
+    parse_qs,
+    unquote,
+    urlsplit,
+)
+
+from faha._types import Mode
+from faha.board import DraftBoard, player_positions
+from faha.daily import (
+    WINDOWS,
+    DailyStatStore,
+    daily_dir,
+)
+from faha.league import League, shared_player_cache
+from faha.oauth.client import get_client
+from faha.tables import Positions
+from faha.utils import serving
+from faha.value import calculate_player_values
+from faha.weights import stat_weights_from_disk
+from faha.yahoo import Yahoo
+
+DEFAULT_PORT = 8766
+DEFAULT_TOP = 20
+_PLAYER_PATH = re.compile(r"/players/(?P<player_id>[^/]+)$")
+_DELETE_PATH = re.compile(r"/players/(?P<player_id>[^/]+)/delete$")
+
+
+class NotFound(Exception):
+    """Requested resource that does not exist."""
+
+
+class BadRequest(Exception):
+    """Request with invalid parameters."""
+
+
+class RankingsServer(ThreadingHTTPServer):
+    """HTTP server answering ranking queries from a draft board in memory.
+
+    Requests are handled in threads and take a lock around the board, so deletes
+    and undos from any client are seen by every other client.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, board: DraftBoard, host: str = "127.0.0.1", port: int = 0):
+        """Initialize class."""
+        super().__init__((host, port), RankingsHandler)
+        self.board = board
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        """Return the base URL of the server."""
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def top(self, query: dict[str, str]) -> list[dict]:
+        """Return the top remaining players, overall or at a position."""
+        position = _position(query.get("position"))
+        count = _integer(query.get("n", str(DEFAULT_TOP)))
+        if query.get("replacement") in ("1", "true"):
+            if self.board.valuation is None:
+                raise BadRequest("Replacement is not tracked by this server")
+            return self.board.top_over_replacement(count, position)
+        return self.board.top(count, position)
+
+    def player(self, player_id: str) -> dict:
+        """Return a player with their ranks if they remain on the board."""
+        if player_id not in self.board.players:
+            raise NotFound(f"No player with ID {player_id}")
+        player = dict(self.board.players[player_id])
+        player["Remaining"] = player_id in self.board
+        if player["Remaining"]:
+            player["Rank"] = self.board.rank(player_id)
+            player["Position Ranks"] = {
+                position.value: self.board.rank(player_id, position)
+                for position in player_positions(player)
+            }
+        return player
+
+    def search(self, query: dict[str, str]) -> list[dict]:
+        """Return the remaining players best matching a name."""
+        count = _integer(query.get("n", "5"))
+        return [
+            self.board.players[match.player_id] | {"Match": match._asdict()}
+            for match in self.board.search(query.get("q", ""), count)
+        ]
+
+    def delete(self, player_id: str) -> dict:
+        """Remove a player from the board."""
+        if player_id not in self.board:
+            raise NotFound(f"No player with ID {player_id} on the board")
+        return self.board.delete(player_id)
+
+    def undo(self) -> Optional[dict]:
+        """Restore the most recently deleted player."""
+        return self.board.undo()
+
+    def status(self) -> dict:
+        """Return the number of remaining and deleted players."""
+        return {
+            "remaining": len(self.board.rankings),
+            "deleted": len(self.board.deleted),
+            "replacement": self.board.valuation is not None,
+        }
+
+
+class RankingsHandler(BaseHTTPRequestHandler):
+    """Request handler of the rankings server."""
+
+    server: RankingsServer
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Answer a query."""
+        path, query = self._route()
+        server = self.server
+        routes: dict[str, Callable[[], Any]] = {
+            "/top": lambda: server.top(query),
+            "/search": lambda: server.search(query),
+            "/status": server.status,
+        }
+        if path in routes:
+            self._answer(routes[path])
+        elif match := _PLAYER_PATH.match(path):
+            self._answer(lambda: server.player(match["player_id"]))
+        else:
+            self._send_json(404, {"error": f"Unknown path: {path}"})
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """Change the board."""
+        path, _ = self._route()
+        server = self.server
+        if path == "/undo":
+            self._answer(server.undo)
+        elif match := _DELETE_PATH.match(path):
+            self._answer(lambda: server.delete(match["player_id"]))
+        else:
+            self._send_json(404, {"error": f"Unknown path: {path}"})
+
+    def _route(self) -> tuple[str, dict[str, str]]:
+        url = urlsplit(self.path)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        return unquote(url.path).rstrip("/") or "/", query
+
+    def _answer(self, handler: Callable[[], Any]) -> None:
+        try:
+            with self.server.lock:
+                result = handler()
+        except NotFound as error:
+            self._send_json(404, {"error": str(error)})
+        except BadRequest as error:
+            self._send_json(400, {"error": str(error)})
+        else:
+            self._send_json(200, result)
+
+    def _send_json(self, status: int, content: Any) -> None:
+        body = json.dumps(content, default=_json_default).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:  # pylint: disable=W0622
+        """Silence the per-request log."""
+
+
+def serve(board: DraftBoard, port: int = 0) -> ContextManager[RankingsServer]:
+    """Run a rankings server in a background thread."""
+    return serving.in_thread(RankingsServer(board, port=port))
+
+
+def load_board(year: int, mode: Mode, window: Optional[int] = None) -> DraftBoard:
+    """Value the players as the app does and put them on a board.
+
+    In draft mode the board holds the players taken by teams, and otherwise the
+    available players. With a window, the players are valued on their recent
+    stats from the daily stats store instead.
+    """
+    weights = stat_weights_from_disk(year)
+    valued: dict = {}
+    if window is not None:
+        players = DailyStatStore(daily_dir()).window_players(window)
+        valued |= calculate_player_values(players, weights)
+    else:
+        league = League(year, Yahoo(get_client()), player_cache=shared_player_cache())
+        for page in league.iter_players(
+            "T" if mode == "draft" else "A", weights=weights
+        ):
+            valued |= page
+    return DraftBoard.from_players(valued.values())
+
+
+def _position(value: Optional[str]) -> Optional[Positions]:
+    if value is None:
+        return None
+    try:
+        return Positions(value.upper())
+    except ValueError as error:
+        raise BadRequest(f"Unknown position: {value}") from error
+
+
+def _integer(value: str) -> int:
+    try:
+        return max(int(value), 0)
+    except ValueError as error:
+        raise BadRequest(f"Not a number: {value}") from error
+
+
+def _json_default(value: Any) -> Any:
+    """Convert NumPy scalars, which the standard JSON encoder rejects."""
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def main() -> None:
+    """Serve the rankings of a season until interrupted."""
+    parser = argparse.ArgumentParser(description="Serve player rankings over HTTP")
+    parser.add_argument("year", type=int)
+    parser.add_argument("-m", "--mode", choices=get_args(Mode), default="season")
+    parser.add_argument("-w", "--window", type=int, choices=WINDOWS, default=None)
+    parser.add_argument("--replacement", action="store_true")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+    board = load_board(args.year, args.mode, args.window)
+    if args.replacement:
+        league = League(args.year, Yahoo(get_client()))
+        board.track_replacement(league.roster_slots, league.num_managers)
+    server = RankingsServer(board, args.host, args.port)
+    sys.stdout.write(f"Serving {len(board.rankings)} players at {server.url}\n")
+    serving.until_interrupted(server)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""Monte Carlo simulation of league drafts.
+
+Execute with:
+$ simulate_draft YEAR --team 5 --drafts 10000
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
+
+from faha.league import League, shared_player_cache
+from faha.oauth.client import get_client
+from faha.vorp import (
+    BENCH_POSITION,
+    RESERVE_POSITIONS,
+    eligibility_matrix,
+    starter_slots,
+)
+from faha.weights import stat_weights_from_disk
+from faha.yahoo import Yahoo
+
+MIN_REPORTED_AVAILABILITY = 0.05
+
+
+@dataclass
+class DraftSimulation:
+    """Availability of players at the picks of one team over simulated drafts.
+
+    Attributes:
+        player_ids: IDs of the simulated players
+        picks: One-based overall numbers of the team's picks
+        availability: Fraction of drafts in which each player (columns) was still
+            available at each of the team's picks (rows)
+        num_drafts: Number of simulated drafts
+    """
+
+    player_ids: list[str]
+    picks: np.ndarray
+    availability: np.ndarray
+    num_drafts: int
+
+    def probability(self, player_id: str, pick: int) -> float:
+        """Return the probability a player is available at an overall pick."""
+        row = int(np.flatnonzero(self.picks == pick)[0])
+        return float(self.availability[row, self.player_ids.index(player_id)])
+
+
+def draft_order(num_teams: int, rounds: int, snake: bool = True) -> np.ndarray:
+    """Return the zero-based index of the team making each pick."""
+    order = np.tile(np.arange(num_teams), (rounds, 1))
+    if snake:
+        order[1::2] = order[1::2, ::-1]
+    return order.ravel()
+
+
+def draft_rounds(roster_slots: dict[str, int]) -> int:
+    """Return the number of rounds, one for each roster slot outside reserve."""
+    return sum(
+        count
+        for position, count in roster_slots.items()
+        if position not in RESERVE_POSITIONS
+    )
+
+
+def position_caps(roster_slots: dict[str, int]) -> np.ndarray:
+    """Return the most players a team drafts at each position.
+
+    A team fills its starter slots, with a share of the flexible slots, and may
+    add as many more as it has bench slots.
+    """
+    return np.ceil(starter_slots(roster_slots)) + roster_slots.get(BENCH_POSITION, 0)
+
+
+def simulate_drafts(
+    players: Iterable[dict],
+    roster_slots: dict[str, int],
+    num_teams: int,
+    team: int,
+    num_drafts: int = 10000,
+    noise: float = 0.25,
+    batch_size: int = 500,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    snake: bool = True,
+) -> DraftSimulation:
+    """Simulate drafts and return availability of players at a team's picks.
+
+    Other teams take the available player with the highest noisy value that they
+    have room for at one of the player's positions. The noise is drawn once per
+    draft and player, with a standard deviation of `noise` times the spread of
+    the values, so values can be replaced with the negative of ADPs. The team
+    itself takes the available player with the highest value. Drafts run in
+    batches as array operations, and batches are spread over a process pool.
+
+    Args:
+        players: Valued players with IDs and positions
+        roster_slots: Roster slots of a team
+        num_teams: Number of teams in the draft
+        team: Zero-based draft slot of the team
+        num_drafts: Number of drafts to simulate
+        noise: Standard deviation of the value noise relative to the value spread
+        batch_size: Number of drafts simulated together
+        workers: Number of processes, or the number of CPUs if None
+        seed: Seed of the random number generator
+        snake: Whether the pick order reverses every round
+    """
+    players = sorted(players, key=lambda player: player["Value"], reverse=True)
+    order = draft_order(num_teams, draft_rounds(roster_slots), snake)
+    # players beyond a margin past the number of picks are never drafted
+    players = players[: 2 * len(order)]
+    values = np.array([player["Value"] for player in players], dtype=float)
+    eligibility = eligibility_matrix([player["Positions"] for player in players])
+    caps = position_caps(roster_slots)
+    batches = [
+        min(batch_size, num_drafts - start)
+        for start in range(0, num_drafts, batch_size)
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(len(batches))
+    arguments = [
+        (values, eligibility, caps, order, team, noise, size, batch_seed)
+        for size, batch_seed in zip(batches, seeds)
+    ]
+    workers = min(workers or os.cpu_count() or 1, len(batches)) or 1
+    if workers == 1:
+        counts = [_simulate_batch(*batch) for batch in arguments]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            counts = list(executor.map(_simulate_batch, *zip(*arguments)))
+    availability = np.sum(counts, axis=0) / max(num_drafts, 1)
+    return DraftSimulation(
+        player_ids=[player["Player ID"] for player in players],
+        picks=np.flatnonzero(order == team) + 1,
+        availability=availability,
+        num_drafts=num_drafts,
+    )
+
+
+def _simulate_batch(
+    values: np.ndarray,
+    eligibility: np.ndarray,
+    caps: np.ndarray,
+    order: np.ndarray,
+    team: int,
+    noise: float,
+    num_drafts: int,
+    seed: np.random.SeedSequence,
+) -> np.ndarray:
+    """Return how often each player is available at each of the team's picks."""
+    rng = np.random.default_rng(seed)
+    num_players = len(values)
+    rows = np.arange(num_drafts)
+    scores = values + noise * values.std() * rng.standard_normal(
+        (num_drafts, num_players)
+    )
+    available = np.ones((num_drafts, num_players), dtype=bool)
+    counts = np.zeros((num_drafts, order.max() + 1, len(caps)))
+    eligible = eligibility.T.astype(float)
+    availability = np.zeros((np.count_nonzero(order == team), num_players))
+    team_pick = 0
+    for picking in order:
+        open_positions = counts[:, picking] < caps
+        allowed = available & (open_positions @ eligible > 0)
+        allowed |= available & ~allowed.any(axis=1, keepdims=True)
+        if picking == team:
+            availability[team_pick] = available.sum(axis=0)
+            team_pick += 1
+            ranking = np.broadcast_to(values, available.shape)
+        else:
+            ranking = scores
+        choices = np.where(allowed, ranking, -np.inf).argmax(axis=1)
+        available[rows, choices] = False
+        chosen = eligibility[choices]
+        position = np.where(
+            (chosen & open_positions).any(axis=1),
+            (chosen & open_positions).argmax(axis=1),
+            chosen.argmax(axis=1),
+        )
+        counts[rows, picking, position] += 1
+    return availability
+
+
+def main() -> None:
+    """Simulate drafts of a league and write availability at a team's picks."""
+    parser = argparse.ArgumentParser(description="Simulate drafts of a league")
+    parser.add_argument("year", type=int)
+    parser.add_argument("--team", type=int, required=True, help="one-based slot")
+    parser.add_argument("--drafts", type=int, default=10000)
+    parser.add_argument("--noise", type=float, default=0.25)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    league = League(args.year, Yahoo(get_client()), player_cache=shared_player_cache())
+    players = league.iter_players("ALL", weights=stat_weights_from_disk(args.year))
+    pool = {name: player for page in players for name, player in page.items()}
+    simulation = simulate_drafts(
+        pool.values(),
+        league.roster_slots,
+        league.num_managers,
+        args.team - 1,
+        num_drafts=args.drafts,
+        noise=args.noise,
+        seed=args.seed,
+    )
+    names = {player["Player ID"]: player["Name"] for player in pool.values()}
+    for pick, availability in zip(simulation.picks, simulation.availability):
+        sys.stdout.write(f"Pick {pick}\n")
+        # players are in order of value, so list the best likely to be available
+        columns = np.flatnonzero(availability >= MIN_REPORTED_AVAILABILITY)
+        for column in columns[: args.top]:
+            player_id = simulation.player_ids[column]
+            sys.stdout.write(f"  {availability[column]:6.1%}  {names[player_id]}\n")
+
+
+if __name__ == "__main__":
+    main()
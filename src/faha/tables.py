@@ -0,0 +1,70 @@
+"""Tabulate valued players by position."""
+
+import heapq
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from faha.utils.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import pandas as pd
+else:
+    pd = lazy_import("pandas")
+
+
+class Positions(StrEnum):
+    """Enumeration of player positions."""
+
+    CENTER = "C"
+    WINGER = "W"
+    DEFENSEMAN = "D"
+    GOALIE = "G"
+
+
+Data = dict[Positions, "pd.DataFrame"]
+
+
+def build_player_frame(players: dict) -> "pd.DataFrame":
+    """Return a data frame with one row per valued player."""
+    return pd.DataFrame(players).transpose()
+
+
+def split_by_position(data_in_frame: "pd.DataFrame") -> Data:
+    """Split the players into tables for each position sorted by value."""
+    return {
+        pos: data_in_frame[is_position(pos.value, data_in_frame)].sort_values(
+            by="Value", ascending=False
+        )
+        for pos in Positions
+    }
+
+
+def top_by_position(players: dict, count: int) -> dict[Positions, list[dict]]:
+    """Return the highest valued players at each position in O(n log count)."""
+    return {
+        pos: heapq.nlargest(
+            count,
+            (
+                player
+                for player in players.values()
+                if player_plays_position(pos.value, player["Positions"])
+            ),
+            key=lambda player: player["Value"],
+        )
+        for pos in Positions
+    }
+
+
+def is_position(position: str, dataframe: "pd.DataFrame") -> list[bool]:
+    """List booleans matching a particular position."""
+    return [
+        player_plays_position(position, positions)
+        for positions in dataframe["Positions"]
+    ]
+
+
+def player_plays_position(position: str, positions: list[str]) -> bool:
+    """Return whether a player with the eligible positions plays a position."""
+    if position == Positions.WINGER:
+        return "LW" in positions or "RW" in positions
+    return position in positions
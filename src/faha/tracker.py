@@ -0,0 +1,84 @@
+"""Follow the picks of a live Yahoo draft."""
+
+import queue
+import threading
+from typing import Iterable, Optional
+
+from faha.board import DraftBoard
+from faha.league import League
+from faha.players import DraftPick
+
+DEFAULT_POLL_INTERVAL = 10.0
+
+
+class DraftTracker:
+    """Picks of a league draft, remembering the last pick already seen."""
+
+    def __init__(self, league: League, cursor: int = 0) -> None:
+        """Initialize class."""
+        self.league = league
+        self.cursor = cursor
+
+    def poll(self) -> list[DraftPick]:
+        """Return the picks made since the last poll and move the cursor past them."""
+        picks = [
+            pick for pick in self.league.draft_results() if pick["Pick"] > self.cursor
+        ]
+        if picks:
+            self.cursor = picks[-1]["Pick"]
+        return picks
+
+
+class DraftPoller(threading.Thread):
+    """Background thread that polls a draft and queues the new picks.
+
+    Failed polls are kept in `error` and retried at the next interval, so a
+    dropped connection, a throttled request or a malformed response does not
+    stop the sync.
+    """
+
+    def __init__(
+        self, tracker: DraftTracker, interval: float = DEFAULT_POLL_INTERVAL
+    ) -> None:
+        """Initialize class."""
+        super().__init__(name="draft-poller", daemon=True)
+        self.tracker = tracker
+        self.interval = interval
+        self.picks: queue.Queue[DraftPick] = queue.Queue()
+        self.error: Optional[Exception] = None
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        """Poll until stopped."""
+        while not self._stopped.is_set():
+            try:
+                picks = self.tracker.poll()
+            except Exception as error:  # pylint: disable=W0718
+                self.error = error
+            else:
+                self.error = None
+                for pick in picks:
+                    self.picks.put(pick)
+            self._stopped.wait(self.interval)
+
+    def stop(self) -> None:
+        """Stop polling after the current request."""
+        self._stopped.set()
+
+    def drain(self) -> list[DraftPick]:
+        """Return the queued picks."""
+        picks = []
+        while True:
+            try:
+                picks.append(self.picks.get_nowait())
+            except queue.Empty:
+                return picks
+
+
+def apply_picks(board: DraftBoard, picks: Iterable[DraftPick]) -> list[dict]:
+    """Delete picked players from the board, returning the players deleted.
+
+    Players are matched by ID, and picks of players not on the board, such as
+    those already deleted by hand, are skipped.
+    """
+    return board.delete_many(pick["Player ID"] for pick in picks)
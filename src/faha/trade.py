@@ -0,0 +1,256 @@
+"""Evaluate and search for trades between teams."""
+
+import itertools
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from faha._types import Weights
+from faha.league import League
+from faha.matchup import (
+    compare_teams,
+    team_distributions,
+    weekly_contributions,
+)
+from faha.pool import StatPool, pool_values
+from faha.ranking import RankedIndex
+from faha.value import GOALIE_SHARE, OFFENSE_SHARE
+
+
+@dataclass
+class TradeResult:
+    """Effect of a trade on the two teams involved.
+
+    Attributes:
+        gives: Player IDs each team gives away
+        value_change: Change in each team's value, as in `League.team_values`
+        strength_change: Change in each team's mean probability of winning a
+            matchup against the other teams, counting ties as half a win
+        ranks: Rank of each team by value before and after the trade
+    """
+
+    gives: dict[str, list[str]]
+    value_change: dict[str, float]
+    strength_change: dict[str, float]
+    ranks: dict[str, tuple[int, int]]
+
+
+@dataclass
+class TradeAnalyzer:
+    """Teams as cached sums of their players' contributions.
+
+    Each player has a weighted value and a vector of weekly category
+    contributions, and each team keeps the sums over its roster. A trade only
+    changes the sums and ranking entries of the two teams involved, and whole
+    families of trades are evaluated at once as arrays.
+    """
+
+    pool: StatPool
+    weights: Weights
+    rosters: dict[str, list[str]]
+    _values: np.ndarray = field(init=False, repr=False)
+    _contributions: np.ndarray = field(init=False, repr=False)
+    _sums: np.ndarray = field(init=False, repr=False)
+    _team_values: dict[str, float] = field(init=False, repr=False)
+    _rankings: RankedIndex = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Calculate the player contributions and team sums."""
+        shares = np.where(self.pool.is_goalie, GOALIE_SHARE, OFFENSE_SHARE)
+        self._values = pool_values(self.pool, self.weights) * shares
+        self._contributions = weekly_contributions(self.pool)
+        self._sums = np.array(
+            [self._contributions[self._rows(team)].sum(axis=0) for team in self.teams]
+        ).reshape(len(self.teams), self._contributions.shape[1])
+        self._team_values = {
+            team: float(self._values[self._rows(team)].sum()) for team in self.teams
+        }
+        self._rankings = RankedIndex.from_values(
+            (team, value, ()) for team, value in self._team_values.items()
+        )
+
+    @classmethod
+    def from_league(cls, league: League, weights: Weights) -> "TradeAnalyzer":
+        """Build the analyzer from the current rosters of a league."""
+        pool, rosters = StatPool.from_rosters(league)
+        return cls(pool, weights, rosters)
+
+    @property
+    def teams(self) -> list[str]:
+        """Return the team names."""
+        return list(self.rosters)
+
+    def team_value(self, team: str) -> float:
+        """Return the value of a team."""
+        return self._team_values[team]
+
+    def rank(self, team: str) -> int:
+        """Return the rank of a team by value."""
+        return self._rankings.rank(team)
+
+    def strengths(self) -> dict[str, float]:
+        """Return each team's mean probability of winning against the others."""
+        return dict(zip(self.teams, _strengths(self._sums)))
+
+    def evaluate(
+        self, team: str, gives: list[str], other: str, receives: list[str]
+    ) -> TradeResult:
+        """Return the effect of a team trading players for players of another."""
+        value_change, delta = self._trade_change(team, gives, other, receives)
+        first, second = self.teams.index(team), self.teams.index(other)
+        sums = self._sums.copy()
+        sums[first] += delta
+        sums[second] -= delta
+        before = _strengths(self._sums)
+        after = _strengths(sums)
+        ranks_before = {name: self.rank(name) for name in (team, other)}
+        self._rankings.update(team, self._team_values[team] + value_change)
+        self._rankings.update(other, self._team_values[other] - value_change)
+        ranks = {name: (ranks_before[name], self.rank(name)) for name in (team, other)}
+        self._rankings.update(team, self._team_values[team])
+        self._rankings.update(other, self._team_values[other])
+        return TradeResult(
+            gives={team: list(gives), other: list(receives)},
+            value_change={team: value_change, other: -value_change},
+            strength_change={
+                team: float(after[first] - before[first]),
+                other: float(after[second] - before[second]),
+            },
+            ranks=ranks,
+        )
+
+    def apply(
+        self, team: str, gives: list[str], other: str, receives: list[str]
+    ) -> None:
+        """Make a trade, updating the two teams' sums and ranks."""
+        value_change, delta = self._trade_change(team, gives, other, receives)
+        self._sums[self.teams.index(team)] += delta
+        self._sums[self.teams.index(other)] -= delta
+        self.rosters[team] = [
+            player_id for player_id in self.rosters[team] if player_id not in gives
+        ] + list(receives)
+        self.rosters[other] = [
+            player_id for player_id in self.rosters[other] if player_id not in receives
+        ] + list(gives)
+        self._team_values[team] += value_change
+        self._team_values[other] -= value_change
+        self._rankings.update(team, self._team_values[team])
+        self._rankings.update(other, self._team_values[other])
+
+    def search(
+        self,
+        team: str,
+        other: str,
+        count: int = 10,
+        max_players: int = 2,
+        mutual: bool = True,
+    ) -> list[TradeResult]:
+        """Return the trades between two teams that most strengthen the first.
+
+        Every trade of one player for up to `max_players` players, in either
+        direction, is scored at once. With `mutual`, only trades that do not
+        weaken the other team are kept. Roster limits are not checked.
+        """
+        first, second = self.teams.index(team), self.teams.index(other)
+        others = [
+            index for index in range(len(self.teams)) if index not in (first, second)
+        ]
+        other_means, other_variances = team_distributions(self._sums[others])
+        give_sets = _player_sets(self.rosters[team], max_players)
+        receive_sets = _player_sets(self.rosters[other], max_players)
+        pairs = [
+            (give, receive)
+            for give, gives in enumerate(give_sets)
+            for receive, receives in enumerate(receive_sets)
+            if min(len(gives), len(receives)) == 1
+        ]
+        if not pairs:
+            return []
+        gives_index, receives_index = np.array(pairs).T
+        delta = (
+            self._set_sums(receive_sets)[receives_index]
+            - self._set_sums(give_sets)[gives_index]
+        )
+        strengths = _strengths(self._sums)
+        gains: dict[int, np.ndarray] = {}
+        for row, sign, opponent in ((first, 1, second), (second, -1, first)):
+            means, variances = team_distributions(self._sums[row] + sign * delta)
+            opponent_means, opponent_variances = team_distributions(
+                self._sums[opponent] - sign * delta
+            )
+            _, win, tie = compare_teams(
+                means[:, np.newaxis],
+                variances[:, np.newaxis],
+                other_means[np.newaxis],
+                other_variances[np.newaxis],
+            )
+            _, head_win, head_tie = compare_teams(
+                means, variances, opponent_means, opponent_variances
+            )
+            total = (win + tie / 2).sum(axis=1) + head_win + head_tie / 2
+            gains[row] = total / (len(self.teams) - 1) - strengths[row]
+        gain, other_gain = gains[first], gains[second]
+        order = [
+            index
+            for index in np.argsort(-gain, kind="stable")
+            if not mutual or other_gain[index] >= 0
+        ]
+        return [
+            self.evaluate(
+                team,
+                list(give_sets[gives_index[index]]),
+                other,
+                list(receive_sets[receives_index[index]]),
+            )
+            for index in order[:count]
+        ]
+
+    def _set_sums(self, player_sets: list[tuple[str, ...]]) -> np.ndarray:
+        """Return the summed contributions of each set of players."""
+        indicator = np.zeros((len(player_sets), len(self.pool)))
+        for index, player_ids in enumerate(player_sets):
+            indicator[index, self._player_rows(player_ids)] = 1
+        return indicator @ self._contributions
+
+    def _rows(self, team: str) -> list[int]:
+        return self._player_rows(self.rosters[team])
+
+    def _player_rows(self, player_ids: tuple[str, ...] | list[str]) -> list[int]:
+        return [self.pool.row(player_id) for player_id in player_ids]
+
+    def _trade_change(
+        self, team: str, gives: list[str], other: str, receives: list[str]
+    ) -> tuple[float, np.ndarray]:
+        """Return the change in the first team's value and contribution sums."""
+        for name, player_ids in ((team, gives), (other, receives)):
+            missing = set(player_ids) - set(self.rosters[name])
+            if missing:
+                raise ValueError(f"Players {sorted(missing)} are not on {name}")
+        rows, other_rows = self._player_rows(gives), self._player_rows(receives)
+        value_change = float(self._values[other_rows].sum() - self._values[rows].sum())
+        delta = self._contributions[other_rows].sum(axis=0) - self._contributions[
+            rows
+        ].sum(axis=0)
+        return value_change, delta
+
+
+def _player_sets(player_ids: list[str], max_players: int) -> list[tuple[str, ...]]:
+    return [
+        players
+        for size in range(1, max_players + 1)
+        for players in itertools.combinations(player_ids, size)
+    ]
+
+
+def _strengths(sums: np.ndarray) -> np.ndarray:
+    """Return each team's mean probability of winning against the others."""
+    means, variances = team_distributions(sums)
+    _, win, tie = compare_teams(
+        means[:, np.newaxis],
+        variances[:, np.newaxis],
+        means[np.newaxis],
+        variances[np.newaxis],
+    )
+    score = win + tie / 2
+    np.fill_diagonal(score, 0)
+    return score.sum(axis=1) / max(len(sums) - 1, 1)
@@ -0,0 +1,48 @@
+"""Binary indexed (Fenwick) tree of running sums."""
+
+
+class FenwickTree:
+    """Running sums over a fixed number of slots.
+
+    Adding to a slot, summing a prefix of slots and finding the slot at which a
+    prefix sum is reached all take O(log n).
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize class."""
+        self._tree = [0.0] * (size + 1)
+
+    def __len__(self) -> int:
+        """Return the number of slots."""
+        return len(self._tree) - 1
+
+    def add(self, index: int, delta: float) -> None:
+        """Add to the value of a zero-based slot."""
+        index += 1
+        while index < len(self._tree):
+            self._tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, count: int) -> float:
+        """Return the sum of the first `count` slots."""
+        total = 0.0
+        while count > 0:
+            total += self._tree[count]
+            count -= count & -count
+        return total
+
+    def search(self, target: float) -> int:
+        """Return the zero-based slot at which the prefix sum first reaches target.
+
+        The slot values must be non-negative. If the total is below the target,
+        the number of slots is returned.
+        """
+        index = 0
+        step = 1 << len(self).bit_length()
+        while step:
+            next_index = index + step
+            if next_index < len(self._tree) and self._tree[next_index] < target:
+                index = next_index
+                target -= self._tree[next_index]
+            step >>= 1
+        return index
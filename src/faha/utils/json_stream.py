@@ -0,0 +1,97 @@
+"""Incrementally decode records from a streamed JSON document."""
+
+import codecs
+import json
+import re
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+)
+
+JsonPath = tuple[str | int, ...]
+
+# a complete string, a structural character, or the start of an incomplete string
+_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\],]|"')
+
+
+class _Container:
+    """An open object or array above the records being decoded."""
+
+    __slots__ = ("is_object", "path", "key", "expecting_key")
+
+    def __init__(self, is_object: bool, path: JsonPath) -> None:
+        self.is_object = is_object
+        self.path = path
+        self.key: str | int = 0
+        self.expecting_key = is_object
+
+
+def iter_members(
+    chunks: Iterable[bytes | str], path: JsonPath
+) -> Iterator[tuple[str | int, Any]]:
+    """Yield the members of the container at a path as soon as each is complete.
+
+    Only the member being received is held in memory, rather than the whole
+    document. Scalar members, such as the count of a Yahoo collection, are
+    skipped.
+
+    Args:
+        chunks: Consecutive pieces of the JSON document
+        path: Keys and array indices leading to the container
+
+    Yields:
+        tuple: The key (or index) and the decoded value of each member
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    stack: list[_Container] = []
+    buffer = ""
+    position = 0
+    record_start = -1  # buffer index of the member being received
+    record_key: str | int = 0
+    record_depth = 0
+    for chunk in chunks:
+        buffer += decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        for match in _TOKEN.finditer(buffer, position):
+            token = match.group()
+            if token == '"':
+                break  # the string continues in the next chunk
+            position = match.end()
+            if record_start >= 0:
+                if token in "{[":
+                    record_depth += 1
+                elif token in "}]":
+                    record_depth -= 1
+                    if record_depth == 0:
+                        yield record_key, json.loads(buffer[record_start:position])
+                        record_start = -1
+                continue
+            top = stack[-1] if stack else None
+            if token in "{[":
+                if top is None:
+                    stack.append(_Container(token == "{", ()))
+                elif top.path == path:
+                    record_start = match.start()
+                    record_key = top.key
+                    record_depth = 1
+                else:
+                    stack.append(_Container(token == "{", top.path + (top.key,)))
+            elif token in "}]":
+                stack.pop()
+            elif top is None:
+                continue
+            elif token == ",":
+                if top.is_object:
+                    top.expecting_key = True
+                else:
+                    top.key = int(top.key) + 1
+            elif top.expecting_key:
+                top.key = json.loads(token)
+                top.expecting_key = False
+        if record_start >= 0:
+            buffer = buffer[record_start:]
+            position -= record_start
+            record_start = 0
+        else:
+            buffer = buffer[position:]
+            position = 0
@@ -0,0 +1,44 @@
+"""Import modules on first use."""
+
+import importlib
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+from typing import Any
+
+_lock = threading.Lock()
+
+
+class _LazyModule(ModuleType):
+    """Module standing in for another until one of its attributes is used."""
+
+    def __getattr__(self, attribute: str) -> Any:
+        """Load the module, then return its attribute.
+
+        Loading takes a lock, so threads using the module for the first time at
+        once never see it partly loaded.
+        """
+        with _lock:
+            if "_lazy_loaded" not in self.__dict__:
+                self.__dict__.update(vars(importlib.import_module(self.__name__)))
+                self.__dict__["_lazy_loaded"] = True
+        try:
+            return self.__dict__[attribute]
+        except KeyError:
+            raise AttributeError(
+                f"module {self.__name__!r} has no attribute {attribute!r}"
+            ) from None
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return a module that is only loaded when one of its attributes is used.
+
+    Heavy dependencies imported this way do not slow down entry points that
+    never use them.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    if importlib.util.find_spec(name) is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    return _LazyModule(name)
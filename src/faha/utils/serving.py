@@ -0,0 +1,31 @@
+"""Run HTTP servers in the background or the foreground."""
+
+import threading
+from contextlib import contextmanager
+from socketserver import BaseServer
+from typing import Iterator, TypeVar
+
+ServerT = TypeVar("ServerT", bound=BaseServer)
+
+
+@contextmanager
+def in_thread(server: ServerT) -> Iterator[ServerT]:
+    """Serve in a background thread, then shut the server down on exit."""
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def until_interrupted(server: BaseServer) -> None:
+    """Serve in the foreground until interrupted, then close the server."""
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
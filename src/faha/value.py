@@ -1,7 +1,12 @@
 """Value a player."""
 
+import heapq
 from copy import deepcopy
-from typing import Optional
+from typing import (
+    TYPE_CHECKING,
+    Iterable,
+    Optional,
+)
 
 from faha._types import Weights
 from faha.players import (
@@ -12,6 +17,16 @@ from faha.players import (
     ValuedGoaliePlayer,
     ValuedOffensePlayer,
 )
+from faha.utils.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from faha import pool
+else:
+    pool = lazy_import("faha.pool")
+
+# goalies only account for 4 of the 12 stat categories
+OFFENSE_SHARE = 8 / 12
+GOALIE_SHARE = 4 / 12
 
 
 def offense_player_stat_values(
@@ -83,16 +98,56 @@ def calculate_player_values(
     return players_copy  # type: ignore
 
 
+def calculate_player_points(
+    players: dict[str, OffensePlayer | GoaliePlayer], weights: Weights
+) -> dict[str, ValuedOffensePlayer | ValuedGoaliePlayer]:
+    """Add the player's fantasy points and points per game as their value.
+
+    The weights hold the points of each stat, as from `calculate_point_weights`,
+    and the whole pool is scored with one array operation.
+    """
+    points, points_per_game = pool.pool_points(
+        pool.StatPool.from_players(players.values()), weights
+    )
+    players_copy = deepcopy(players)
+    for player, player_points, value in zip(
+        players_copy.values(), points, points_per_game
+    ):
+        player["Fantasy Points"] = float(player_points)  # type: ignore
+        player["Value"] = float(value)  # type: ignore
+    return players_copy  # type: ignore
+
+
+def calculate_team_value(
+    offense_values: Iterable[float],
+    goalie_values: Iterable[float],
+    offense_share: float = OFFENSE_SHARE,
+    goalie_share: float = GOALIE_SHARE,
+) -> float:
+    """Return the value of a team from its skater and goalie values."""
+    return sum(offense_values) * offense_share + sum(goalie_values) * goalie_share
+
+
 def sort_players(
     players: dict[str, ValuedOffensePlayer | ValuedGoaliePlayer],
     condensed: Optional[bool] = False,
+    limit: Optional[int] = None,
 ) -> (
     list[tuple[str, ValuedOffensePlayer | ValuedGoaliePlayer]] | list[tuple[str, float]]
 ):
-    """Sort the players by their value."""
-    sorted_players = sorted(
-        players.items(), key=lambda x: x[1]["Value"], reverse=True  # type: ignore
-    )
+    """Sort the players by their value.
+
+    With a limit, only the top `limit` players are returned, found in
+    O(n log limit) rather than by sorting the whole pool.
+    """
+    if limit is None:
+        sorted_players = sorted(
+            players.items(), key=lambda x: x[1]["Value"], reverse=True  # type: ignore
+        )
+    else:
+        sorted_players = heapq.nlargest(
+            limit, players.items(), key=lambda x: x[1]["Value"]  # type: ignore
+        )
     if not condensed:
         return sorted_players
     return [(name, info["Value"]) for name, info in sorted_players]
@@ -0,0 +1,107 @@
+"""Value over replacement of players at their positions."""
+
+from typing import Sequence
+
+import numpy as np
+
+from faha._types import Weights
+from faha.pool import StatPool, pool_values
+
+REPLACEMENT_POSITIONS = ("C", "LW", "RW", "D", "G")
+FLEX_POSITIONS = {
+    "Util": ("C", "LW", "RW", "D"),
+    "F": ("C", "LW", "RW"),
+    "W": ("LW", "RW"),
+}
+BENCH_POSITION = "BN"
+RESERVE_POSITIONS = ("IR", "IR+", "IL", "IL+", "NA")
+
+
+def starter_slots(roster_slots: dict[str, int]) -> np.ndarray:
+    """Return the starter slots of a team at each position.
+
+    Slots follow `REPLACEMENT_POSITIONS`. Flexible slots such as Util are shared
+    between their positions in proportion to the dedicated slots, while bench and
+    injured reserve slots are ignored.
+    """
+    slots = np.array(
+        [roster_slots.get(position, 0) for position in REPLACEMENT_POSITIONS],
+        dtype=float,
+    )
+    dedicated = slots.copy()
+    for flex, positions in FLEX_POSITIONS.items():
+        if not roster_slots.get(flex):
+            continue
+        columns = [REPLACEMENT_POSITIONS.index(position) for position in positions]
+        shares = dedicated[columns]
+        if shares.sum() == 0:
+            shares = np.ones(len(columns))
+        slots[columns] += roster_slots[flex] * shares / shares.sum()
+    return slots
+
+
+def starter_counts(roster_slots: dict[str, int], num_managers: int) -> np.ndarray:
+    """Return the number of starters across the league at each position."""
+    return np.rint(starter_slots(roster_slots) * num_managers).astype(int)
+
+
+def eligibility_matrix(positions: Sequence[Sequence[str]]) -> np.ndarray:
+    """Return whether each player (rows) is eligible at each position (columns)."""
+    return np.array(
+        [
+            [position in eligible for position in REPLACEMENT_POSITIONS]
+            for eligible in positions
+        ],
+        dtype=bool,
+    ).reshape(len(positions), len(REPLACEMENT_POSITIONS))
+
+
+def replacement_levels(
+    values: np.ndarray, eligibility: np.ndarray, counts: np.ndarray
+) -> np.ndarray:
+    """Return the value of the best player left over at each position.
+
+    The replacement player at a position is the one ranked just below the league's
+    starters there. If the pool runs out first, the worst eligible player is used,
+    and positions without eligible players have a replacement level of zero.
+    """
+    masked = np.where(eligibility, values[:, np.newaxis], -np.inf)
+    ordered = -np.sort(-masked, axis=0)
+    num_eligible = eligibility.sum(axis=0)
+    rows = np.minimum(counts, np.maximum(num_eligible - 1, 0))
+    levels = ordered[rows, np.arange(len(counts))] if len(values) else np.zeros(0)
+    return np.where(num_eligible > 0, levels, 0.0)
+
+
+def value_over_replacement(
+    values: np.ndarray, eligibility: np.ndarray, levels: np.ndarray
+) -> np.ndarray:
+    """Return player values over the lowest replacement level they are eligible at.
+
+    Players without an eligible position are compared with a replacement level of
+    zero.
+    """
+    player_levels = np.where(eligibility, levels, np.inf).min(axis=1)
+    return values - np.where(np.isfinite(player_levels), player_levels, 0.0)
+
+
+def positional_value_over_replacement(
+    values: np.ndarray,
+    positions: Sequence[Sequence[str]],
+    roster_slots: dict[str, int],
+    num_managers: int,
+) -> np.ndarray:
+    """Return the value over replacement of players from their values."""
+    eligibility = eligibility_matrix(positions)
+    counts = starter_counts(roster_slots, num_managers)
+    levels = replacement_levels(values, eligibility, counts)
+    return value_over_replacement(values, eligibility, levels)
+
+
+def pool_value_over_replacement(
+    pool: StatPool, weights: Weights, roster_slots: dict[str, int], num_managers: int
+) -> np.ndarray:
+    """Return the value over replacement of every player in a pool."""
+    return positional_value_over_replacement(
+        pool_values(pool, weights), pool.positions, roster_slots, num_managers
+    )
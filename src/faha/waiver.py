@@ -0,0 +1,159 @@
+"""Recommend free agents to add and roster players to drop."""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from faha._types import WaiverObjective, Weights
+from faha.league import League
+from faha.matchup import (
+    compare_teams,
+    team_distributions,
+    typical_games,
+    weekly_contributions,
+)
+from faha.players import GoaliePlayer, OffensePlayer
+from faha.pool import StatPool, pool_values
+
+
+@dataclass
+class WaiverWire:
+    """Change from every pair of a free agent added and a roster player dropped.
+
+    The changes are matrices with a row for each free agent and a column for
+    each roster player. The change in weighted category totals is a difference
+    of weekly values, and the change in matchup win probability comes from the
+    team's summed contributions with the pair swapped, against an opponent.
+    """
+
+    roster: StatPool
+    free_agents: StatPool
+    weights: Weights
+    opponent: Optional[np.ndarray] = None
+    _roster_contributions: np.ndarray = field(init=False, repr=False)
+    _agent_contributions: np.ndarray = field(init=False, repr=False)
+    _roster_values: np.ndarray = field(init=False, repr=False)
+    _agent_values: np.ndarray = field(init=False, repr=False)
+    _value_deltas: np.ndarray = field(init=False, repr=False)
+    _win_deltas: Optional[np.ndarray] = field(init=False, repr=False, default=None)
+
+    def __post_init__(self) -> None:
+        """Calculate the weekly contributions and values of every player."""
+        self._roster_contributions = weekly_contributions(self.roster)
+        self._agent_contributions = weekly_contributions(self.free_agents)
+        self._roster_values = _weekly_values(self.roster, self.weights)
+        self._agent_values = _weekly_values(self.free_agents, self.weights)
+        self._value_deltas = (
+            self._agent_values[:, np.newaxis] - self._roster_values[np.newaxis]
+        )
+
+    @classmethod
+    def from_league(
+        cls,
+        league: League,
+        manager_id: str,
+        weights: Weights,
+        opponent_id: Optional[str] = None,
+    ) -> "WaiverWire":
+        """Build the waiver wire of a manager's team, optionally against a team."""
+        opponent = None
+        if opponent_id is not None:
+            opponent_pool = StatPool.from_players(
+                league.team_player_stats(opponent_id).values()
+            )
+            opponent = weekly_contributions(opponent_pool).sum(axis=0)
+        return cls(
+            roster=StatPool.from_players(league.team_player_stats(manager_id).values()),
+            free_agents=StatPool.from_players(league.available_players().values()),
+            weights=weights,
+            opponent=opponent,
+        )
+
+    def value_deltas(self) -> np.ndarray:
+        """Return the change in the team's weekly weighted category total."""
+        return self._value_deltas
+
+    def win_deltas(self) -> np.ndarray:
+        """Return the change in the probability of beating the opponent."""
+        if self._win_deltas is None:
+            self._win_deltas = (
+                self._win_probabilities(self._agent_contributions)
+                - self._current_win_probability()
+            )
+        return self._win_deltas
+
+    def suggestions(
+        self, count: int = 10, objective: WaiverObjective = "value"
+    ) -> list[tuple[str, str, float]]:
+        """Return the best pairs of free agents to add and players to drop."""
+        deltas = self.win_deltas() if objective == "win" else self.value_deltas()
+        flat = deltas.ravel()
+        count = min(count, flat.size)
+        if not count:
+            return []
+        best = np.argpartition(-flat, count - 1)[:count]
+        best = best[np.argsort(-flat[best], kind="stable")]
+        num_roster = deltas.shape[1]
+        return [
+            (
+                self.free_agents.player_ids[index // num_roster],
+                self.roster.player_ids[index % num_roster],
+                float(flat[index]),
+            )
+            for index in best
+        ]
+
+    def update_player(self, player: OffensePlayer | GoaliePlayer) -> None:
+        """Replace the stats of a free agent or roster player.
+
+        Only the row or column of the player is recalculated, except that the
+        win probabilities of every pair change with a roster player's stats.
+        """
+        player_id = player["Player ID"]
+        if player_id in self.free_agents:
+            row = self.free_agents.set_player(player)
+            self._agent_contributions[row] = weekly_contributions(
+                self.free_agents.subset([row])
+            )[0]
+            self._agent_values[row] = _weekly_values(
+                self.free_agents.subset([row]), self.weights
+            )[0]
+            self._value_deltas[row] = self._agent_values[row] - self._roster_values
+            if self._win_deltas is not None:
+                self._win_deltas[row] = (
+                    self._win_probabilities(self._agent_contributions[[row]])[0]
+                    - self._current_win_probability()
+                )
+        else:
+            column = self.roster.set_player(player)
+            self._roster_contributions[column] = weekly_contributions(
+                self.roster.subset([column])
+            )[0]
+            self._roster_values[column] = _weekly_values(
+                self.roster.subset([column]), self.weights
+            )[0]
+            self._value_deltas[:, column] = (
+                self._agent_values - self._roster_values[column]
+            )
+            self._win_deltas = None
+
+    def _win_probabilities(self, added: np.ndarray) -> np.ndarray:
+        """Return the win probability with each added player and each drop."""
+        team = self._roster_contributions.sum(axis=0)
+        swapped = team + added[:, np.newaxis] - self._roster_contributions[np.newaxis]
+        return self._win_probability(swapped)
+
+    def _current_win_probability(self) -> float:
+        return float(self._win_probability(self._roster_contributions.sum(axis=0)))
+
+    def _win_probability(self, contributions: np.ndarray) -> np.ndarray:
+        if self.opponent is None:
+            raise RuntimeError("An opponent is needed for win probabilities")
+        means, variances = team_distributions(contributions)
+        opponent_means, opponent_variances = team_distributions(self.opponent)
+        return compare_teams(means, variances, opponent_means, opponent_variances)[1]
+
+
+def _weekly_values(pool: StatPool, weights: Weights) -> np.ndarray:
+    return pool_values(pool, weights) * typical_games(pool)
@@ -3,13 +3,19 @@
 import typing
 from pathlib import Path
 
-import dill
-
 from faha._types import Weights
-from faha.league import League
+from faha.bundle import saved_settings
+from faha.league import League, stat_point_values
 from faha.oauth.client import get_client
+from faha.utils.lazy import lazy_import
 from faha.yahoo import Yahoo
 
+if typing.TYPE_CHECKING:
+    import dill
+else:
+    dill = lazy_import("dill")
+
+SAVE_PERCENTAGE_FLOOR = 0.89
 STAT_NAMES = {
     "Wins": "W",
     "Save Percentage": "SV%",
@@ -45,19 +51,50 @@ def _convert(value: str, category: str) -> float | int:
     return int(value)
 
 
-def calculate_stat_weights(all_stats: dict) -> Weights:
-    """Calculate the stat weights."""
+def calculate_stat_weights(
+    all_stats: dict,
+    top_teams: int = 2,
+    plus_minus_weight: float = 1 / 3,
+    shutout_divisor: float = 3,
+    save_percentage_scale: float = 60,
+) -> Weights:
+    """Calculate the stat weights.
+
+    Args:
+        all_stats (dict): Stats of every team for each category
+        top_teams (int): Number of top teams averaged in each category
+        plus_minus_weight (float): Weight of plus/minus
+        shutout_divisor (float): Divisor reducing the weight of shutouts
+        save_percentage_scale (float): Slope of the save percentage value
+    """
     stat_sums = {
-        category: sum(sorted(values)[-2:]) / 2 for category, values in all_stats.items()
+        category: sum(sorted(values)[-top_teams:]) / top_teams
+        for category, values in all_stats.items()
     }
     weights = {
         category: stat_sums["Goals"] / value for category, value in stat_sums.items()
     }
     # explicitly set the weights for difficult stat categories
-    weights["Plus/Minus"] = 1 / 3
+    weights["Plus/Minus"] = plus_minus_weight
     # use a function that maps [0.890, 0.940] save percentage range to to [0, 3]
-    weights["Save Percentage"] = lambda x: 60 * (x - 0.89)
-    weights["Shutouts"] /= 3
+    weights["Save Percentage"] = lambda x: save_percentage_scale * (
+        x - SAVE_PERCENTAGE_FLOOR
+    )
+    weights["Shutouts"] /= shutout_divisor
+    return weights  # type: ignore
+
+
+def calculate_point_weights(point_values: dict[str, float]) -> Weights:
+    """Return weights valuing players by their fantasy points per game.
+
+    Args:
+        point_values (dict): Points of each stat, as from `League.point_values`
+    """
+    weights: dict = {
+        category: point_values.get(category, 0.0) for category in STAT_NAMES
+    }
+    save_percentage_points = weights["Save Percentage"]
+    weights["Save Percentage"] = lambda x: save_percentage_points * x
     return weights  # type: ignore
 
 
@@ -66,6 +103,9 @@ def stat_weights_from_yahoo(season: int) -> Weights:
     oauth = get_client()
     yahoo_agent = Yahoo(oauth)
     lg = League(season, yahoo_agent)
+    point_values = lg.point_values
+    if point_values is not None:
+        return calculate_point_weights(point_values)
     all_stats = all_manager_team_stats(lg)
     return calculate_stat_weights(all_stats)
 
@@ -87,7 +127,15 @@ def write_weights(weights: Weights, season: int) -> None:
 
 
 def stat_weights_from_disk(season: int) -> Weights:
-    """Return the weights for a given season, accessed from a saved file on disk."""
+    """Return the weights for a given season, accessed from a saved file on disk.
+
+    A points league is weighted by the point values in its saved settings.
+    """
+    settings = saved_settings(season)
+    if settings is not None:
+        point_values = stat_point_values(settings)
+        if point_values is not None:
+            return calculate_point_weights(point_values)
     file_name = weights_file(season)
     with open(file_name, "rb") as file_handle:
         return dill.load(file_handle)
@@ -1,52 +1,88 @@
 """Make request to Yahoo."""
 
-from typing import Optional
-
-from yahoo_oauth import OAuth2  # type: ignore
+from contextlib import closing
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterator,
+    Optional,
+)
 
 from faha._types import Status
+from faha.utils.json_stream import JsonPath, iter_members
+
+if TYPE_CHECKING:
+    from yahoo_oauth import OAuth2  # type: ignore
 
 YAHOO_ENDPOINT = "https://fantasysports.yahooapis.com/fantasy/v2"
+STREAM_CHUNK_SIZE = 64 * 1024
+PLAYERS_PATH: JsonPath = ("fantasy_content", "players")
+LEAGUE_PLAYERS_PATH: JsonPath = ("fantasy_content", "league", 1, "players")
+TEAMS_PATH: JsonPath = ("fantasy_content", "teams")
 
 
 class Yahoo:
     """Yahoo APIs builder and requester class."""
 
-    def __init__(self, oauth: OAuth2) -> None:
+    def __init__(self, oauth: "OAuth2", endpoint: str = YAHOO_ENDPOINT) -> None:
         """Initialize class."""
         self.oauth = oauth
+        self.endpoint = endpoint
 
     def request(self, uri: str) -> dict:
         """Make a generic request to Yahoo."""
-        url = f"{YAHOO_ENDPOINT}/{uri}"
+        url = f"{self.endpoint}/{uri}"
         response = self.oauth.session.get(url, params={"format": "json"})
         if response.status_code != 200:
             raise RuntimeError(response.content)
         return response.json()
 
+    def stream(self, uri: str, path: JsonPath) -> Iterator[tuple[str | int, Any]]:
+        """Make a request to Yahoo and yield the records at a path as they arrive.
+
+        The response is decoded incrementally, so the full response body and its
+        decoded tree are never held in memory at once.
+        """
+        url = f"{self.endpoint}/{uri}"
+        response = self.oauth.session.get(url, params={"format": "json"}, stream=True)
+        with closing(response):
+            if response.status_code != 200:
+                raise RuntimeError(response.content)
+            yield from iter_members(
+                response.iter_content(chunk_size=STREAM_CHUNK_SIZE), path
+            )
+
     def get_team_info(self, team_keys: list[str]) -> dict:
         """Get team info."""
-        teams = ",".join(team_keys)
-        uri = f"teams;team_keys={teams}"
-        return self.request(uri)
+        return self.request(_team_info_uri(team_keys))
 
     def get_team_stats(self, team_keys: list[str]) -> dict:
         """Get the season stats for a team or teams."""
-        teams = ",".join(team_keys)
-        uri = f"teams;team_keys={teams}/stats;type=season"
-        return self.request(uri)
+        return self.request(_team_stats_uri(team_keys))
+
+    def iter_team_stats(self, team_keys: list[str]) -> Iterator[tuple[str | int, Any]]:
+        """Stream the season stats for a team or teams one team at a time."""
+        return self.stream(_team_stats_uri(team_keys), TEAMS_PATH)
 
     def get_team_roster(self, team_keys: list[str]) -> dict:
         """Get the team roster."""
-        teams = ",".join(team_keys)
-        uri = f"teams;team_keys={teams}/roster/players"
-        return self.request(uri)
+        return self.request(_team_roster_uri(team_keys))
 
-    def get_player_stats(self, player_ids: list[str]) -> dict:
-        """Get season stats for players from player ids."""
-        players = ",".join(player_ids)
-        uri = f"players;player_keys={players}/stats;type=season"
-        return self.request(uri)
+    def iter_team_roster(self, team_keys: list[str]) -> Iterator[tuple[str | int, Any]]:
+        """Stream the team rosters one team at a time."""
+        return self.stream(_team_roster_uri(team_keys), TEAMS_PATH)
+
+    def get_player_stats(
+        self, player_ids: list[str], date: Optional[str] = None
+    ) -> dict:
+        """Get season stats, or the stats of a date, for players from player ids."""
+        return self.request(_player_stats_uri(player_ids, date))
+
+    def iter_player_stats(
+        self, player_ids: list[str], date: Optional[str] = None
+    ) -> Iterator[tuple[str | int, Any]]:
+        """Stream season stats for players from player ids one player at a time."""
+        return self.stream(_player_stats_uri(player_ids, date), PLAYERS_PATH)
 
     def get_player_category_stats(
         self,
@@ -54,30 +90,105 @@ class Yahoo:
         start_index: int,
         status: Status,
         position: Optional[str] = None,
+        date: Optional[str] = None,
     ) -> dict:
-        """Get season stats for players from player ids."""
-        if position is None:
-            position_string = ""
-        else:
-            position_string = f";position={position}"
-        if status == "ALL":
-            status_string = ""
-        else:
-            status_string = f";status={status}"
-        # if not position_string and not status_string:
-
-        uri = (
-            f"league/{league_key}/players;start={start_index};"
-            f"count=25{status_string}{position_string}/stats;type=season"
+        """Get season stats, or the stats of a date, for a page of players."""
+        return self.request(
+            _player_category_stats_uri(league_key, start_index, status, position, date)
+        )
+
+    def iter_player_category_stats(
+        self,
+        league_key: str,
+        start_index: int,
+        status: Status,
+        position: Optional[str] = None,
+        date: Optional[str] = None,
+    ) -> Iterator[tuple[str | int, Any]]:
+        """Stream a page of players in a league one player at a time."""
+        return self.stream(
+            _player_category_stats_uri(league_key, start_index, status, position, date),
+            LEAGUE_PLAYERS_PATH,
         )
-        return self.request(uri)
 
     def get_league_info(self) -> dict:
         """Get league information."""
         uri = "game/nhl"
         return self.request(uri)
 
+    def get_game_keys(self, seasons: list[int]) -> dict:
+        """Get the NHL game information of past or current seasons."""
+        years = ",".join(str(season) for season in seasons)
+        uri = f"games;game_codes=nhl;seasons={years}"
+        return self.request(uri)
+
+    def get_game_players(self, game_key: str, start_index: int) -> dict:
+        """Get a page of players in a game with their stats for its season."""
+        return self.request(_game_players_uri(game_key, start_index))
+
+    def get_game_weeks(self, game_key: str) -> dict:
+        """Get the first and last day of each fantasy week of a game."""
+        uri = f"game/{game_key}/game_weeks"
+        return self.request(uri)
+
     def get_league_settings(self, league_key: str) -> dict:
         """Get league settings."""
         uri = f"league/{league_key}/settings"
         return self.request(uri)
+
+    def get_draft_results(self, league_key: str) -> dict:
+        """Get the picks made so far in the league draft."""
+        uri = f"league/{league_key}/draftresults"
+        return self.request(uri)
+
+
+def _team_info_uri(team_keys: list[str]) -> str:
+    teams = ",".join(team_keys)
+    return f"teams;team_keys={teams}"
+
+
+def _team_stats_uri(team_keys: list[str]) -> str:
+    teams = ",".join(team_keys)
+    return f"teams;team_keys={teams}/stats;type=season"
+
+
+def _team_roster_uri(team_keys: list[str]) -> str:
+    teams = ",".join(team_keys)
+    return f"teams;team_keys={teams}/roster/players"
+
+
+def _player_stats_uri(player_ids: list[str], date: Optional[str] = None) -> str:
+    players = ",".join(player_ids)
+    return f"players;player_keys={players}/{_stats_resource(date)}"
+
+
+def _game_players_uri(game_key: str, start_index: int) -> str:
+    return f"game/{game_key}/players;start={start_index};count=25/stats;type=season"
+
+
+def _player_category_stats_uri(
+    league_key: str,
+    start_index: int,
+    status: Status,
+    position: Optional[str] = None,
+    date: Optional[str] = None,
+) -> str:
+    if position is None:
+        position_string = ""
+    else:
+        position_string = f";position={position}"
+    if status == "ALL":
+        status_string = ""
+    else:
+        status_string = f";status={status}"
+    return (
+        f"league/{league_key}/players;start={start_index};"
+        f"count=25{status_string}{position_string}/{_stats_resource(date)}"
+    )
+
+
+def _stats_resource(date: Optional[str] = None) -> str:
+    """Return the stats resource of a season, or of a date as YYYY-MM-DD."""
+    if date is None:
+        return "stats;type=season"
+    return f"stats;type=date;date={date}"
@@ -0,0 +1,90 @@
+"""Weight scheme backtest tests."""
+
+import datetime
+
+import numpy as np
+import pytest
+
+from faha.backtest import (
+    backtest,
+    pool_team_stats,
+    season_folds,
+    weekly_fold,
+)
+from faha.benchmark.fixtures import synthetic_league
+from faha.daily import DailyStatStore
+from faha.pool import StatPool
+from faha.sensitivity import WeightGrid, rank_stability
+
+GRID = WeightGrid(
+    top_teams=(1, 2, 3), plus_minus_weight=(0, 1 / 3, 1), shutout_divisor=(1, 3)
+)
+
+
+@pytest.fixture(name="seasons", scope="module")
+def fixture_seasons():
+    """Return three seasons of players, the last two with the same stats."""
+    league = synthetic_league(150, num_teams=4)
+    players = {player["Player ID"]: player for player in league.all_players().values()}
+    past = {
+        player["Player ID"]: player
+        for player in synthetic_league(150, num_teams=4, seed=1).all_players().values()
+    }
+    return {2021: past, 2022: players, 2023: players}
+
+
+def test_pool_team_stats():
+    """Test the most used players are dealt to the teams."""
+    league = synthetic_league(100, num_teams=4)
+    pool = StatPool.from_players(league.all_players().values())
+    team_stats = pool_team_stats(pool, num_teams=3, skaters_per_team=2)
+    skaters = np.flatnonzero(~pool.is_goalie)
+    most_used = skaters[np.argsort(-pool.games[skaters], kind="stable")][:6]
+    assert sum(team_stats["Goals"]) == pool.totals[most_used, 0].sum()
+    assert len(team_stats["Save Percentage"]) == 3
+    assert all(0.8 < value < 1 for value in team_stats["Save Percentage"])
+
+
+def test_backtest_scores_rank_correlation(seasons):
+    """Test schemes are scored by the rank correlation with realized values."""
+    folds = season_folds(seasons, min_games=1, num_teams=4)
+    assert [fold.label for fold in folds] == ["2021-2022", "2022-2023"]
+    result = backtest(folds, GRID, workers=1)
+    assert result.spearman.shape == (len(GRID.variants()), 2)
+    for index, fold in enumerate(folds):
+        values = GRID.weight_matrix(fold.team_stats) @ fold.design.T
+        stability = rank_stability(np.vstack([fold.realized, values]))
+        np.testing.assert_allclose(result.spearman[:, index], stability.spearman[1:])
+    # identical seasons are ranked perfectly by the default scheme
+    default = GRID.variants().index(WeightGrid().variants()[0])
+    assert result.spearman[default, 1] == pytest.approx(1)
+    assert result.best(1) == [int(np.argmax(result.mean_spearman))]
+
+
+def test_parallel_backtest_matches_serial(seasons):
+    """Test chunks scored over a process pool match scoring in one process."""
+    folds = season_folds(seasons, min_games=1, num_teams=4)
+    serial = backtest(folds, GRID, workers=1)
+    parallel = backtest(folds, GRID, workers=2, chunk_size=5)
+    np.testing.assert_allclose(parallel.spearman, serial.spearman)
+
+
+def test_weekly_fold(tmp_path):
+    """Test the first weeks of daily stats are judged on the days after them."""
+    league = synthetic_league(60, num_teams=2)
+    store = DailyStatStore(tmp_path)
+    first_day = datetime.date(2024, 10, 10)
+    for offset in range(10):
+        day = first_day + datetime.timedelta(days=offset)
+        players: dict = {}
+        for page in league.iter_players("ALL", date=day.isoformat()):
+            players |= page
+        store.record(day, players.values())
+    fold = weekly_fold(store, 1, min_games=1, num_teams=2)
+    first = store.period_pool(first_day, first_day + datetime.timedelta(days=6))
+    assert fold.label == "weeks 1-1"
+    assert set(fold.player_ids) <= set(first.player_ids)
+    rows = [first.row(player_id) for player_id in fold.player_ids]
+    np.testing.assert_allclose(fold.design, first.design_matrix()[rows])
+    with pytest.raises(ValueError):
+        weekly_fold(store, 2)
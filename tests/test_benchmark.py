@@ -0,0 +1,85 @@
+"""Offline benchmark tests."""
+
+import requests
+
+from faha.benchmark import (
+    fixtures,
+    load_test,
+    mock_server,
+    suite,
+)
+
+
+def test_synthetic_league():
+    """Test the synthetic league answers the league pipeline."""
+    league = fixtures.synthetic_league(60, num_teams=2)
+    taken = league.taken_players()
+    available = league.available_players()
+    assert 0 < len(taken) <= 2 * 17
+    assert len(taken) + len(available) <= 60
+    assert set(league.team_names.values()) == {"1", "2"}
+
+
+def test_recorded_responses(tmp_path):
+    """Test recorded responses replay the original responses."""
+    source = fixtures.SyntheticLeague(30)
+    uri = "game/nhl"
+    fixtures.json_io.write(
+        fixtures.fixture_file(tmp_path, uri), {"uri": uri, **source.respond(uri)}
+    )
+    recorded = fixtures.RecordedResponses(tmp_path)
+    assert recorded(uri) == source(uri)
+
+
+def test_record_and_replay(tmp_path):
+    """Test a recorded league replays every request of the benchmarks."""
+    source = fixtures.SyntheticLeague(60, num_teams=2)
+    suite.record_league(fixtures.FixtureYahoo(source), source.league_id, tmp_path)
+    report = suite.run(repeat=1, fixtures=tmp_path)
+    synthetic = suite.benchmark_league(fixtures.synthetic_league(60, num_teams=2), 1)
+    assert [(result["stage"], result["requests"]) for result in report["results"]] == [
+        (result["stage"], result["requests"]) for result in synthetic
+    ]
+
+
+def test_run_and_compare():
+    """Test run and compare."""
+    report = suite.run(sizes=(40,), repeat=1)
+    stages = [result["stage"] for result in report["results"]]
+    assert stages == [
+        "pipeline",
+        "parse",
+        "stream_parse",
+        "valuation",
+        "sort",
+        "frame",
+        "split",
+        "lineups",
+    ]
+    comparison = suite.compare(report, report)
+    assert all(row["ratio"] == 1 for row in comparison)
+
+
+def test_mock_server_throttles_bursts():
+    """Test the mock server throttles requests once its burst is spent."""
+    settings = mock_server.MockSettings(pool_size=30, rate_limit=0.01, burst=5)
+    with mock_server.serve(settings) as server:
+        statuses = [
+            requests.get(f"{server.endpoint}/game/nhl", timeout=5).status_code
+            for _ in range(8)
+        ]
+    assert statuses == [200] * 5 + [mock_server.THROTTLED_STATUS] * 3
+    assert server.counts["requests"] == 8
+    assert server.counts["throttled"] == 3
+
+
+def test_load_test_run():
+    """Test a load test pulls the league through the mock server."""
+    settings = mock_server.MockSettings(pool_size=60, num_teams=2)
+    with mock_server.serve(settings) as server:
+        report = load_test.run(server, "pull", operations=2, concurrency=2)
+    assert report["succeeded"] == 2
+    assert not report["request_failures"]
+    assert report["server_counts"]["requests"] > 0
+    assert report["server_counts"]["throttled"] == 0
+    assert set(report["request_latency"]) == {"mean", "p50", "p90", "p99", "max"}
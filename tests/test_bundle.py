@@ -0,0 +1,149 @@
+"""League bundle tests."""
+
+import json
+import logging
+import math
+
+import pytest
+
+from faha.benchmark.fixtures import (
+    FixtureYahoo,
+    SyntheticLeague,
+    offline_league,
+)
+from faha.bundle import (
+    BundleError,
+    LeagueBundle,
+    bootstrap,
+    load_bundle,
+    save_bundle,
+    saved_bundle,
+    saved_settings,
+)
+from faha.league import PLAYERS_PER_PAGE, League
+from faha.utils import json_io
+
+NUM_PLAYERS = 160
+WORKERS = 4
+
+
+@pytest.fixture(name="source", scope="module")
+def fixture_source():
+    """Return a synthetic league."""
+    return SyntheticLeague(NUM_PLAYERS, num_teams=4)
+
+
+@pytest.fixture(name="bundle", scope="module")
+def fixture_bundle(source):
+    """Return the bundle of the synthetic league."""
+    return bootstrap(FixtureYahoo(source), source.league_id, workers=WORKERS)
+
+
+def test_bootstrap_is_one_bounded_burst(source):
+    """Test bootstrapping makes a bounded number of requests."""
+    yahoo_agent = FixtureYahoo(source)
+    bundle = bootstrap(yahoo_agent, source.league_id, workers=WORKERS)
+    pages = math.ceil(NUM_PLAYERS / PLAYERS_PER_PAGE)
+    id_requests = math.ceil((pages + 1) / WORKERS) * WORKERS
+    # game info, settings, teams, rosters, player ID pages and player stats
+    assert yahoo_agent.num_requests <= 4 + id_requests + pages
+    assert len(bundle.players) == NUM_PLAYERS
+    assert list(bundle.players) == [
+        player["player"][0][1]["player_id"] for player in source.players
+    ]
+    assert len(bundle.teams) == len(bundle.rosters) == 4
+
+
+def test_bundle_round_trip(bundle, tmp_path):
+    """Test a written bundle reads back only with its version and checksum."""
+    path = tmp_path / "bundle.json"
+    bundle.write(path)
+    assert LeagueBundle.read(path) == bundle
+    assert load_bundle(path) == bundle
+    assert load_bundle(tmp_path / "missing.json") is None
+    content = json.loads(path.read_text(encoding="utf-8"))
+    content["bundle"]["league_id"] = "1"
+    path.write_text(json.dumps(content), encoding="utf-8")
+    with pytest.raises(BundleError, match="checksum"):
+        LeagueBundle.read(path)
+    content["version"] = 0
+    path.write_text(json.dumps(content), encoding="utf-8")
+    with pytest.raises(BundleError, match="version"):
+        LeagueBundle.read(path)
+
+
+def test_league_loads_from_bundle(source, bundle):
+    """Test a league answers from a fresh bundle without requests."""
+    yahoo_agent = FixtureYahoo(source)
+    league = League(bundle.season, yahoo_agent, bundle=bundle)
+    reference = offline_league(FixtureYahoo(source), source.league_id)
+    assert league.league_key == reference.league_key
+    assert league.roster_slots == reference.roster_slots
+    assert league.team_names == reference.team_names
+    assert league.team_roster(league.all_manager_ids) == reference.team_roster(
+        reference.all_manager_ids
+    )
+    assert league.taken_players() == reference.taken_players()
+    assert league.available_players() == reference.available_players()
+    assert league.all_players("C") == reference.all_players("C")
+    assert yahoo_agent.num_requests == 0
+
+
+def test_stale_bundle_requests_league_data(source, bundle, tmp_path, monkeypatch):
+    """Test team names, rosters and players are requested once the bundle is stale."""
+    monkeypatch.setattr("faha.league.info_dir", lambda: tmp_path)
+    stale = LeagueBundle(**(vars(bundle) | {"fetched_at": 0.0}))
+    yahoo_agent = FixtureYahoo(source)
+    league = League(stale.season, yahoo_agent, bundle=stale)
+    assert league.league_key == f"{source.game_key}.l.{source.league_id}"
+    assert yahoo_agent.num_requests == 0
+    assert league.team_names == bundle.teams
+    assert yahoo_agent.num_requests == 1
+    league.taken_players()
+    assert yahoo_agent.num_requests > 1
+
+
+def test_saved_files_override_older_bundle(bundle, tmp_path, monkeypatch):
+    """Test newer saved settings and another league ID take over from a bundle."""
+    monkeypatch.setattr("faha.league.info_dir", lambda: tmp_path)
+    bundle.write(tmp_path / f"bundle_{bundle.season}.json")
+    assert saved_bundle(bundle.season) == bundle
+    assert saved_settings(bundle.season) == bundle.settings
+    settings = json.loads(json.dumps(bundle.settings))
+    settings["settings"][2]["num_teams"] = 10
+    json_io.write(tmp_path / f"settings_{bundle.season}.json", settings)
+    assert saved_settings(bundle.season) == settings
+    league = League(bundle.season, FixtureYahoo(SyntheticLeague(10)))
+    assert league.num_managers == 10
+    json_io.write(tmp_path / "league_ids.json", {str(bundle.season): "999"})
+    assert saved_bundle(bundle.season) is None
+    assert League(bundle.season, FixtureYahoo(SyntheticLeague(10))).league_id == "999"
+
+
+def test_corrupt_bundle_is_ignored(bundle, tmp_path, monkeypatch, caplog):
+    """Test a corrupt bundle is logged and leagues use the saved files instead."""
+    monkeypatch.setattr("faha.league.info_dir", lambda: tmp_path)
+    path = tmp_path / f"bundle_{bundle.season}.json"
+    bundle.write(path)
+    path.write_text(path.read_text(encoding="utf-8")[:100], encoding="utf-8")
+    json_io.write(tmp_path / "league_ids.json", {str(bundle.season): "999"})
+    with caplog.at_level(logging.WARNING, logger="faha.bundle"):
+        assert saved_bundle(bundle.season) is None
+        league = League(bundle.season, FixtureYahoo(SyntheticLeague(10)))
+    assert league.bundle is None
+    assert league.league_id == "999"
+    assert "not valid JSON" in caplog.text
+
+
+def test_bootstrapped_league_replaces_saved_league(bundle, tmp_path, monkeypatch):
+    """Test saving a bundle of another league makes it the season's league."""
+    monkeypatch.setattr("faha.league.info_dir", lambda: tmp_path)
+    ids_file = tmp_path / "league_ids.json"
+    json_io.write(ids_file, {str(bundle.season - 1): "5", str(bundle.season): "999"})
+    assert save_bundle(bundle) == tmp_path / f"bundle_{bundle.season}.json"
+    assert json_io.read(ids_file) == {
+        str(bundle.season - 1): "5",
+        str(bundle.season): bundle.league_id,
+    }
+    assert saved_bundle(bundle.season) == bundle
+    assert League(bundle.season, FixtureYahoo(SyntheticLeague(10))).bundle == bundle
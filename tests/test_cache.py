@@ -0,0 +1,97 @@
+"""Player cache tests."""
+
+from faha.benchmark.fixtures import (
+    FixtureYahoo,
+    OfflineLeague,
+    SyntheticLeague,
+    offline_league,
+)
+from faha.cache import PlayerCache
+
+
+def _leagues(source: SyntheticLeague, cache: PlayerCache, num_leagues: int) -> list:
+    """Return leagues of the same game answered by a synthetic source."""
+    setup = offline_league(FixtureYahoo(source), source.league_id)
+    return [
+        OfflineLeague(
+            setup.season,
+            FixtureYahoo(source),
+            info=setup.info,
+            settings=setup.settings,
+            offline_league_id=str(index + 1),
+            player_cache=cache,
+        )
+        for index in range(num_leagues)
+    ]
+
+
+def test_leagues_share_player_stats():
+    """Test leagues of a game fetch the stats of each player once."""
+    source = SyntheticLeague(60, num_teams=2)
+    first, second = _leagues(source, PlayerCache(), 2)
+    first_requests = first.yahoo_agent.num_requests
+    players = first.all_players()
+    first_requests = first.yahoo_agent.num_requests - first_requests
+    second_requests = second.yahoo_agent.num_requests
+    assert second.all_players() == players
+    second_requests = second.yahoo_agent.num_requests - second_requests
+    # only the player pages are requested again, not the player stats
+    assert second_requests == first_requests // 2
+    assert second.taken_players() == first.taken_players()
+
+
+def test_cache_on_disk(tmp_path):
+    """Test a new cache reads the players stored by an earlier one."""
+    source = SyntheticLeague(30, num_teams=2)
+    (first,) = _leagues(source, PlayerCache(tmp_path), 1)
+    players = first.all_players()
+    (second,) = _leagues(source, PlayerCache(tmp_path), 1)
+    requests = second.yahoo_agent.num_requests
+    assert second.all_players() == players
+    assert second.yahoo_agent.num_requests - requests == 2
+
+
+def test_stale_players_are_fetched_again():
+    """Test players older than the maximum age are fetched again."""
+    fetched = []
+
+    def fetch(player_ids):
+        fetched.append(player_ids)
+        return [{"Player ID": player_id} for player_id in player_ids]
+
+    cache = PlayerCache(max_age=-1)
+    cache.get_many("453", ["1", "2"], fetch)
+    cache.get_many("453", ["1"], fetch)
+    assert fetched == [["1", "2"], ["1"]]
+    fresh = PlayerCache()
+    fresh.get_many("453", ["1", "2"], fetch)
+    assert fresh.get_many("453", ["2", "1"], fetch) == {
+        "2": {"Player ID": "2"},
+        "1": {"Player ID": "1"},
+    }
+    assert len(fetched) == 3
+
+
+def test_player_pass_writes_once(tmp_path, monkeypatch):
+    """Test a pass over the player pages writes the cache file once."""
+    saved = []
+    save = PlayerCache._save
+    monkeypatch.setattr(
+        PlayerCache,
+        "_save",
+        lambda self, game_key: saved.append(game_key) or save(self, game_key),
+    )
+    source = SyntheticLeague(60, num_teams=2)
+    (league,) = _leagues(source, PlayerCache(tmp_path), 1)
+    assert len(league.all_players()) > 25
+    assert saved == [source.game_key]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_unreadable_file_is_empty(tmp_path):
+    """Test a cache file cut short by an interrupted write is treated as empty."""
+    (tmp_path / "players_453.json").write_text('{"1": [0, {"Player', encoding="utf-8")
+    cache = PlayerCache(tmp_path)
+    players = cache.get_many("453", ["1"], lambda ids: [{"Player ID": "1"}])
+    assert players == {"1": {"Player ID": "1"}}
+    assert PlayerCache(tmp_path).get_many("453", ["1"], lambda ids: []) == players
@@ -0,0 +1,90 @@
+"""Daily stat store tests."""
+
+import datetime
+
+import numpy as np
+import pytest
+
+from faha.benchmark.fixtures import synthetic_league
+from faha.daily import DailyStatStore, RollingWindows
+from faha.pool import pool_values
+from faha.value import calculate_player_values
+from faha.weights import all_manager_team_stats, calculate_stat_weights
+
+FIRST_DAY = datetime.date(2024, 11, 1)
+
+
+@pytest.fixture(name="league", scope="module")
+def fixture_league():
+    """Return a small synthetic league."""
+    return synthetic_league(80, num_teams=2)
+
+
+def day_players(league, day: datetime.date) -> dict:
+    """Return the players who played on a day."""
+    players: dict = {}
+    for page in league.iter_players("ALL", date=day.isoformat()):
+        players |= page
+    return players
+
+
+def window_games(windows: RollingWindows, index: int) -> dict[str, float]:
+    """Return the games of the players who played in a window by ID."""
+    return {
+        player_id: games
+        for player_id, games in zip(windows.player_ids, windows.games[index])
+        if games > 0
+    }
+
+
+def test_windows_match_summed_days(league, tmp_path):
+    """Test windows updated a day at a time match windows summed from scratch."""
+    store = DailyStatStore(tmp_path)
+    days = [FIRST_DAY + datetime.timedelta(days=offset) for offset in range(12)]
+    for day in days[:5] + days[6:]:
+        store.record(day, day_players(league, day).values())
+    windows = store.windows()
+    assert windows.end == days[-1]
+    rebuilt = RollingWindows()
+    rebuilt.rebuild(days[-1], store.day_pool)
+    for index in range(len(windows.lengths)):
+        assert window_games(windows, index) == window_games(rebuilt, index)
+    games: dict[str, float] = {}
+    for day in days[-7:]:
+        pool = store.day_pool(day)
+        if pool is None:
+            continue
+        for player_id, played in zip(pool.player_ids, pool.games):
+            games[player_id] = games.get(player_id, 0.0) + played
+    assert window_games(windows, 0) == games
+    assert len(store.window_pool(30)) >= len(store.window_pool(14)) >= len(games)
+
+
+def test_recording_a_past_day_replaces_it(league, tmp_path):
+    """Test recording a day again replaces its stats in the windows."""
+    store = DailyStatStore(tmp_path)
+    for offset in range(3):
+        day = FIRST_DAY + datetime.timedelta(days=offset)
+        store.record(day, day_players(league, day).values())
+    totals = store.window_pool(7).games.sum()
+    replaced = store.record(FIRST_DAY, [])
+    assert replaced.end == FIRST_DAY + datetime.timedelta(days=2)
+    assert store.window_pool(7).games.sum() < totals
+
+
+def test_window_players_are_valued(league, tmp_path):
+    """Test window totals value the same as a pool as one player at a time."""
+    store = DailyStatStore(tmp_path)
+    for offset in range(7):
+        day = FIRST_DAY + datetime.timedelta(days=offset)
+        store.record(day, day_players(league, day).values())
+    weights = calculate_stat_weights(all_manager_team_stats(league))
+    players = store.window_players(7)
+    valued = calculate_player_values(players, weights)
+    expected = [valued[name]["Value"] for name in players]
+    np.testing.assert_allclose(
+        pool_values(store.window_pool(7), weights), expected, atol=1e-9
+    )
+    assert store.days() == [
+        FIRST_DAY + datetime.timedelta(days=offset) for offset in range(7)
+    ]
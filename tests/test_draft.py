@@ -0,0 +1,67 @@
+"""Draft valuation tests."""
+
+import numpy as np
+import pytest
+
+from faha.draft import DraftValuation
+from faha.utils.fenwick import FenwickTree
+from faha.vorp import (
+    REPLACEMENT_POSITIONS,
+    eligibility_matrix,
+    replacement_levels,
+)
+
+VALUES = {"1": 9.0, "2": 8.0, "3": 7.0, "4": 6.0, "5": 5.0, "6": 4.0, "7": 3.0}
+POSITIONS = {
+    "1": ["C"],
+    "2": ["C", "LW"],
+    "3": ["LW"],
+    "4": ["C"],
+    "5": ["LW"],
+    "6": ["G"],
+    "7": ["G"],
+}
+
+
+@pytest.fixture(name="valuation")
+def fixture_valuation():
+    """Return a draft valuation with one starter at each of C, LW and G."""
+    return DraftValuation(VALUES, POSITIONS, {"C": 1, "LW": 1, "G": 1})
+
+
+def test_fenwick_tree():
+    """Test prefix sums and searches follow added values."""
+    tree = FenwickTree(5)
+    for index, value in enumerate([1, 0, 2, 1, 1]):
+        tree.add(index, value)
+    assert tree.prefix_sum(3) == 3
+    assert [tree.search(target) for target in (1, 2, 3, 4, 5, 6)] == [0, 2, 2, 3, 4, 5]
+
+
+def test_initial_levels_match_vorp(valuation):
+    """Test the initial replacement levels match the whole pool calculation."""
+    ids = list(VALUES)
+    expected = replacement_levels(
+        np.array([VALUES[player_id] for player_id in ids]),
+        eligibility_matrix([POSITIONS[player_id] for player_id in ids]),
+        np.array([1, 1, 0, 0, 1]),
+    )
+    levels = valuation.replacement_levels()
+    assert [levels[position] for position in REPLACEMENT_POSITIONS] == list(expected)
+
+
+def test_remove_and_restore(valuation):
+    """Test taking players fills slots and moves replacement levels."""
+    assert valuation.value("1") == 1.0
+    assert valuation.remove("2") == "LW"
+    assert valuation.open_starters("LW") == 0
+    assert valuation.replacement_level("LW") == 7.0
+    assert valuation.replacement_level("C") == 6.0
+    assert valuation.value("1") == 3.0
+    assert valuation.starter_value("C") == 9.0
+    assert [player_id for player_id, _ in valuation.top(2)] == ["1", "6"]
+    valuation.restore("2")
+    assert valuation.value("1") == 1.0
+    assert valuation.open_starters("LW") == 1
+    with pytest.raises(KeyError):
+        valuation.restore("2")
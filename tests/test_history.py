@@ -0,0 +1,58 @@
+"""Historical stat store tests."""
+
+import pytest
+
+from faha.benchmark.fixtures import FixtureYahoo, SyntheticLeague
+from faha.history import HistoryStore, backfill
+
+SEASONS = [2021, 2022, 2023]
+
+
+class InterruptedSource:
+    """Synthetic league that fails after a number of player page requests."""
+
+    def __init__(self, source: SyntheticLeague, pages: int) -> None:
+        """Initialize class."""
+        self.source = source
+        self.pages = pages
+
+    def __call__(self, uri: str) -> str:
+        """Return the response to a request until the pages run out."""
+        if uri.startswith("game/"):
+            if self.pages == 0:
+                raise RuntimeError("Interrupted")
+            self.pages -= 1
+        return self.source(uri)
+
+
+def test_backfill_stores_every_season(tmp_path):
+    """Test every player of every season is stored once."""
+    source = SyntheticLeague(60)
+    store = HistoryStore(tmp_path / "history.jsonl")
+    counts = backfill(FixtureYahoo(source), SEASONS, store, workers=3)
+    assert counts == {season: 60 for season in SEASONS}
+    seasons = store.seasons()
+    assert list(seasons) == SEASONS
+    assert all(len(players) == 60 for players in seasons.values())
+    assert seasons[2021]["1"]["Season Stats"] != seasons[2022]["1"]["Season Stats"]
+    assert store.completed_seasons() == set(SEASONS)
+
+
+def test_backfill_resumes_after_interruption(tmp_path):
+    """Test an interrupted backfill resumes without refetching stored pages."""
+    source = SyntheticLeague(60)
+    store = HistoryStore(tmp_path / "history.jsonl")
+    with pytest.raises(RuntimeError):
+        backfill(FixtureYahoo(InterruptedSource(source, 4)), SEASONS, store, 1)
+    with open(store.path, "a", encoding="utf-8") as file_handle:
+        file_handle.write('{"Season": 2023, "Player')
+    resumed = HistoryStore(store.path)
+    yahoo_agent = FixtureYahoo(source)
+    counts = backfill(yahoo_agent, SEASONS, resumed, workers=1)
+    # the first season and a page of the second were stored before the failure
+    assert counts == {2022: 35, 2023: 60}
+    assert yahoo_agent.num_requests == 1 + 2 + 3
+    reference = HistoryStore(tmp_path / "reference.jsonl")
+    backfill(FixtureYahoo(source), SEASONS, reference)
+    assert resumed.seasons() == reference.seasons()
+    assert backfill(yahoo_agent, SEASONS, resumed) == {}
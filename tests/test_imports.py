@@ -0,0 +1,59 @@
+"""Import tests of the command line entry points."""
+
+import functools
+import subprocess
+import sys
+import tomllib
+from pathlib import Path
+
+import pytest
+
+HEAVY_MODULES = {
+    "dill",
+    "glom",
+    "numpy",
+    "pandas",
+    "requests",
+    "streamlit",
+    "yahoo_oauth",
+}
+# entry points whose own modules compute with arrays, so they load numpy
+ARRAY_SCRIPTS = {
+    "backtest_weights",
+    "rank_streamers",
+    "record_daily_stats",
+    "run_benchmarks",
+    "serve_rankings",
+    "simulate_draft",
+}
+PYPROJECT = Path(__file__).resolve().parents[1] / "pyproject.toml"
+
+
+def entry_point_modules() -> dict[str, str]:
+    """Return the module of each console script."""
+    with open(PYPROJECT, "rb") as file_handle:
+        scripts = tomllib.load(file_handle)["project"]["scripts"]
+    return {name: target.split(":")[0] for name, target in scripts.items()}
+
+
+@functools.cache
+def imported_packages(module: str) -> frozenset[str]:
+    """Return the top level packages loaded by importing a module.
+
+    Each module is imported once, in a fresh interpreter.
+    """
+    code = (
+        f"import sys, {module}\n"
+        "print('\\n'.join({name.split('.')[0] for name in sys.modules}))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    return frozenset(result.stdout.split())
+
+
+@pytest.mark.parametrize("script", sorted(entry_point_modules()))
+def test_entry_point_imports(script):
+    """Test the entry points leave heavy dependencies until they are used."""
+    heavy = HEAVY_MODULES - {"numpy"} if script in ARRAY_SCRIPTS else HEAVY_MODULES
+    assert not heavy & imported_packages(entry_point_modules()[script])
@@ -0,0 +1,39 @@
+"""Streaming JSON decoding tests."""
+
+import json
+
+from faha.utils.json_stream import iter_members
+
+DOCUMENT = {
+    "fantasy_content": {
+        "players": {
+            "0": {"player": [{"name": 'Tim "Stü}tzle{"'}, ["[", 1.5, None]]},
+            "1": {"player": [{"name": "Élie \\ Pettersson"}, []]},
+            "count": 2,
+        },
+        "copyright": "Yahoo",
+    }
+}
+
+
+def test_iter_members_in_any_chunks():
+    """Test the members are decoded however the document is chunked."""
+    text = json.dumps(DOCUMENT, ensure_ascii=False).encode("utf-8")
+    expected = [
+        (key, value)
+        for key, value in DOCUMENT["fantasy_content"]["players"].items()
+        if key != "count"
+    ]
+    for size in range(1, len(text) + 1):
+        chunks = [
+            text[ind : ind + size] for ind in range(0, len(text), size)  # noqa: E203
+        ]
+        returned = list(iter_members(chunks, ("fantasy_content", "players")))
+        assert returned == expected
+
+
+def test_iter_members_of_array():
+    """Test the members of an array within an array are decoded with their index."""
+    text = json.dumps({"league": [{"key": "a"}, [{"id": 1}, 2, {"id": 3}]]})
+    returned = list(iter_members([text], ("league", 1)))
+    assert returned == [(0, {"id": 1}), (2, {"id": 3})]
@@ -0,0 +1,81 @@
+"""Lineup optimizer tests."""
+
+import numpy as np
+import pytest
+
+from faha.benchmark.fixtures import synthetic_league
+from faha.lineup import LineupOptimizer, slot_accepts
+from faha.weights import all_manager_team_stats, calculate_stat_weights
+
+SLOTS = {"C": 1, "LW": 1, "RW": 1, "D": 2, "Util": 1, "G": 1, "BN": 3, "IR+": 1}
+
+
+@pytest.fixture(name="optimizer", scope="module")
+def fixture_optimizer():
+    """Return the lineup optimizer of a small synthetic league."""
+    league = synthetic_league(120, num_teams=4)
+    weights = calculate_stat_weights(all_manager_team_stats(league))
+    return LineupOptimizer.from_league(league, weights)
+
+
+def best_value(optimizer: LineupOptimizer, rows: list[int], values) -> float:
+    """Return the best lineup value by trying every assignment of the slots."""
+    slots = [
+        position
+        for position, count in SLOTS.items()
+        if position not in ("BN", "IR+")
+        for _ in range(count)
+    ]
+
+    def fill(index: int, available: frozenset) -> float:
+        if index == len(slots):
+            return 0.0
+        best = fill(index + 1, available)
+        for row in available:
+            if slot_accepts(slots[index], optimizer.pool.positions[row]):
+                best = max(best, values[row] + fill(index + 1, available - {row}))
+        return best
+
+    return fill(0, frozenset(rows))
+
+
+def test_lineup_is_optimal(optimizer):
+    """Test lineups match the best of every assignment on random rosters."""
+    small = LineupOptimizer(optimizer.pool, optimizer.values, SLOTS)
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        rows = list(rng.choice(len(small.pool), size=9, replace=False))
+        games = (rng.random(len(small.pool)) < 0.6).astype(float)
+        player_ids = [small.pool.player_ids[row] for row in rows]
+        lineup = small.lineup(player_ids, games)
+        values = small.values * games
+        assert lineup.value == pytest.approx(
+            best_value(small, rows, np.maximum(values, 0))
+        )
+        num_started = sum(len(ids) for ids in lineup.slots.values())
+        assert num_started + len(lineup.bench) == 9
+        for position, ids in lineup.slots.items():
+            assert len(ids) <= SLOTS[position]
+            for player_id in ids:
+                row = small.pool.row(player_id)
+                assert games[row] > 0
+                assert slot_accepts(position, small.pool.positions[row])
+
+
+def test_starts_every_team_every_day(optimizer):
+    """Test the daily starts match the lineup of each team on each day."""
+    rng = np.random.default_rng(1)
+    games = (rng.random((7, len(optimizer.pool))) < 0.5).astype(float)
+    started = optimizer.starts(games)
+    assert started.shape == games.shape
+    assert not (started & (games == 0)).any()
+    for player_ids in optimizer.rosters.values():
+        for day in range(7):
+            lineup = optimizer.lineup(player_ids, games[day])
+            expected = {player_id for ids in lineup.slots.values() for player_id in ids}
+            team_started = {
+                player_id
+                for player_id in player_ids
+                if started[day, optimizer.pool.row(player_id)]
+            }
+            assert team_started == expected
@@ -0,0 +1,72 @@
+"""Matchup tests."""
+
+import numpy as np
+import pytest
+
+from faha.benchmark.fixtures import (
+    FixtureYahoo,
+    SyntheticLeague,
+    offline_league,
+    synthetic_league,
+)
+from faha.matchup import (
+    MatchupEngine,
+    category_count_distribution,
+    normal_cdf,
+)
+
+
+@pytest.fixture(name="engine", scope="module")
+def fixture_engine():
+    """Return a matchup engine of a small synthetic league."""
+    return MatchupEngine.from_league(synthetic_league(120, num_teams=4))
+
+
+def test_from_league_skips_players_sharing_a_name():
+    """Test rostered players collapsed by a shared name do not break the engine."""
+    source = SyntheticLeague(120, num_teams=4)
+    first, second = source.players[0]["player"][0], source.players[4]["player"][0]
+    second[2]["name"] = first[2]["name"]
+    engine = MatchupEngine.from_league(
+        offline_league(FixtureYahoo(source), source.league_id)
+    )
+    assert engine.rosters.sum() == len(engine.pool) == source.num_taken - 1
+
+
+def test_normal_cdf():
+    """Test the normal distribution function at known points."""
+    np.testing.assert_allclose(
+        normal_cdf(np.array([-1.96, 0.0, 1.0])), [0.025, 0.5, 0.8413], atol=1e-4
+    )
+
+
+def test_category_count_distribution():
+    """Test the number of categories won of two independent categories."""
+    distribution = category_count_distribution(np.array([0.5, 0.2]))
+    np.testing.assert_allclose(distribution, [0.4, 0.5, 0.1])
+
+
+def test_matchups_are_complementary(engine):
+    """Test a team's win, tie and loss probabilities add up to one."""
+    matchups = engine.matchups()
+    assert matchups.win.shape == (1, 4, 4)
+    np.testing.assert_allclose(
+        matchups.win + matchups.tie + matchups.win.transpose(0, 2, 1), 1
+    )
+    np.testing.assert_allclose(
+        matchups.category_win + matchups.category_win.transpose(0, 2, 1, 3), 1
+    )
+
+
+def test_roster_change(engine):
+    """Test emptying a roster makes the team lose to everyone else."""
+    roster = [
+        player_id
+        for player_id, row in zip(engine.pool.player_ids, engine.rosters[0])
+        if row
+    ]
+    engine.set_roster(engine.teams[0], [])
+    try:
+        assert (engine.matchups().win[0, 1:, 0] > 0.5).all()
+    finally:
+        engine.set_roster(engine.teams[0], roster)
@@ -0,0 +1,84 @@
+"""Points league scoring tests."""
+
+import copy
+
+import numpy as np
+import pytest
+
+from faha.benchmark.fixtures import synthetic_league
+from faha.league import stat_point_values
+from faha.players import STAT_IDS
+from faha.pool import StatPool, pool_points
+from faha.value import calculate_player_points, calculate_player_values
+from faha.weights import calculate_point_weights
+
+POINTS = {
+    "Goals": 3.0,
+    "Assists": 2.0,
+    "Shots on Goal": 0.5,
+    "Hits": 0.25,
+    "Wins": 4.0,
+    "Saves": 0.2,
+    "Shutouts": 3.0,
+}
+
+
+@pytest.fixture(name="league", scope="module")
+def fixture_league():
+    """Return a small synthetic points league."""
+    league = synthetic_league(100, num_teams=4)
+    league.settings = copy.deepcopy(league.settings)
+    settings = league.settings["settings"][0]
+    settings["scoring_type"] = "headpoint"
+    settings["stat_modifiers"] = {
+        "stats": [
+            {"stat": {"stat_id": int(STAT_IDS[name]), "value": str(points)}}
+            for name, points in POINTS.items()
+        ]
+        # goals against is not extracted for players
+        + [{"stat": {"stat_id": 22, "value": "-1"}}]
+    }
+    return league
+
+
+def expected_points(player: dict) -> float:
+    """Return the fantasy points of a player summed one stat at a time."""
+    stats = player["Season Stats"]
+    return sum(points * stats.get(name, 0) for name, points in POINTS.items())
+
+
+def test_point_values_from_settings(league):
+    """Test point values are read from points league settings only."""
+    assert league.point_values == POINTS
+    category_settings = {"settings": [{"scoring_type": "head"}]}
+    assert stat_point_values(category_settings) is None
+
+
+def test_points_per_game(league):
+    """Test the pool is scored in points and points per game at once."""
+    players = league.all_players()
+    weights = calculate_point_weights(POINTS)
+    points, points_per_game = pool_points(
+        StatPool.from_players(players.values()), weights
+    )
+    expected = np.array([expected_points(player) for player in players.values()])
+    np.testing.assert_allclose(points, expected)
+    valued = calculate_player_values(players, weights)
+    np.testing.assert_allclose(
+        points_per_game, [player["Value"] for player in valued.values()]
+    )
+    scored = calculate_player_points(players, weights)
+    np.testing.assert_allclose(
+        [player["Fantasy Points"] for player in scored.values()], expected
+    )
+
+
+def test_points_league_values_players(league):
+    """Test players of a points league are valued by points per game."""
+    weights = calculate_point_weights(POINTS)
+    page = next(league.iter_players("ALL", weights=weights))
+    for player in page.values():
+        stats = player["Season Stats"]
+        games = stats.get("Games Played", stats.get("Games Started"))
+        assert player["Fantasy Points"] == pytest.approx(expected_points(player))
+        assert player["Value"] == pytest.approx(expected_points(player) / games)
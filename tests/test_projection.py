@@ -0,0 +1,60 @@
+"""Projection tests."""
+
+import numpy as np
+
+from faha.benchmark.fixtures import synthetic_league
+from faha.players import OffensePlayer
+from faha.pool import (
+    OFFENSE_CATEGORIES,
+    StatPool,
+    pool_values,
+)
+from faha.projection import Projector
+from faha.value import calculate_player_values
+from faha.weights import all_manager_team_stats, calculate_stat_weights
+
+
+def skater(player_id: str, games: int, goals: int) -> OffensePlayer:
+    """Return a center with goals and no other stats."""
+    stats = {category: 0 for category in OFFENSE_CATEGORIES}
+    return {  # type: ignore
+        "Player ID": player_id,
+        "Name": f"Player {player_id}",
+        "NHL Team": "TOR",
+        "Positions": ["C"],
+        "Position Type": "P",
+        "Season Stats": {"Games Played": games} | stats | {"Goals": goals},
+    }
+
+
+def test_projection_blends_seasons_and_position_mean():
+    """Test rates blend weighted past seasons with the position mean."""
+    history = {
+        2021: {"1": skater("1", 80, 40)},
+        2022: {"1": skater("1", 40, 10), "2": skater("2", 80, 8)},
+    }
+    pool = StatPool.from_players([skater("1", 0, 0), skater("2", 10, 2)])
+    projector = Projector(history, 2023, recency=0.5, regression_games=10)
+    projected = projector.project(pool)
+    games = np.array([0.25 * 80 + 0.5 * 40, 10 + 0.5 * 80])
+    goals = np.array([0.25 * 40 + 0.5 * 10, 2 + 0.5 * 8])
+    mean = goals.sum() / games.sum()
+    expected = (goals + 10 * mean) / (games + 10) * 82
+    np.testing.assert_allclose(projected.totals[:, 0], expected)
+    np.testing.assert_array_equal(projected.games, [82, 82])
+    other = StatPool.from_players([skater("1", 0, 0)])
+    assert projector.project(other) is not projected
+    assert projector.project(pool) is projected
+
+
+def test_projected_players_are_valued():
+    """Test projected players feed the valuation functions."""
+    league = synthetic_league(100, num_teams=4)
+    players = league.all_players()
+    weights = calculate_stat_weights(all_manager_team_stats(league))
+    history = {2022: {player["Player ID"]: player for player in players.values()}}
+    projector = Projector(history, 2023)
+    valued = calculate_player_values(projector.project_players(players), weights)
+    pool = projector.project(StatPool.from_players(players.values()))
+    expected = [valued[name]["Value"] for name in players]
+    np.testing.assert_allclose(pool_values(pool, weights), expected, atol=1e-12)
@@ -0,0 +1,40 @@
+"""Ranking tests."""
+
+import pytest
+
+from faha.ranking import RankedIndex
+
+
+@pytest.fixture(name="index")
+def fixture_index():
+    """Return a ranked index of a few players."""
+    return RankedIndex.from_values(
+        [
+            ("1", 3.0, ["C"]),
+            ("2", 5.0, ["C", "W"]),
+            ("3", 1.0, ["D"]),
+            ("4", 4.0, ["W"]),
+        ]
+    )
+
+
+def test_top(index):
+    """Test top overall and by group."""
+    assert index.top(2) == ["2", "4"]
+    assert index.top(5, "C") == ["2", "1"]
+    assert index.top_items(1, "D") == [("3", 1.0)]
+
+
+def test_rank_after_updates(index):
+    """Test ranks follow removals, additions and value changes."""
+    assert index.rank("1") == 3
+    index.remove("2")
+    assert index.rank("1") == 2
+    assert index.rank("1", "C") == 1
+    index.update("3", 10.0)
+    assert index.top(1) == ["3"]
+    index.add("2", 5.0, ["C", "W"])
+    assert index.top(2, "W") == ["2", "4"]
+    assert index.value_at(2, "C") == 3.0
+    with pytest.raises(KeyError):
+        index.rank("3", "C")
@@ -0,0 +1,176 @@
+"""Season schedule and weekly planner tests."""
+
+import datetime
+import random
+
+import numpy as np
+import pytest
+
+from faha.benchmark.fixtures import (
+    NHL_TEAMS,
+    FixtureYahoo,
+    SyntheticLeague,
+    offline_league,
+)
+from faha.pool import (
+    SAVE_PERCENTAGE,
+    StatPool,
+    pool_values,
+)
+from faha.schedule import (
+    SCHEDULE_DAYS,
+    SeasonSchedule,
+    WeeklyPlanner,
+    fetch_schedule,
+    load_schedule,
+    nhl_abbreviation,
+)
+from faha.weights import all_manager_team_stats, calculate_stat_weights
+
+DAY = datetime.date(2024, 11, 6)  # Wednesday of the fifth week
+NUM_WEEKS = 25
+
+
+class ScheduledLeague(SyntheticLeague):
+    """Synthetic league that also answers the fantasy weeks of its game."""
+
+    def respond(self, uri: str) -> dict:
+        """Return the decoded response to a request."""
+        if uri == f"game/{self.game_key}/game_weeks":
+            return self.game_weeks()
+        return super().respond(uri)
+
+    def game_weeks(self) -> dict:
+        """Return the fantasy weeks of the game, from the Monday after October 1."""
+        october = datetime.date(self.season, 10, 1)
+        first = october + datetime.timedelta(days=7 - october.weekday())
+        weeks = {
+            str(week): {
+                "game_week": {
+                    "week": str(week + 1),
+                    "display_name": str(week + 1),
+                    "start": (first + datetime.timedelta(weeks=week)).isoformat(),
+                    "end": (first + datetime.timedelta(weeks=week, days=6)).isoformat(),
+                }
+            }
+            for week in range(NUM_WEEKS)
+        }
+        return {
+            "fantasy_content": {
+                "game": [
+                    {"game_key": self.game_key, "season": str(self.season)},
+                    {"game_weeks": weeks | {"count": NUM_WEEKS}},
+                ]
+            }
+        }
+
+
+def nhl_week_games(start: datetime.date) -> dict[str, list[tuple[str, str]]]:
+    """Return the away and home teams of the NHL games on each day of a week.
+
+    Each day between four and eleven pairs of the NHL teams play.
+    """
+    teams = [nhl_abbreviation(team) for team in NHL_TEAMS]
+    days = {}
+    for offset in range(SCHEDULE_DAYS):
+        date = (start + datetime.timedelta(days=offset)).isoformat()
+        rng = random.Random(f"schedule-{date}")
+        playing = rng.sample(teams, 2 * rng.randint(4, 11))
+        days[date] = list(zip(playing[::2], playing[1::2]))
+    return days
+
+
+@pytest.fixture(name="source", scope="module")
+def fixture_source():
+    """Return a synthetic league."""
+    return ScheduledLeague(120, num_teams=4)
+
+
+@pytest.fixture(name="schedule", scope="module")
+def fixture_schedule(source):
+    """Return the schedule of the synthetic league's season."""
+    return fetch_schedule(
+        FixtureYahoo(source), source.game_key, source.season, nhl_week_games
+    )
+
+
+@pytest.fixture(name="planner", scope="module")
+def fixture_planner(source, schedule):
+    """Return the weekly planner of the synthetic league's free agents."""
+    league = offline_league(FixtureYahoo(source), source.league_id)
+    pool = StatPool.from_players(league.available_players().values())
+    return WeeklyPlanner(pool, schedule, DAY)
+
+
+def test_schedule_counts_games(schedule):
+    """Test every team plays at most once a day and weeks sum the days."""
+    assert len(schedule.weeks) == 25
+    assert schedule.games.shape == (32, 25 * 7)
+    assert schedule.games.max() == 1
+    assert (schedule.games.sum(axis=0) % 2 == 0).all()
+    weekly = schedule.week_matrix()
+    assert weekly.sum() == schedule.games.sum()
+    assert np.array_equal(weekly[:, 0], schedule.games[:, :7].sum(axis=1))
+    assert schedule.week_of(DAY) == 4
+    remaining = schedule.week_matrix(DAY)
+    assert np.array_equal(remaining[:, 4], schedule.games[:, 30:35].sum(axis=1))
+    assert not remaining[:, :4].any()
+    assert np.array_equal(remaining[:, 5:], weekly[:, 5:])
+    with pytest.raises(ValueError):
+        schedule.week_of(datetime.date(2025, 6, 1))
+
+
+def test_schedule_is_fetched_once(source, schedule, tmp_path, monkeypatch):
+    """Test the schedule is fetched once, then read from disk unless refreshed."""
+    monkeypatch.setattr("faha.schedule.info_dir", lambda: tmp_path)
+    fetched: list[datetime.date] = []
+
+    def week_games(start):
+        fetched.append(start)
+        return nhl_week_games(start)
+
+    yahoo_agent = FixtureYahoo(source)
+    league = offline_league(yahoo_agent, source.league_id)
+    num_requests = yahoo_agent.num_requests
+    loaded = load_schedule(league, week_games)
+    assert len(fetched) == 25
+    assert yahoo_agent.num_requests == num_requests + 1
+    assert load_schedule(league, week_games).weeks == loaded.weeks
+    assert len(fetched) == 25
+    assert yahoo_agent.num_requests == num_requests + 1
+    load_schedule(league, week_games, refresh=True)
+    assert len(fetched) == 50
+    assert yahoo_agent.num_requests == num_requests + 2
+    read = SeasonSchedule.read(tmp_path / "schedule_2024.json")
+    assert read.teams == schedule.teams
+    assert np.array_equal(read.games, schedule.games)
+
+
+def test_planner_spreads_team_games(planner, schedule):
+    """Test players get their share of their team's remaining games."""
+    pool = planner.pool
+    played = schedule.games_played(DAY)
+    remaining = schedule.week_matrix(DAY)
+    for row in range(len(pool)):
+        team = schedule.teams.index(nhl_abbreviation(pool.nhl_teams[row]))
+        share = min(pool.games[row] / played[team], 1.0)
+        assert planner.games[row] == pytest.approx(share * remaining[team])
+    totals = planner.weekly_totals()
+    rates = pool.per_game()
+    assert totals[:, :SAVE_PERCENTAGE] == pytest.approx(
+        rates[:, :SAVE_PERCENTAGE] * planner.games[:, 4, np.newaxis]
+    )
+    assert np.array_equal(totals[:, SAVE_PERCENTAGE], pool.totals[:, SAVE_PERCENTAGE])
+
+
+def test_streamers_are_best_rest_of_week_values(source, planner):
+    """Test streamers are the players worth most over the rest of the week."""
+    league = offline_league(FixtureYahoo(source), source.league_id)
+    weights = calculate_stat_weights(all_manager_team_stats(league))
+    values = pool_values(planner.pool, weights) * planner.games[:, 4]
+    streamers = planner.streamers(weights, 5)
+    assert [value for _, _, value in streamers] == pytest.approx(
+        sorted(values)[::-1][:5]
+    )
+    for player_id, games, _ in streamers:
+        assert games == planner.games[planner.pool.row(player_id), 4]
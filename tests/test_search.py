@@ -0,0 +1,58 @@
+"""Player search tests."""
+
+import pytest
+
+from faha.search import (
+    EXACT,
+    FUZZY,
+    PREFIX,
+    PlayerSearchIndex,
+    best_match,
+    fold,
+)
+
+
+@pytest.fixture(name="index")
+def fixture_index():
+    """Return a search index of a few players."""
+    return PlayerSearchIndex.from_names(
+        [
+            ("1", "Connor McDavid"),
+            ("2", "Connor Bedard"),
+            ("3", "Élie Dahbou"),
+            ("4", "Jérémy Swayman"),
+            ("5", "Alex DeBrincat"),
+        ]
+    )
+
+
+def test_fold():
+    """Test names are folded without case, accents or punctuation."""
+    assert fold("  Jérémy  O'Reilly-Tkäčuk ") == "jeremy oreilly tkacuk"
+
+
+def test_exact_and_prefix_matches(index):
+    """Test exact names rank first and prefixes match any word."""
+    matches = index.search("connor mcdavid")
+    assert matches[0] == ("1", EXACT, 1.0)
+    assert {match.player_id for match in index.search("conn")} == {"1", "2"}
+    assert {match.tier for match in index.search("conn")} == {PREFIX}
+    assert best_match(index.search("conn")) is None
+    assert best_match(index.search("bed")).player_id == "2"
+    assert best_match(index.search("jeremy")).player_id == "4"
+
+
+def test_fuzzy_matches(index):
+    """Test misspelt names resolve to the closest player."""
+    match = best_match(index.search("Conor McDavd"))
+    assert match is not None and match.player_id == "1"
+    assert index.search("Swaymen")[0].tier == FUZZY
+    assert best_match(index.search("Swaymen")).player_id == "4"
+    assert best_match(index.search("conor")) is None
+    assert index.search("zzzz") == []
+
+
+def test_search_excludes_players(index):
+    """Test searches skip players that are not included."""
+    matches = index.search("conn", include=lambda player_id: player_id != "1")
+    assert [match.player_id for match in matches] == ["2"]
@@ -0,0 +1,56 @@
+"""Sensitivity analysis tests."""
+
+import numpy as np
+import pytest
+
+from faha.benchmark.fixtures import synthetic_league
+from faha.pool import StatPool, pool_values
+from faha.sensitivity import (
+    WeightGrid,
+    sensitivity_analysis,
+    weight_matrix,
+)
+from faha.value import calculate_player_values
+from faha.weights import all_manager_team_stats, calculate_stat_weights
+
+
+@pytest.fixture(name="league_stats", scope="module")
+def fixture_league_stats():
+    """Return the players and team stats of a small synthetic league."""
+    league = synthetic_league(200, num_teams=6)
+    return league.all_players(), all_manager_team_stats(league)
+
+
+def test_pool_values_match_player_values(league_stats):
+    """Test vectorized values match values calculated one player at a time."""
+    players, team_stats = league_stats
+    weights = calculate_stat_weights(team_stats)
+    valued = calculate_player_values(players, weights)
+    pool = StatPool.from_players(players.values())
+    expected = [valued[name]["Value"] for name in players]
+    np.testing.assert_allclose(pool_values(pool, weights), expected, atol=1e-12)
+
+
+def test_grid_weight_matrix(league_stats):
+    """Test the grid weights match weights calculated one variant at a time."""
+    _, team_stats = league_stats
+    grid = WeightGrid(
+        top_teams=(1, 3), plus_minus_weight=(0, 1), save_percentage_scale=(40, 60)
+    )
+    expected = weight_matrix(
+        calculate_stat_weights(team_stats, **variant) for variant in grid.variants()
+    )
+    np.testing.assert_allclose(grid.weight_matrix(team_stats), expected)
+
+
+def test_rank_stability(league_stats):
+    """Test the baseline variant is perfectly stable against itself."""
+    players, team_stats = league_stats
+    grid = WeightGrid(plus_minus_weight=(1 / 3, 2))
+    result = sensitivity_analysis(
+        players.values(), grid.weight_matrix(team_stats), top=10
+    )
+    assert result.values.shape == (2, len(players))
+    assert result.stability.spearman[0] == pytest.approx(1)
+    assert result.stability.top_overlap[0] == 1
+    assert sorted(result.stability.ranks[1]) == list(range(1, len(players) + 1))
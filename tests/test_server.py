@@ -0,0 +1,71 @@
+"""Rankings server tests."""
+
+import json
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import pytest
+
+from faha.benchmark.fixtures import synthetic_league
+from faha.board import DraftBoard
+from faha.server import serve
+
+
+@pytest.fixture(name="server")
+def fixture_server():
+    """Run a rankings server of a small synthetic league."""
+    players = synthetic_league(60, num_teams=2).all_players()
+    board = DraftBoard.from_players(
+        player | {"Value": float(-int(player["Player ID"]))}
+        for player in players.values()
+    )
+    with serve(board) as server:
+        yield server
+
+
+def request(server, path: str, method: str = "GET"):
+    """Return the status and decoded response of a request to the server."""
+    req = urllib.request.Request(f"{server.url}{path}", method=method)
+    try:
+        with urllib.request.urlopen(req) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as error:
+        return error.code, json.load(error)
+
+
+def test_top_and_lookup(server):
+    """Test top players and player lookups match the board."""
+    status, top = request(server, "/top?n=3")
+    assert status == 200
+    assert [player["Player ID"] for player in top] == ["1", "2", "3"]
+    status, centers = request(server, "/top?position=c&n=2")
+    assert [player["Player ID"] for player in centers] == [
+        player["Player ID"] for player in server.board.top(2, "C")
+    ]
+    status, player = request(server, "/players/2")
+    assert player["Rank"] == 2 and player["Remaining"]
+    assert request(server, "/top?position=X")[0] == 400
+    assert request(server, "/players/999")[0] == 404
+
+
+def test_delete_and_undo_are_shared(server):
+    """Test deletes and undos change the board every client sees."""
+    status, deleted = request(server, "/players/1/delete", "POST")
+    assert status == 200 and deleted["Player ID"] == "1"
+    assert request(server, "/players/1/delete", "POST")[0] == 404
+    assert request(server, "/top?n=1")[1][0]["Player ID"] == "2"
+    assert not request(server, "/players/1")[1]["Remaining"]
+    assert request(server, "/status")[1]["deleted"] == 1
+    status, restored = request(server, "/undo", "POST")
+    assert restored["Player ID"] == "1"
+    assert request(server, "/top?n=1")[1][0]["Player ID"] == "1"
+
+
+def test_search(server):
+    """Test searches return the remaining players matching a name."""
+    name = server.board.players["5"]["Name"]
+    query = urllib.parse.quote(name.split()[1][:4])
+    status, matches = request(server, f"/search?q={query}&n=50")
+    assert status == 200
+    assert "5" in [match["Player ID"] for match in matches]
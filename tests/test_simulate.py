@@ -0,0 +1,50 @@
+"""Draft simulation tests."""
+
+import numpy as np
+
+from faha.simulate import (
+    draft_order,
+    position_caps,
+    simulate_drafts,
+)
+
+ROSTER_SLOTS = {"C": 1, "LW": 1, "G": 1, "BN": 1, "IR+": 1}
+
+
+def _players() -> list[dict]:
+    positions = [["C"], ["LW"], ["G"], ["C", "LW"]] * 5
+    return [
+        {"Player ID": str(index), "Value": 20.0 - index, "Positions": eligible}
+        for index, eligible in enumerate(positions)
+    ]
+
+
+def test_draft_order():
+    """Test a snake draft reverses every round."""
+    np.testing.assert_array_equal(draft_order(3, 2), [0, 1, 2, 2, 1, 0])
+    np.testing.assert_array_equal(draft_order(2, 2, snake=False), [0, 1, 0, 1])
+
+
+def test_position_caps():
+    """Test caps are the starter slots plus the bench."""
+    np.testing.assert_array_equal(position_caps(ROSTER_SLOTS), [2, 2, 1, 1, 2])
+
+
+def test_noiseless_drafts():
+    """Test drafts without noise take players in order of value."""
+    simulation = simulate_drafts(
+        _players(), ROSTER_SLOTS, num_teams=2, team=1, num_drafts=8, noise=0
+    )
+    np.testing.assert_array_equal(simulation.picks, [2, 3, 6, 7])
+    assert simulation.probability("0", 2) == 0
+    assert simulation.probability("1", 2) == 1
+    assert simulation.probability("1", 3) == 0
+
+
+def test_parallel_batches_match():
+    """Test spreading batches over processes gives the same result."""
+    kwargs = {"num_teams": 2, "team": 0, "num_drafts": 40, "batch_size": 10, "seed": 3}
+    serial = simulate_drafts(_players(), ROSTER_SLOTS, workers=1, **kwargs)
+    parallel = simulate_drafts(_players(), ROSTER_SLOTS, workers=2, **kwargs)
+    np.testing.assert_array_equal(serial.availability, parallel.availability)
+    assert 0 < serial.availability[1:].mean() < 1
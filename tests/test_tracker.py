@@ -0,0 +1,72 @@
+"""Draft tracker tests."""
+
+from faha.benchmark.fixtures import synthetic_league
+from faha.board import DraftBoard
+from faha.tracker import (
+    DraftPoller,
+    DraftTracker,
+    apply_picks,
+)
+
+
+def _board(league) -> DraftBoard:
+    players = league.all_players()
+    return DraftBoard.from_players(
+        player | {"Value": float(-int(player["Player ID"]))}
+        for player in players.values()
+    )
+
+
+def test_poll_only_returns_new_picks():
+    """Test the cursor skips picks already seen."""
+    league = synthetic_league(60, num_teams=2, num_picks=3)
+    tracker = DraftTracker(league)
+    assert [pick["Pick"] for pick in tracker.poll()] == [1, 2, 3]
+    assert tracker.poll() == []
+    league.yahoo_agent.source.num_picks = 5
+    picks = tracker.poll()
+    assert [pick["Pick"] for pick in picks] == [4, 5]
+    assert picks[0]["Player ID"] == "4"
+    assert picks[1]["Team Key"].endswith(".t.1")
+
+
+def test_apply_picks_skips_players_off_the_board():
+    """Test picks delete players by ID and ignore players already deleted."""
+    league = synthetic_league(60, num_teams=2, num_picks=4)
+    board = _board(league)
+    board.delete("2")
+    picks = DraftTracker(league).poll()
+    deleted = apply_picks(board, picks)
+    assert [player["Player ID"] for player in deleted] == ["1", "3", "4"]
+    assert not any(pick["Player ID"] in board for pick in picks)
+
+
+def test_poller_queues_picks():
+    """Test the background poller queues new picks."""
+    league = synthetic_league(60, num_teams=2, num_picks=2)
+    poller = DraftPoller(DraftTracker(league), interval=0.01)
+    poller.start()
+    league.yahoo_agent.source.num_picks = 6
+    poller.join(timeout=0.2)
+    poller.stop()
+    poller.join()
+    assert [pick["Pick"] for pick in poller.drain()] == [1, 2, 3, 4, 5, 6]
+    assert poller.error is None
+
+
+def test_poller_survives_malformed_results():
+    """Test the poller reports a malformed response and keeps polling."""
+    league = synthetic_league(60, num_teams=2, num_picks=2)
+    source = league.yahoo_agent.source
+    draft_results = source.draft_results
+    source.draft_results = lambda: {"fantasy_content": {}}
+    poller = DraftPoller(DraftTracker(league), interval=0.01)
+    poller.start()
+    poller.join(timeout=0.1)
+    assert isinstance(poller.error, KeyError)
+    source.draft_results = draft_results
+    poller.join(timeout=0.2)
+    poller.stop()
+    poller.join()
+    assert [pick["Pick"] for pick in poller.drain()] == [1, 2]
+    assert poller.error is None
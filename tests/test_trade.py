@@ -0,0 +1,68 @@
+"""Trade analyzer tests."""
+
+import pytest
+
+from faha.benchmark.fixtures import synthetic_league
+from faha.trade import TradeAnalyzer
+from faha.weights import all_manager_team_stats, calculate_stat_weights
+
+
+@pytest.fixture(name="league", scope="module")
+def fixture_league():
+    """Return a small synthetic league."""
+    return synthetic_league(120, num_teams=4)
+
+
+@pytest.fixture(name="analyzer")
+def fixture_analyzer(league):
+    """Return the trade analyzer of the league."""
+    weights = calculate_stat_weights(all_manager_team_stats(league))
+    return TradeAnalyzer.from_league(league, weights)
+
+
+def test_evaluate_leaves_teams_unchanged(analyzer):
+    """Test evaluating a trade is zero-sum and does not make it."""
+    first, second = analyzer.teams[:2]
+    gives, receives = analyzer.rosters[first][:1], analyzer.rosters[second][:2]
+    values = {team: analyzer.team_value(team) for team in analyzer.teams}
+    ranks = {team: analyzer.rank(team) for team in analyzer.teams}
+    result = analyzer.evaluate(first, gives, second, receives)
+    assert result.value_change[first] == pytest.approx(-result.value_change[second])
+    assert values == {team: analyzer.team_value(team) for team in analyzer.teams}
+    assert ranks == {team: analyzer.rank(team) for team in analyzer.teams}
+
+
+def test_apply_matches_rebuilt_analyzer(analyzer):
+    """Test making a trade updates the teams as if rebuilt from the rosters."""
+    first, second = analyzer.teams[:2]
+    gives, receives = analyzer.rosters[first][:2], analyzer.rosters[second][:1]
+    result = analyzer.evaluate(first, gives, second, receives)
+    strengths = analyzer.strengths()
+    analyzer.apply(first, gives, second, receives)
+    rebuilt = TradeAnalyzer(analyzer.pool, analyzer.weights, analyzer.rosters)
+    for team in analyzer.teams:
+        assert analyzer.team_value(team) == pytest.approx(rebuilt.team_value(team))
+        assert analyzer.rank(team) == rebuilt.rank(team)
+    for team in (first, second):
+        assert analyzer.strengths()[team] == pytest.approx(
+            strengths[team] + result.strength_change[team]
+        )
+        assert result.ranks[team][1] == rebuilt.rank(team)
+    assert set(gives) <= set(analyzer.rosters[second])
+
+
+def test_search_finds_mutual_trades(analyzer):
+    """Test searched trades are in order and do not weaken the other team."""
+    first, second = analyzer.teams[:2]
+    results = analyzer.search(first, second, count=5)
+    gains = [result.strength_change[first] for result in results]
+    assert results
+    assert gains == sorted(gains, reverse=True)
+    assert all(result.strength_change[second] >= 0 for result in results)
+
+
+def test_trade_requires_rostered_players(analyzer):
+    """Test players must be on the roster of the team trading them."""
+    first, second = analyzer.teams[:2]
+    with pytest.raises(ValueError):
+        analyzer.evaluate(first, analyzer.rosters[second][:1], second, [])
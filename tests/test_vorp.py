@@ -0,0 +1,35 @@
+"""Value over replacement tests."""
+
+import numpy as np
+
+from faha.vorp import (
+    eligibility_matrix,
+    positional_value_over_replacement,
+    replacement_levels,
+    starter_counts,
+)
+
+
+def test_starter_counts_share_flexible_slots():
+    """Test utility slots are shared between skater positions."""
+    roster_slots = {"C": 1, "LW": 1, "RW": 1, "D": 1, "Util": 4, "G": 1, "BN": 3}
+    np.testing.assert_array_equal(starter_counts(roster_slots, 2), [4, 4, 4, 4, 2])
+
+
+def test_replacement_levels():
+    """Test replacement is the best player below the starters at each position."""
+    values = np.array([5.0, 4.0, 3.0, 2.0, 1.0])
+    eligibility = eligibility_matrix([["C"], ["C", "LW"], ["C"], ["LW"], ["G"]])
+    levels = replacement_levels(values, eligibility, np.array([1, 1, 0, 0, 3]))
+    np.testing.assert_array_equal(levels, [4.0, 2.0, 0.0, 0.0, 1.0])
+
+
+def test_value_over_scarcest_position():
+    """Test players are compared with their lowest replacement level."""
+    values = positional_value_over_replacement(
+        np.array([5.0, 4.0, 3.0, 2.0]),
+        [["C"], ["C", "LW"], ["C"], ["LW"]],
+        {"C": 1, "LW": 1},
+        1,
+    )
+    np.testing.assert_array_equal(values, [1.0, 2.0, -1.0, 0.0])
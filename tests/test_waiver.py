@@ -0,0 +1,87 @@
+"""Waiver wire tests."""
+
+import numpy as np
+import pytest
+
+from faha.benchmark.fixtures import synthetic_league
+from faha.matchup import MatchupEngine
+from faha.pool import StatPool
+from faha.waiver import WaiverWire
+from faha.weights import all_manager_team_stats, calculate_stat_weights
+
+
+@pytest.fixture(name="league", scope="module")
+def fixture_league():
+    """Return a small synthetic league."""
+    return synthetic_league(90, num_teams=3)
+
+
+@pytest.fixture(name="waiver_wire")
+def fixture_waiver_wire(league):
+    """Return the waiver wire of the first team against the second."""
+    weights = calculate_stat_weights(all_manager_team_stats(league))
+    return WaiverWire.from_league(league, "1", weights, opponent_id="2")
+
+
+def test_suggestions_are_best_value_deltas(waiver_wire):
+    """Test suggestions are the largest changes in weighted totals."""
+    deltas = waiver_wire.value_deltas()
+    suggestions = waiver_wire.suggestions(3)
+    assert [delta for _, _, delta in suggestions] == sorted(deltas.ravel())[::-1][:3]
+
+
+def test_win_deltas_match_matchup_engine(league, waiver_wire):
+    """Test a swap changes the win probability as in the matchup engine."""
+    roster = list(waiver_wire.roster.player_ids)
+    opponent = list(league.team_player_stats("2").values())
+    players = list(league.team_player_stats("1").values()) + opponent
+    players += list(league.available_players().values())[:1]
+    added = players[-1]["Player ID"]
+    engine = MatchupEngine.from_rosters(
+        StatPool.from_players(players),
+        {
+            "mine": roster[1:] + [added],
+            "theirs": [player["Player ID"] for player in opponent],
+        },
+    )
+    expected = engine.matchups().win[0, 0, 1]
+    engine.set_roster("mine", roster)
+    expected -= engine.matchups().win[0, 0, 1]
+    row = waiver_wire.free_agents.row(added)
+    assert waiver_wire.win_deltas()[row, 0] == pytest.approx(expected)
+
+
+def test_update_player(waiver_wire):
+    """Test updating a free agent recalculates only their row."""
+    player_id = waiver_wire.free_agents.player_ids[0]
+    before = waiver_wire.value_deltas().copy()
+    waiver_wire.win_deltas()
+    player = {
+        "Player ID": player_id,
+        "Name": "",
+        "Positions": ["C"],
+        "NHL Team": "",
+        "Position Type": "P",
+        "Season Stats": {
+            "Games Played": 10,
+            "Goals": 100,
+            "Assists": 0,
+            "Plus/Minus": 0,
+            "Powerplay Points": 0,
+            "Shots on Goal": 0,
+            "Faceoffs Won": 0,
+            "Hits": 0,
+            "Blocks": 0,
+        },
+    }
+    waiver_wire.update_player(player)
+    after = waiver_wire.value_deltas()
+    assert (after[0] > before[0]).all()
+    np.testing.assert_array_equal(after[1:], before[1:])
+    rebuilt = WaiverWire(
+        waiver_wire.roster,
+        waiver_wire.free_agents,
+        waiver_wire.weights,
+        waiver_wire.opponent,
+    )
+    np.testing.assert_allclose(waiver_wire.win_deltas(), rebuilt.win_deltas())